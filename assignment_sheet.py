@@ -0,0 +1,34 @@
+"""Location columns and readers shared by the model and the sheet tools.
+
+This module imports nothing from the rest of the editor, so model, validation,
+history, merge and the command-line tools can all depend on it.
+"""
+import pandas as pd
+
+LOCATION_COLUMNS = ['Section', 'Aisle', 'Side', 'Level', 'Shelf']
+
+
+def read_sheet(path):
+    """Read a shelf assignment sheet, ensuring the Family and Category columns exist."""
+    df = pd.read_excel(path)
+    print(f"Read output file. Rows: {len(df)}")
+    print(f"Columns in output file: {list(df.columns)}")
+    if 'Family' not in df.columns:
+        df['Family'] = ""
+    if 'Category' not in df.columns:
+        df['Category'] = ""
+    return df
+
+
+def normalize_assignments(df):
+    """Return the location and assignment columns with typed keys and NaN-free text values."""
+    normalized = pd.DataFrame({
+        'Section': df['Section'].astype(str),
+        'Aisle': df['Aisle'].astype(int),
+        'Side': df['Side'].astype(int),
+        'Level': df['Level'].astype(int),
+        'Shelf': df['Shelf'].astype(int),
+    }, index=df.index)
+    for col in ['Family', 'Category']:
+        normalized[col] = df[col].fillna("").astype(str).replace("nan", "")
+    return normalized
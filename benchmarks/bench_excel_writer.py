@@ -0,0 +1,90 @@
+"""Benchmark the streaming assignment sheet writer against DataFrame.to_excel.
+
+Writes a synthetic assignment sheet of at least --rows rows with both paths,
+checks that they read back identically and reports the speedup:
+
+    python -m benchmarks.bench_excel_writer --rows 120000 --json excel.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from sheet_writer import write_assignment_sheet, xlsxwriter
+from benchmarks.bench_headless import time_call, summarize
+from benchmarks.synthetic_store import make_shelf_structure, make_catalog, make_assignment
+
+
+def make_sheet(rows, seed):
+    """Return a synthetic assignment sheet with exactly `rows` rows."""
+    shelves_per_section = 4 * 2 * 6 * 14  # make_shelf_structure's default dimensions
+    structure = make_shelf_structure(sections=math.ceil(rows / shelves_per_section) * 2, jitter=0.0, seed=seed)
+    sheet = make_assignment(structure, make_catalog(seed=seed), seed=seed)
+    return sheet.head(rows).reset_index(drop=True)
+
+
+def read_back(path):
+    """Read a written sheet the way the editor does, with blank text cells as empty strings."""
+    df = pd.read_excel(path)
+    for col in ['Family', 'Category']:
+        df[col] = df[col].fillna("").astype(str)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the assignment sheet writer")
+    parser.add_argument("--rows", type=int, default=120000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-verify", action="store_true", help="Do not read both files back to compare them")
+    parser.add_argument("--json", help="Write machine-readable results to this file")
+    args = parser.parse_args()
+
+    if xlsxwriter is None:
+        print("xlsxwriter is not installed, so write_assignment_sheet falls back to DataFrame.to_excel")
+        sys.exit(1)
+
+    sheet = make_sheet(args.rows, args.seed)
+    print(f"Synthetic sheet: {len(sheet)} rows x {len(sheet.columns)} columns")
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = os.path.join(directory, "to_excel.xlsx")
+        streamed_path = os.path.join(directory, "streamed.xlsx")
+        results = [
+            summarize("to_excel_openpyxl", time_call(lambda: sheet.to_excel(baseline_path, index=False, engine="openpyxl"), args.repeat),
+                      rows=len(sheet)),
+            summarize("write_assignment_sheet", time_call(lambda: write_assignment_sheet(sheet, streamed_path), args.repeat),
+                      rows=len(sheet)),
+        ]
+        sizes = {name: os.path.getsize(path) for name, path in (("to_excel", baseline_path), ("streamed", streamed_path))}
+        identical = None
+        if not args.skip_verify:
+            identical = read_back(baseline_path).equals(read_back(streamed_path))
+            print(f"Sheets read back identical: {identical}")
+
+    speedup = results[0]["median_s"] / results[1]["median_s"]
+    print(f"Speedup: {speedup:.1f}x  (file sizes: {sizes})")
+    if args.json:
+        report = {
+            "rows": len(sheet),
+            "environment": {"python": platform.python_version(), "pandas": pd.__version__,
+                            "numpy": np.__version__, "platform": platform.platform()},
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+            "speedup": speedup,
+            "file_sizes": sizes,
+            "identical": identical,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+    if identical is False:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
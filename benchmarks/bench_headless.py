@@ -0,0 +1,165 @@
+"""Headless benchmark suite for ShelfModel and render geometry.
+
+Generates a synthetic store, times the core model operations and writes the
+results as JSON so runs can be compared between releases:
+
+    python -m benchmarks.bench_headless --sections 50 --json results.json
+    python -m benchmarks.bench_headless --sections 50 --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from model import ShelfModel
+from layout import base_cell_size, bar_runs
+from display_list import build_display_list
+from benchmarks.synthetic_store import generate_store
+
+
+def time_call(func, repeat):
+    """Run func `repeat` times and return the list of wall-clock durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(name, durations, **extra):
+    """Return a result record with min/median/max durations for one benchmark."""
+    record = {
+        "benchmark": name,
+        "runs": len(durations),
+        "min_s": min(durations),
+        "median_s": statistics.median(durations),
+        "max_s": max(durations),
+    }
+    record.update(extra)
+    print(f"{name:<28} median={record['median_s'] * 1000:10.2f} ms  min={record['min_s'] * 1000:10.2f} ms  {extra}")
+    return record
+
+
+def sample_sides(model, count, rng):
+    """Return `count` random (section, aisle, side) triples present in the model."""
+    sides = model.df[['Section', 'Aisle', 'Side']].drop_duplicates().to_numpy()
+    picks = rng.integers(0, len(sides), size=count)
+    return [(str(sides[i][0]), int(sides[i][1]), int(sides[i][2])) for i in picks]
+
+
+def render_geometry(filtered_df, canvas_width=1600, canvas_height=900, scale_factor=1.6):
+    """Build the display list the Shelf View draws for one side, bypassing the layout cache."""
+    max_level = int(filtered_df['Level'].max())
+    max_shelf = int(filtered_df['Shelf'].max())
+    cell_width_base, cell_height_base = base_cell_size(max_level, max_shelf)
+    return build_display_list(tuple(bar_runs(filtered_df)), max_level, max_shelf, canvas_width, canvas_height,
+                              scale_factor, cell_width_base / cell_height_base)
+
+
+def run_suite(paths, repeat, seed):
+    """Run every benchmark against the store at `paths`; returns the list of result records."""
+    rng = np.random.default_rng(seed)
+    results = []
+
+    model = None
+
+    def load():
+        nonlocal model
+        model = ShelfModel(**paths)
+
+    durations = time_call(load, repeat)
+    results.append(summarize("model_load", durations, rows=len(model.df)))
+
+    sides = sample_sides(model, 200, rng)
+    results.append(summarize(
+        "get_filtered_data", time_call(lambda: [model.get_filtered_data(*side) for side in sides], repeat),
+        calls=len(sides)
+    ))
+
+    families = [family for family in model.families if model.categories.get(family)]
+
+    def apply_selections():
+        for section, aisle, side in sides[:50]:
+            filtered = model.get_filtered_data(section, aisle, side)
+            cells = set(zip(filtered['Level'].astype(int), filtered['Shelf'].astype(int)))
+            cells = set(list(cells)[:8])
+            family = families[rng.integers(0, len(families))]
+            model.apply_selection(cells, section, aisle, side, family, model.categories[family][0])
+
+    results.append(summarize("apply_selection", time_call(apply_selections, repeat), calls=50, cells_per_call=8))
+
+    filtered_sides = [model.get_filtered_data(*side) for side in sides[:50]]
+    results.append(summarize(
+        "render_geometry", time_call(lambda: [render_geometry(df) for df in filtered_sides if df is not None], repeat),
+        sides=len(filtered_sides)
+    ))
+
+    results.append(summarize("save_data", time_call(model.save_data, repeat), rows=len(model.df)))
+
+    generate_paths = dict(paths, output_file=os.path.join(os.path.dirname(paths["output_file"]), "generated.xlsx"))
+    generator = ShelfModel(**generate_paths)
+    results.append(summarize("generate_shelf_assignment", time_call(generator.generate_shelf_assignment, repeat),
+                             rows=len(generator.df)))
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """Print median ratios against a baseline result file; returns the names that regressed."""
+    with open(baseline_path) as f:
+        baseline = {record["benchmark"]: record for record in json.load(f)["results"]}
+    regressions = []
+    for record in results:
+        old = baseline.get(record["benchmark"])
+        if old is None:
+            continue
+        ratio = record["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        flag = "REGRESSION" if ratio > threshold else "ok"
+        print(f"{record['benchmark']:<28} {ratio:6.2f}x baseline  {flag}")
+        if ratio > threshold:
+            regressions.append(record["benchmark"])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless ShelfModel benchmark suite")
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--aisles", type=int, default=4)
+    parser.add_argument("--levels", type=int, default=6)
+    parser.add_argument("--shelves", type=int, default=14)
+    parser.add_argument("--families", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write machine-readable results to this file")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Median ratio above which a benchmark regressed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate_store(directory, sections=args.sections, aisles=args.aisles, levels=args.levels,
+                               shelves=args.shelves, families=args.families, seed=args.seed)
+        results = run_suite(paths, args.repeat, args.seed)
+
+    report = {
+        "scale": {"sections": args.sections, "aisles": args.aisles, "levels": args.levels,
+                  "shelves": args.shelves, "families": args.families},
+        "environment": {"python": platform.python_version(), "pandas": pd.__version__,
+                        "numpy": np.__version__, "platform": platform.platform()},
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
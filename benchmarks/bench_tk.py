@@ -0,0 +1,202 @@
+"""Tk rendering latency benchmark for the Shelf View.
+
+Starts the real ShelfView/ShelfController on a synthetic store, scripts drag
+selections, aisle switches, resizes and tab changes, and reports per-interaction
+latency percentiles and canvas item counts. On a headless Linux box a virtual
+X server is started automatically when DISPLAY is not set (requires Xvfb):
+
+    python -m benchmarks.bench_tk --sections 10 --shelves 40 --json tk_results.json
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+
+
+def start_xvfb(display, width, height):
+    """Start an Xvfb server on `display` and point DISPLAY at it; returns the process."""
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("DISPLAY is not set and Xvfb is not installed")
+    process = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    os.environ["DISPLAY"] = display
+    # Wait for the server socket to appear before Tk connects
+    socket_path = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+    deadline = time.time() + 10
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.time() > deadline:
+            raise RuntimeError(f"Xvfb failed to start on {display}")
+        time.sleep(0.05)
+    print(f"Started Xvfb on {display} ({width}x{height})")
+    return process
+
+
+def percentiles(durations):
+    """Return p50/p90/p99/max latency in milliseconds."""
+    values = np.array(durations) * 1000
+    return {
+        "count": len(values),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p90_ms": float(np.percentile(values, 90)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+    }
+
+
+class TkBenchmark:
+    """Drive the real Shelf View and record the latency of each scripted interaction."""
+
+    def __init__(self, paths):
+        import tkinter as tk
+        from model import ShelfModel
+        from view.view import ShelfView
+        from controller import ShelfController
+
+        self.root = tk.Tk()
+        self.model = ShelfModel(**paths)
+        self.controller = ShelfController(self.root, self.model, None)
+        self.view = ShelfView(self.root, self.controller)
+        # Message boxes would block the script; log them instead
+        self.view.show_message = lambda title, message: print(f"[{title}] {message}")
+        self.controller.view = self.view
+        self.controller.set_ui_ready()
+        self.view.initialize_dropdowns()
+        self.controller.update_shelf_view()
+        self.shelf_tab = self.view.shelf_tab
+        self.samples = {}  # Maps interaction name to list of durations in seconds
+        self.item_counts = {}  # Maps interaction name to list of canvas item counts
+        self.flush()
+        self.view.notebook.select(1)
+        self.flush()
+
+    def flush(self):
+        """Process all pending Tk events, including idle redraws."""
+        self.root.update()
+
+    def measure(self, name, action):
+        """Run an interaction, flush Tk, and record its latency and resulting canvas item count."""
+        start = time.perf_counter()
+        action()
+        self.flush()
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        self.item_counts.setdefault(name, []).append(len(self.shelf_tab.canvas.find_all()))
+
+    def open_side(self, section, aisle, side):
+        self.shelf_tab.set_location(section, aisle, side)
+        self.controller.update_shelf_view()
+
+    def switch_aisle(self, aisle):
+        self.shelf_tab.aisle_var.set(aisle)
+        self.shelf_tab.on_aisle_changed(None)
+
+    def drag(self, steps):
+        """Drag a selection rectangle across the lower-left quarter of the grid."""
+        coords = list(self.shelf_tab.get_selection_coords().values())
+        if not coords:
+            return
+        x_start, y_start = coords[0][0] + 2, coords[0][1] + 2
+        x_end = x_start + (max(c[2] for c in coords) - x_start) / 2
+        y_end = y_start + (max(c[3] for c in coords) - y_start) / 2
+        canvas = self.shelf_tab.canvas
+        self.measure("drag_press", lambda: canvas.event_generate("<Button-1>", x=int(x_start), y=int(y_start)))
+        for step in range(1, steps + 1):
+            x = x_start + (x_end - x_start) * step / steps
+            y = y_start + (y_end - y_start) * step / steps
+            self.measure("drag_motion", lambda: canvas.event_generate("<B1-Motion>", x=int(x), y=int(y)))
+        self.measure("drag_release_apply", lambda: canvas.event_generate("<ButtonRelease-1>", x=int(x_end), y=int(y_end)))
+
+    def resize(self, width, height):
+        """Resize the window and run the debounced redraw immediately."""
+        self.root.geometry(f"{width}x{height}")
+        self.flush()
+        if self.controller.resize_timer is not None:
+            self.root.after_cancel(self.controller.resize_timer)
+            self.controller._perform_redraw()
+
+    def switch_tab(self, index):
+        self.view.notebook.select(index)
+
+    def run(self, rounds, drag_steps):
+        sections = self.model.get_sections()
+        structure = self.model.get_shelf_structure()
+        rng = np.random.default_rng(0)
+        sizes = [(1280, 800), (1600, 900), (1920, 1080)]
+        for round_index in range(rounds):
+            section = sections[rng.integers(0, len(sections))]
+            config = structure[section]
+            self.measure("open_side", lambda: self.open_side(section, 1, 1))
+            for aisle in range(1, config["aisles"] + 1):
+                self.measure("aisle_switch", lambda: self.switch_aisle(aisle))
+            self.drag(drag_steps)
+            width, height = sizes[round_index % len(sizes)]
+            self.measure("resize", lambda: self.resize(width, height))
+            self.measure("tab_change_table", lambda: self.switch_tab(0))
+            self.measure("tab_change_shelf", lambda: self.switch_tab(1))
+
+    def results(self):
+        report = {}
+        for name, durations in self.samples.items():
+            record = percentiles(durations)
+            counts = self.item_counts[name]
+            record["canvas_items_mean"] = float(np.mean(counts))
+            record["canvas_items_max"] = int(max(counts))
+            report[name] = record
+            print(f"{name:<22} n={record['count']:4d} p50={record['p50_ms']:8.2f} ms p90={record['p90_ms']:8.2f} ms "
+                  f"p99={record['p99_ms']:8.2f} ms items={record['canvas_items_max']}")
+        return report
+
+    def close(self):
+        self.root.destroy()
+
+
+def main():
+    from benchmarks.synthetic_store import generate_store
+
+    parser = argparse.ArgumentParser(description="Benchmark Shelf View interaction latency under Tk")
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--aisles", type=int, default=4)
+    parser.add_argument("--levels", type=int, default=6)
+    parser.add_argument("--shelves", type=int, default=14)
+    parser.add_argument("--families", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--drag-steps", type=int, default=20)
+    parser.add_argument("--display", default=":99", help="Display number for Xvfb when DISPLAY is unset")
+    parser.add_argument("--json", help="Write machine-readable results to this file")
+    args = parser.parse_args()
+
+    xvfb = None
+    if not os.environ.get("DISPLAY"):
+        xvfb = start_xvfb(args.display, 1920, 1080)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = generate_store(directory, sections=args.sections, aisles=args.aisles, levels=args.levels,
+                                   shelves=args.shelves, families=args.families)
+            bench = TkBenchmark(paths)
+            try:
+                bench.run(args.rounds, args.drag_steps)
+                report = {
+                    "scale": {"sections": args.sections, "aisles": args.aisles, "levels": args.levels,
+                              "shelves": args.shelves, "families": args.families},
+                    "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "interactions": bench.results(),
+                }
+            finally:
+                bench.close()
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {args.json}")
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+
+if __name__ == "__main__":
+    main()
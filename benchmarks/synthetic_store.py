@@ -0,0 +1,147 @@
+"""Synthetic store generator for benchmarks.
+
+Builds shelf structures, family catalogs and assignment sheets at configurable
+scale and writes them in the same Excel layouts ShelfModel reads:
+
+    python -m benchmarks.synthetic_store --sections 50 --out ./synthetic_store
+"""
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+SHELF_INFO_NAME = "shelf_information.xlsx"
+FAMILY_NAME = "family information.xlsx"
+OUTPUT_NAME = "Shelf_Assignment_Reversed_Output.xlsx"
+
+
+def section_name(index):
+    """Return a spreadsheet-style section name: A, B, ..., Z, AA, AB, ..."""
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(ord("A") + remainder) + name
+    return name
+
+
+def make_shelf_structure(sections=10, aisles=4, sides=2, levels=6, shelves=14, jitter=0.25, seed=0):
+    """Return a shelf structure DataFrame with per-section dimensions varied by up to `jitter`."""
+    rng = np.random.default_rng(seed)
+
+    def vary(value):
+        low = max(1, int(round(value * (1 - jitter))))
+        high = max(low, int(round(value * (1 + jitter))))
+        return rng.integers(low, high + 1, size=sections)
+
+    return pd.DataFrame({
+        "section": [section_name(i) for i in range(sections)],
+        "aisles": vary(aisles),
+        "sides": np.full(sections, sides),
+        "levels max": vary(levels),
+        "shelves max": vary(shelves),
+    })
+
+
+def make_catalog(families=30, categories_per_family=12, seed=0):
+    """Return a dict mapping family names to lists of category names."""
+    rng = np.random.default_rng(seed)
+    catalog = {}
+    for f in range(families):
+        family = f"Family {f + 1:03d}"
+        count = int(rng.integers(max(1, categories_per_family // 2), categories_per_family * 3 // 2 + 1))
+        catalog[family] = [f"{family} Category {c + 1:03d}" for c in range(count)]
+    return catalog
+
+
+def make_assignment(structure, catalog, fill_rate=0.8, run_length=4, seed=0):
+    """Return an assignment sheet for the structure with roughly `fill_rate` of shelves assigned.
+
+    Categories are laid down in runs of about `run_length` adjacent shelves so the
+    sheet resembles a real planogram rather than per-cell noise.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    columns = [structure[col] for col in ["section", "aisles", "sides", "levels max", "shelves max"]]
+    for section, aisles, sides, levels, shelves in zip(*columns):
+        grid = np.indices((int(aisles), int(sides), int(levels), int(shelves))).reshape(4, -1) + 1
+        frames.append(pd.DataFrame({
+            "Section": section,
+            "Aisle": grid[0],
+            "Side": grid[1],
+            "Level": grid[2],
+            "Shelf": grid[3],
+        }))
+    df = pd.concat(frames, ignore_index=True)
+
+    pairs = [(family, category) for family, categories in catalog.items() for category in categories]
+    run_ids = np.arange(len(df)) // max(run_length, 1)
+    choice = rng.integers(0, len(pairs), size=run_ids.max() + 1)[run_ids]
+    filled = rng.random(run_ids.max() + 1)[run_ids] < fill_rate
+    families = np.array([family for family, _ in pairs], dtype=object)
+    categories = np.array([category for _, category in pairs], dtype=object)
+    df["Family"] = np.where(filled, families[choice], "")
+    df["Category"] = np.where(filled, categories[choice], "")
+    return df
+
+
+def write_family_file(catalog, path):
+    """Write a catalog as one sheet per family with the family in A2 and categories from B2."""
+    with pd.ExcelWriter(path) as writer:
+        for index, (family, categories) in enumerate(catalog.items()):
+            columns = ["Family"] + [f"Category {i + 1}" for i in range(len(categories))]
+            sheet = pd.DataFrame([[family] + categories], columns=columns)
+            sheet.to_excel(writer, sheet_name=f"Family{index + 1}", index=False)
+
+
+def write_store(directory, structure, catalog, assignment=None):
+    """Write the shelf structure, family catalog and optional assignment sheet into a directory.
+
+    Returns a dict of the file paths, keyed like ShelfModel's constructor arguments.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {
+        "shelf_info_file": os.path.join(directory, SHELF_INFO_NAME),
+        "family_file": os.path.join(directory, FAMILY_NAME),
+        "output_file": os.path.join(directory, OUTPUT_NAME),
+    }
+    structure.to_excel(paths["shelf_info_file"], index=False)
+    write_family_file(catalog, paths["family_file"])
+    if assignment is not None:
+        assignment.to_excel(paths["output_file"], index=False)
+    return paths
+
+
+def generate_store(directory, sections=10, aisles=4, sides=2, levels=6, shelves=14,
+                   families=30, categories_per_family=12, fill_rate=0.8, seed=0, with_assignment=True):
+    """Generate and write a complete synthetic store; returns the written file paths."""
+    structure = make_shelf_structure(sections, aisles, sides, levels, shelves, seed=seed)
+    catalog = make_catalog(families, categories_per_family, seed=seed)
+    assignment = make_assignment(structure, catalog, fill_rate, seed=seed) if with_assignment else None
+    return write_store(directory, structure, catalog, assignment)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic store for benchmarks")
+    parser.add_argument("--out", required=True, help="Directory to write the store files into")
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--aisles", type=int, default=4)
+    parser.add_argument("--sides", type=int, default=2)
+    parser.add_argument("--levels", type=int, default=6)
+    parser.add_argument("--shelves", type=int, default=14)
+    parser.add_argument("--families", type=int, default=30)
+    parser.add_argument("--categories", type=int, default=12, help="Average categories per family")
+    parser.add_argument("--fill-rate", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-assignment", action="store_true", help="Skip writing the assignment sheet")
+    args = parser.parse_args()
+    paths = generate_store(
+        args.out, args.sections, args.aisles, args.sides, args.levels, args.shelves,
+        args.families, args.categories, args.fill_rate, args.seed, not args.no_assignment
+    )
+    for name, path in paths.items():
+        print(f"{name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Headless bulk assignment from a CSV of location ranges.
+
+    python bulk_assign.py rules.csv [--dry-run] [--strict] [--output-file PATH]
+
+Each CSV row is a rule with the columns Section, Aisle, Side, Level, Shelf,
+Family and Category. A location column holds a single value, an inclusive
+range such as "3-7", or "*"/blank for every value in the shelf structure.
+Rules are checked against the family catalog, expanded to shelf locations
+and merged into the assignment sheet in one pass; when rules overlap, the
+later row wins.
+"""
+import argparse
+import sys
+import numpy as np
+import pandas as pd
+from constants import FAMILY_FILE, SHELF_INFO_FILE, OUTPUT_FILE
+from assignment_sheet import LOCATION_COLUMNS, normalize_assignments
+from model import ShelfModel
+
+RULE_COLUMNS = LOCATION_COLUMNS + ['Family', 'Category']
+RANGE_LIMITS = {'Aisle': 'aisles', 'Side': 'sides', 'Level': 'max_levels', 'Shelf': 'max_shelves'}
+MAX_REPORTED_ERRORS = 20
+
+
+def read_rules(path):
+    """Read a rules CSV as text columns, numbering each rule by its line in the file."""
+    rules = pd.read_csv(path, dtype=str, keep_default_na=False)
+    rules.columns = rules.columns.str.strip().str.title()
+    missing = [col for col in RULE_COLUMNS if col not in rules.columns]
+    if missing:
+        raise ValueError(f"Rules file missing required columns: {missing}")
+    rules = rules[RULE_COLUMNS].apply(lambda column: column.str.strip())
+    rules['line'] = np.arange(len(rules)) + 2  # Line 1 is the header
+    return rules
+
+
+def structure_frame(shelf_structure):
+    """Return the shelf structure dict as a DataFrame keyed by Section."""
+    return pd.DataFrame([{'Section': section, **config} for section, config in shelf_structure.items()])
+
+
+def parse_ranges(values):
+    """Parse a column of "n", "a-b" or "*"/blank into (low, high, wildcard, invalid) arrays."""
+    wildcard = values.isin(["", "*"]).to_numpy()
+    parts = values.str.split("-", n=1, expand=True).reindex(columns=[0, 1])
+    low = pd.to_numeric(parts[0], errors='coerce')
+    high = pd.to_numeric(parts[1], errors='coerce').fillna(low)
+    invalid = ~wildcard & (low.isna() | high.isna() | (low > high) | (low < 1)).to_numpy()
+    return low.to_numpy(), high.to_numpy(), wildcard, invalid
+
+
+def validate_rules(rules, families, categories):
+    """Split rules into (valid, errors) where errors has 'line' and 'reason' columns."""
+    reasons = pd.Series("", index=rules.index)
+    pairs = pd.DataFrame(
+        [(family, category) for family in families for category in categories.get(family, [])],
+        columns=['Family', 'Category'],
+    ).drop_duplicates()
+    known_pair = rules.merge(pairs, on=['Family', 'Category'], how='left', indicator=True)['_merge'].eq('both').to_numpy()
+    known_family = rules['Family'].isin(families).to_numpy()
+
+    reasons[(rules['Family'] == "") | (rules['Category'] == "")] = "Family and Category are required"
+    reasons[(reasons == "") & ~known_family] = "unknown family"
+    reasons[(reasons == "") & ~known_pair] = "category not in family"
+    for col in RANGE_LIMITS:
+        invalid = parse_ranges(rules[col])[3]
+        reasons[(reasons == "") & invalid] = f"invalid {col} range"
+    errors = pd.DataFrame({'line': rules['line'], 'reason': reasons})
+    errors = errors[errors['reason'] != ""]
+    return rules[reasons == ""], errors
+
+
+def repeat_ranges(frame, low, high):
+    """Repeat each frame row once per value in its [low, high] range; returns (frame, values)."""
+    counts = np.maximum(high - low + 1, 0).astype(np.int64)
+    rows = np.repeat(np.arange(len(frame)), counts)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return frame.iloc[rows].reset_index(drop=True), low[rows] + offsets
+
+
+def expand_rules(rules, shelf_structure):
+    """Expand validated rules into one row per (rule, shelf location) within the shelf structure.
+
+    Returns (expanded, errors) where errors lists rules naming unknown sections.
+    """
+    structure = structure_frame(shelf_structure)
+    wildcard_section = rules['Section'].isin(["", "*"])
+    expanded = pd.concat([
+        rules[wildcard_section].drop(columns='Section').merge(structure, how='cross'),
+        rules[~wildcard_section].merge(structure, on='Section', how='inner'),
+    ], ignore_index=True)
+    unknown = rules[~wildcard_section & ~rules['Section'].isin(structure['Section'])]
+    errors = pd.DataFrame({'line': unknown['line'], 'reason': "unknown section"})
+
+    for col, limit in RANGE_LIMITS.items():
+        low, high, wildcard, _ = parse_ranges(expanded[col])
+        maximum = expanded[limit].to_numpy()
+        low = np.where(wildcard, 1, low)
+        # Ranges past the structure are clipped rather than expanded into missing shelves
+        high = np.minimum(np.where(wildcard, maximum, high), maximum)
+        expanded, values = repeat_ranges(expanded, low.astype(np.int64), high.astype(np.int64))
+        expanded[col] = values
+    return expanded[['line'] + RULE_COLUMNS], errors
+
+
+def plan_assignments(model, rules):
+    """Resolve rules against the model; returns (changes, errors, summary counts)."""
+    valid, errors = validate_rules(rules, model.families, model.categories)
+    expanded, section_errors = expand_rules(valid, model.shelf_structure)
+    errors = pd.concat([errors, section_errors], ignore_index=True).sort_values('line')
+    covered = valid['line'].isin(expanded['line']) | valid['line'].isin(section_errors['line'])
+
+    # Later rules win where ranges overlap
+    expanded = expanded.sort_values('line', kind='stable').drop_duplicates(LOCATION_COLUMNS, keep='last')
+    sheet = normalize_assignments(model.df).rename_axis('row').reset_index()
+    matched = expanded.merge(sheet, on=LOCATION_COLUMNS, how='inner', suffixes=('', '_old'))
+    changed = matched[(matched['Family'] != matched['Family_old']) | (matched['Category'] != matched['Category_old'])]
+
+    summary = {
+        "rules": len(rules),
+        "invalid": errors['line'].nunique(),
+        "unmatched": int((~covered).sum()),
+        "locations": len(matched),
+        "changed": len(changed),
+    }
+    return changed[['row', 'Family', 'Category']], errors, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply bulk shelf assignments from a CSV of location ranges")
+    parser.add_argument("rules", help="CSV with Section, Aisle, Side, Level, Shelf, Family, Category columns")
+    parser.add_argument("--family-file", default=FAMILY_FILE)
+    parser.add_argument("--shelf-info-file", default=SHELF_INFO_FILE)
+    parser.add_argument("--output-file", default=OUTPUT_FILE, help="Assignment sheet to update")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("--strict", action="store_true", help="Write nothing if any rule is invalid")
+    args = parser.parse_args(argv)
+
+    try:
+        model = ShelfModel(args.family_file, args.shelf_info_file, args.output_file)
+        if model.df is None:
+            success, message = model.generate_shelf_assignment()
+            if not success:
+                print(message)
+                return 1
+        rules = read_rules(args.rules)
+    except Exception as e:
+        print(f"Failed to load: {str(e)}")
+        return 1
+
+    changes, errors, summary = plan_assignments(model, rules)
+    for line, reason in list(zip(errors['line'], errors['reason']))[:MAX_REPORTED_ERRORS]:
+        print(f"Line {line}: {reason}")
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"... and {len(errors) - MAX_REPORTED_ERRORS} more invalid rules")
+    print(f"Rules: {summary['rules']}, invalid: {summary['invalid']}, matching no shelves: {summary['unmatched']}, "
+          f"shelves matched: {summary['locations']}, shelves changed: {summary['changed']}")
+
+    if args.strict and not errors.empty:
+        print("Not writing: invalid rules found (--strict)")
+        return 1
+    if args.dry_run:
+        print("Dry run: nothing written")
+        return 0
+    if changes.empty:
+        print("Nothing to write")
+        return 0
+    model.apply_assignments(changes)
+    success, message = model.save_data()
+    print(message)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
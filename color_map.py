@@ -0,0 +1,100 @@
+"""Deterministic family/category colors, persisted next to the assignment sheet.
+
+Every family/category pair gets a palette index that is unique within its
+family. Indices are assigned in sorted order, lowest free index first, so the
+same catalog always gets the same colors, and once assigned an index never
+changes, so screen, exports and printed pages match across sessions. Past
+the fixed palette, colors are generated with golden-ratio hue steps.
+"""
+import colorsys
+import json
+import os
+
+BASE_PALETTE = [
+    {'front': "#87CEEB", 'top': "#B0E0E6", 'right': "#5F9EA0"},
+    {'front': "#90EE90", 'top': "#ADFF2F", 'right': "#7FFF00"},
+    {'front': "#F08080", 'top': "#FF4040", 'right': "#CD5C5C"},
+    {'front': "#FFFF99", 'top': "#FFFFCC", 'right': "#EEE8AA"},
+    {'front': "#FFB6C1", 'top': "#FFC1CC", 'right': "#FF9999"},
+    {'front': "#E0FFFF", 'top': "#EFFFFF", 'right': "#B0E0E6"},
+    {'front': "#FFA07A", 'top': "#FFBB99", 'right': "#FF8C69"},
+    {'front': "#D3D3D3", 'top': "#E6E6E6", 'right': "#C0C0C0"},
+    {'front': "#98FB98", 'top': "#BFFFBA", 'right': "#90EE90"},
+    {'front': "#FFDAB9", 'top': "#FFE4C4", 'right': "#FFCC99"},
+    {'front': "#FFECB3", 'top': "#FFF9C4", 'right': "#FFD54F"},
+    {'front': "#B0C4DE", 'top': "#C6D9F1", 'right': "#9AC0CD"},
+    {'front': "#F0E68C", 'top': "#FFFACD", 'right': "#EEE8AA"},
+    {'front': "#FFE4E1", 'top': "#FFE4E4", 'right': "#FFB6C1"},
+    {'front': "#E6E6FA", 'top': "#F0F0FF", 'right': "#D8BFD8"},
+    {'front': "#FFDEAD", 'top': "#FFEFD5", 'right': "#FFCE96"},
+    {'front': "#DDA0DD", 'top': "#E6B0E6", 'right': "#DA70D6"},
+    {'front': "#F5F5DC", 'top': "#FFFFE4", 'right': "#F0EAD6"},
+    {'front': "#AFEEEE", 'top': "#C1F0F0", 'right': "#96CDCD"},
+    {'front': "#FFFACD", 'top': "#FFFDE7", 'right': "#FFFACD"},
+]
+# (saturation, value) of each face for generated colors; the top is lighter and the right side darker
+GENERATED_FACES = {'front': (0.35, 0.95), 'top': (0.2, 1.0), 'right': (0.45, 0.8)}
+
+
+def color_map_path_for(output_file):
+    """Return the color map file kept next to an output file."""
+    return output_file + ".colors.json"
+
+
+def palette_colors(index):
+    """Return the front/top/right colors of a palette index."""
+    if index < len(BASE_PALETTE):
+        return BASE_PALETTE[index]
+    hue = ((index - len(BASE_PALETTE)) * 0.618033988749895 + 0.11) % 1.0
+    colors = {}
+    for face, (saturation, value) in GENERATED_FACES.items():
+        red, green, blue = colorsys.hsv_to_rgb(hue, saturation, value)
+        colors[face] = f"#{int(red * 255):02X}{int(green * 255):02X}{int(blue * 255):02X}"
+    return colors
+
+
+class ColorMap:
+    """Palette indices of family/category pairs, with `colors` keyed by "family|category" for the renderers."""
+
+    def __init__(self, indices=None):
+        self.indices = dict(indices or {})  # Maps (family, category) to its palette index
+        self.colors = {f"{family}|{category}": palette_colors(index) for (family, category), index in self.indices.items()}
+
+    def update(self, pairs):
+        """Give each (family, category) pair without a color the lowest index free in its family; returns True if any was added."""
+        used = {}
+        for (family, category), index in self.indices.items():
+            used.setdefault(family, set()).add(index)
+        added = False
+        for family, category in sorted(set(pairs)):
+            if (family, category) in self.indices:
+                continue
+            family_used = used.setdefault(family, set())
+            index = 0
+            while index in family_used:
+                index += 1
+            family_used.add(index)
+            self.indices[(family, category)] = index
+            self.colors[f"{family}|{category}"] = palette_colors(index)
+            added = True
+        return added
+
+    @classmethod
+    def load(cls, path):
+        """Read a color map file; a missing or unreadable file gives an empty map."""
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)["colors"]
+            return cls({(family, category): int(index) for family, category, index in entries})
+        except Exception as e:
+            print(f"Ignoring unreadable color map {path}: {str(e)}")
+            return cls()
+
+    def save(self, path):
+        entries = [[family, category, index] for (family, category), index in sorted(self.indices.items())]
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"colors": entries}, f, indent=1)
+        os.replace(temp_path, path)
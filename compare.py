@@ -0,0 +1,77 @@
+"""Compare two assignment sheets: added, removed and changed cells by location."""
+import os
+import numpy as np
+from assignment_sheet import LOCATION_COLUMNS, normalize_assignments
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+CHANGE_COLUMNS = LOCATION_COLUMNS + ['change', 'Family_old', 'Category_old', 'Family_new', 'Category_new']
+
+
+def compare_sheets(base_df, current_df):
+    """Diff two sheets with one outer join on the location key.
+
+    A cell is "added" when it is assigned only in the current sheet, "removed"
+    when it is assigned only in the base sheet and "changed" when both assign
+    different values. Shelves missing from one sheet count as unassigned there.
+    """
+    old = normalize_assignments(base_df)
+    new = normalize_assignments(current_df)
+    merged = old.merge(new, on=LOCATION_COLUMNS, how='outer', suffixes=('_old', '_new'))
+    for col in ['Family_old', 'Category_old', 'Family_new', 'Category_new']:
+        merged[col] = merged[col].fillna("")
+
+    old_assigned = ((merged['Family_old'] != "") | (merged['Category_old'] != "")).to_numpy()
+    new_assigned = ((merged['Family_new'] != "") | (merged['Category_new'] != "")).to_numpy()
+    differs = ((merged['Family_old'] != merged['Family_new']) | (merged['Category_old'] != merged['Category_new'])).to_numpy()
+    change = np.select(
+        [~old_assigned & new_assigned, old_assigned & ~new_assigned, old_assigned & new_assigned & differs],
+        [ADDED, REMOVED, CHANGED],
+        default="",
+    )
+    merged['change'] = change
+    changes = merged[change != ""][CHANGE_COLUMNS]
+    return changes.sort_values(LOCATION_COLUMNS).reset_index(drop=True)
+
+
+def export_changes(changes, path):
+    """Write a change list as CSV or Excel depending on the file extension."""
+    if os.path.splitext(path)[1].lower() == ".csv":
+        changes.to_csv(path, index=False)
+    else:
+        changes.to_excel(path, index=False)
+    print(f"Exported {len(changes)} changes to {path}")
+
+
+class Comparison:
+    """A base sheet compared against the live model; re-diffed lazily after model edits."""
+
+    def __init__(self, base_df, path):
+        self.base_df = base_df
+        self.path = path
+        self.changes = None
+        self.by_side = {}  # Maps (section, aisle, side) to {(level, shelf): (change, old text, new text)}
+        self.stale = True
+
+    def on_model_changed(self, event):
+        self.stale = True
+
+    def update(self, current_df):
+        """Return the change list, re-diffing first if the model changed since the last diff."""
+        if self.stale:
+            self.changes = compare_sheets(self.base_df, current_df)
+            self.by_side = {}
+            columns = [self.changes[col] for col in CHANGE_COLUMNS]
+            for section, aisle, side, level, shelf, change, family_old, category_old, family_new, category_new in zip(*columns):
+                self.by_side.setdefault((section, int(aisle), int(side)), {})[(int(level), int(shelf))] = (
+                    change, f"{family_old} / {category_old}".strip(" /"), f"{family_new} / {category_new}".strip(" /")
+                )
+            self.stale = False
+            print(f"Compared with {self.path}: {len(self.changes)} changed shelves")
+        return self.changes
+
+    def side_changes(self, current_df, section, aisle, side):
+        """Return {(level, shelf): (change, old text, new text)} for one side."""
+        self.update(current_df)
+        return self.by_side.get((str(section), int(aisle), int(side)), {})
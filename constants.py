@@ -4,6 +4,57 @@ SHELF_INFO_FILE = "./shelf_information.xlsx"  # New file for shelf structure
 OUTPUT_FILE = "./Shelf_Assignment_Reversed_Output.xlsx"
 LOGO_FILE = "./enson_logo.jpg"
 
+# Typeahead settings for Family/Category dropdowns
+TYPEAHEAD_LIMIT = 50  # Maximum number of values shown while typing
+TYPEAHEAD_DEBOUNCE_MS = 150  # Delay after the last keystroke before filtering
+
+# Shelf View zoom and pan
+SHELF_ZOOM_MIN = 1.0  # 1.0 fits the whole side in the canvas
+SHELF_ZOOM_MAX = 40.0
+SHELF_ZOOM_STEP = 1.25  # Zoom factor per mouse wheel notch
+WHEEL_PAN_PIXELS = 80  # Pan distance per mouse wheel notch
+PAN_REDRAW_MS = 60  # Delay after panning before cells newly in view are drawn
+SHELF_CONTENT_TAG = "content"  # Canvas tag of the shelf grid items that move with a pan
+
+# Neighbouring-side prefetch for Shelf View navigation
+PREFETCH_DELAY_MS = 150  # Idle time after drawing a side before its neighbours are prepared
+PREFETCH_CACHE_SIZE = 16  # Prepared sides kept in memory
+
+# Shared Shelf View layout for screen, export and print
+DISPLAY_LIST_CACHE_SIZE = 64  # Unpanned display lists memoized by side, size and zoom
+PANNED_LAYOUT_CACHE_SIZE = 8  # Display lists of panned-away regions, kept apart so a drag cannot evict prefetched sides
+EXPORT_IMAGE_SCALE = 2.0  # PNG export pixels per canvas pixel
+
+# Print queue
+PRINT_COMMAND_ENV = "SHELF_PRINT_COMMAND"  # Environment variable overriding the lp/lpr print command
+PRINT_SUBMIT_TIMEOUT_S = 60  # Longest a print command may run before the job fails
+PRINT_POLL_MS = 250  # How often the UI thread checks for print job status changes
+
+# Whole-store overview tiles
+OVERVIEW_CELL_PX = 3  # Pixels per shelf in an overview tile
+OVERVIEW_TILE_MAX_WIDTH = 360  # Very wide sides shrink to 1 pixel per shelf to fit this width
+OVERVIEW_PADDING = 8
+
+# External file watching
+FILE_WATCH_INTERVAL_S = 2.0  # How often the watcher thread checks the data files
+FILE_WATCH_POLL_MS = 500  # How often the UI thread applies reloaded files
+
+# Multi-store workspace
+WORKSPACE_MEMORY_BUDGET_MB = 512  # Memory budget for cached store models
+WORKSPACE_POLL_MS = 200  # How often the UI thread checks for finished background store loads
+
+# Undo for bulk edits such as layout replication
+UNDO_LIMIT = 20  # Undoable bulk edits kept in memory
+
+# Version history
+HISTORY_BLOCK_CACHE_SIZE = 2048  # Decoded side blocks kept in memory for previews
+
+# Read-only lookup service for handheld scanners
+LOOKUP_HOST = "127.0.0.1"  # Bind to localhost only by default
+LOOKUP_PORT = 8765
+LOOKUP_RELOAD_POLL_S = 0.5  # How often the service swaps in a sheet reloaded after a save
+LOOKUP_RESPONSE_CACHE_SIZE = 10000  # Encoded responses kept per loaded sheet
+
 # Styling constants
 LARGE_FONT = ('Helvetica', 14)
 DROPDOWN_FONT = ('Helvetica', 16)
@@ -16,6 +67,8 @@ SHELF_FRONT_COLOR = "#d3d3d3"
 SHELF_TOP_COLOR = "#f0f0f0"
 SHELF_RIGHT_COLOR = "#c0c0c0"
 CANVAS_BG_COLOR = "#f0f0e8"  # Changed from #ffffff (white) to a soft grayish-beige
+LOCATE_HIGHLIGHT_COLOR = "#FFD700"  # Highlight for shelves found via the Locate panel
+COMPARE_COLORS = {"added": "#2E8B57", "removed": "#B22222", "changed": "#1E90FF", "conflict": "#FF00FF"}  # Compare/merge overlay outlines
 
 # Theme and style settings for ttk widgets
 CUSTOM_FRAME_STYLE = "Custom.TFrame"
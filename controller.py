@@ -1,7 +1,25 @@
+import time
+import queue
+from tkinter import ttk, filedialog
+import pandas as pd
+from tracing import tracer
+from file_watcher import FileWatcher
+from compare import Comparison, export_changes
+from merge import ConflictList, THEIRS
+from prefetch import SideCache, neighbour_sides
+from display_list import SideData
+from render import render_pil, render_svg
+from print_spooler import PrintSpooler
+from assignment_sheet import LOCATION_COLUMNS, read_sheet
+from model import read_catalog, read_shelf_structure
+from constants import LOCATE_HIGHLIGHT_COLOR, TYPEAHEAD_DEBOUNCE_MS, FILE_WATCH_POLL_MS, WORKSPACE_POLL_MS, PREFETCH_DELAY_MS, EXPORT_IMAGE_SCALE, PRINT_POLL_MS
+
 class ShelfController:
-    def __init__(self, root, model, view):
+    def __init__(self, root, model, view, workspace=None):
         print("Starting ShelfController initialization")
         self.model = model
+        self.workspace = workspace  # StoreWorkspace when editing many stores, else None
+        self.pending_store = None  # Store to switch to once its background load finishes
         self.view = view
         self.selected_cells = set()
         self.start_x = None
@@ -10,6 +28,18 @@ class ShelfController:
         self.clear_values_mode = False  # Toggle for clearing values during selection
         self.is_ui_ready = False  # Flag to ensure UI is ready
         self.resize_timer = None  # Timer for debouncing resize events
+        self.typeahead_timer = None  # Timer for debouncing dropdown keystrokes
+        self.file_watcher = None  # Watches the data files for edits made outside the editor
+        self.comparison = None  # Comparison against another assignment file shown as an overlay
+        self.preview_version = None  # History version id shown read-only in the Shelf View, or None
+        self.conflicts = None  # ConflictList of merge conflicts awaiting resolution
+        self.conflict_dialog = None
+        self.side_cache = SideCache()  # Prepared Shelf View sides, filled ahead of navigation while idle
+        self.prefetch_queue = []  # (section, aisle, side) keys still to prepare
+        self.prefetch_timer = None
+        self.print_spooler = None  # PrintSpooler rendering and submitting print jobs, created on first print
+        self.print_queue_dialog = None
+        self.model.subscribe(self.side_cache.on_model_changed)
         print("ShelfController initialization completed")
 
     def set_ui_ready(self):
@@ -30,6 +60,8 @@ class ShelfController:
 
     def save_data(self):
         success, message = self.model.save_data()
+        if success and self.file_watcher is not None:
+            self.file_watcher.acknowledge(self.model.output_file)
         # Only show message if there is an error during saving
         if not success:
             self.view.show_message("Warning", message)
@@ -40,11 +72,177 @@ class ShelfController:
             self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
             return
         success, message = self.model.generate_shelf_assignment()
+        if success and self.file_watcher is not None:
+            self.file_watcher.acknowledge(self.model.output_file)
+        # The Table View and Shelf View refresh themselves from the StructureRegenerated event
         self.view.show_message("Shelf Assignment Generation", message)
-        if success:
-            # Refresh the Table View and Shelf View to reflect the new data
-            self.view.table_tab_component.update_treeview()
-            self.update_shelf_view()
+
+    def start_file_watcher(self):
+        """Watch the output, family and shelf information files for edits made outside the editor."""
+        self.stop_file_watcher()
+        self.file_watcher = FileWatcher({
+            self.model.output_file: read_sheet,
+            self.model.family_file: read_catalog,
+            self.model.shelf_info_file: read_shelf_structure,
+        })
+        self.file_watcher.start()
+        self.view.root.after(FILE_WATCH_POLL_MS, self.poll_external_changes, self.file_watcher)
+
+    def stop_file_watcher(self):
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+
+    def poll_external_changes(self, watcher):
+        """Apply files reloaded by the watcher thread on the UI thread."""
+        if watcher is not self.file_watcher:
+            # The watcher was stopped or replaced (e.g. after switching stores)
+            return
+        try:
+            while True:
+                path, result = watcher.results.get_nowait()
+                self.apply_external_change(path, result)
+        except queue.Empty:
+            pass
+        self.view.root.after(FILE_WATCH_POLL_MS, self.poll_external_changes, watcher)
+
+    def apply_external_change(self, path, result):
+        """Merge an externally modified data file into the model."""
+        if path == self.model.family_file:
+            families, categories = result
+            if self.model.apply_external_catalog(families, categories):
+                print(f"Catalog reloaded from {path}")
+            return
+        if path == self.model.shelf_info_file:
+            if self.model.apply_external_structure(result):
+                print(f"Shelf structure reloaded from {path}")
+            return
+        
+        if self.model.df is None:
+            self.model.replace_sheet(result)
+            return
+        changed = self.model.diff_sheet(result)
+        if changed is None:
+            # The set of shelves changed, so the cells cannot be merged one by one
+            if self.model.dirty_locations and not self.view.ask_yes_no(
+                "External Change",
+                f"{path} was changed outside the editor and no longer matches the loaded shelves.\n"
+                f"Reload it and discard {len(self.model.dirty_locations)} unsaved edits?"
+            ):
+                return
+            self.model.replace_sheet(result)
+            return
+        if changed.empty:
+            return
+        applied, conflicts = self.model.apply_external_changes(changed)
+        if not conflicts.empty:
+            examples = "\n".join(
+                f"{row.Section}-{row.Aisle}-{row.Side} L{row.Level} S{row.Shelf}: "
+                f"yours '{row.Category_old}', file '{row.Category_new}'"
+                for row in conflicts.head(10).itertuples()
+            )
+            self.view.show_message(
+                "Warning",
+                f"{path} was changed outside the editor. Applied {applied} changed shelves.\n"
+                f"{len(conflicts)} shelves also have unsaved edits here; your values were kept "
+                f"and will overwrite the file on Save:\n{examples}"
+            )
+
+    def get_store_names(self):
+        return self.workspace.get_store_names() if self.workspace else []
+
+    def switch_store(self, name):
+        """Show another store of the workspace: instantly if cached, else after a background load."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        if name == self.workspace.current:
+            # Going back to the shown store abandons any switch still loading
+            self.pending_store = None
+            self.view.set_store_status(name)
+            return
+        model = self.workspace.get_cached(name)
+        if model is not None:
+            self.set_model(name, model)
+            return
+        # Keep the current store usable while the requested one loads
+        self.pending_store = name
+        self.view.set_store_status(f"Loading {name}...")
+        self.workspace.load_async(name)
+
+    def poll_store_loads(self):
+        """Switch to a store whose background load has finished, if it is still the one requested."""
+        for name, model, error in self.workspace.take_loaded():
+            if error is not None:
+                self.view.show_message("Warning", f"Failed to load store '{name}': {str(error)}")
+                if name == self.pending_store:
+                    self.pending_store = None
+                    self.view.set_store_status(self.workspace.current)
+            elif name == self.pending_store:
+                self.set_model(name, model)
+        self.view.root.after(WORKSPACE_POLL_MS, self.poll_store_loads)
+
+    def set_model(self, name, model):
+        """Point the controller and views at another store's model."""
+        print(f"Switching to store '{name}'")
+        self.pending_store = None  # The latest choice wins over any load still in flight
+        old_model = self.model
+        self.clear_comparison()
+        self.preview_version = None
+        self.clear_conflicts()
+        self.stop_file_watcher()
+        self.selected_cells.clear()
+        old_model.unsubscribe(self.side_cache.on_model_changed)
+        self.side_cache.clear()
+        self.prefetch_queue = []
+        self.model = model
+        self.model.subscribe(self.side_cache.on_model_changed)
+        self.workspace.current = name
+        self.view.shelf_tab.bind_model(old_model, model)
+        self.view.table_tab_component.bind_model(old_model, model)
+        self.view.overview_tab.bind_model(old_model, model)
+        self.view.set_store_status(name)
+        self.start_file_watcher()
+        self.workspace.evict()
+
+    def replicate_layout(self, source, targets):
+        """Copy the source side's layout to the targets; returns True if it was applied."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return False
+        success, message = self.model.replicate_layout(source, targets)
+        if not success:
+            self.view.show_message("Warning", message)
+            return False
+        # Views repaint from the CellsAssigned event
+        self.view.show_message("Success", message)
+        return True
+
+    def open_validation(self):
+        """Open the catalog validation dialog."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        from view.validation_dialog import ValidationDialog
+        ValidationDialog(self.view.root, self)
+
+    def apply_validation_fixes(self, mode, include_incomplete=False):
+        """Bulk-fix catalog issues; views repaint from the CellsAssigned event."""
+        success, message = self.model.apply_validation_fixes(mode, include_incomplete)
+        self.view.show_message("Success" if success else "Warning", message)
+
+    def undo(self, event=None):
+        """Undo the most recent bulk edit (e.g. a layout replication)."""
+        if not self.is_ui_ready:
+            return
+        if self.conflicts is not None and self.model.undo_stack and self.model.undo_stack[-1] is self.conflicts.undo_entry:
+            # Undoing the merge itself leaves nothing to resolve
+            self.clear_conflicts()
+        success, message = self.model.undo()
+        if not success:
+            self.view.show_message("Warning", message)
+        else:
+            print(message)
 
     def toggle_clear_values_mode(self):
         """Toggle the clear values mode and update the button label."""
@@ -92,6 +290,7 @@ class ShelfController:
         dropdown = ttk.Combobox(self.view.table_tab_component.tree, state="normal", style="TCombobox")
         if column_name == "Family":
             full_values = self.model.families
+            typeahead = self.model.family_typeahead
             dropdown["values"] = full_values
             current_value = str(self.model.df.at[int(row_id), "Family"])
             if pd.isna(current_value) or current_value == "nan":
@@ -106,6 +305,7 @@ class ShelfController:
             if pd.isna(family) or family == "nan":
                 family = ""
             full_values = self.model.categories.get(family, ["No Categories Available"])
+            typeahead = self.model.get_category_typeahead(family)
             dropdown["values"] = full_values
             current_value = str(self.model.df.at[int(row_id), "Category"])
             if pd.isna(current_value) or current_value == "nan":
@@ -120,32 +320,38 @@ class ShelfController:
         dropdown.lift()
         dropdown.focus_set()
         
-        dropdown.bind("<KeyRelease>", lambda e: self.on_table_dropdown_key_release(e, dropdown, full_values))
+        dropdown.bind("<KeyRelease>", lambda e: self.on_typeahead_key_release(e, dropdown, lambda: typeahead))
         dropdown.bind("<<ComboboxSelected>>", lambda e: self.on_table_dropdown_select(e, dropdown, row_id, column_name))
         dropdown.bind("<FocusOut>", lambda e: self.on_table_dropdown_close(e, dropdown))
         dropdown.bind("<Return>", lambda e: self.on_table_dropdown_select(e, dropdown, row_id, column_name))
         self.view.table_tab_component.dropdown = dropdown
 
-    def on_table_dropdown_key_release(self, event, dropdown, full_values):
+    def on_typeahead_key_release(self, event, dropdown, get_typeahead):
+        """Debounce keystrokes in a typeahead dropdown and filter its values once typing pauses."""
         if not self.is_ui_ready:
             self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
             return
-        if event.keysym in ["Up", "Down", "Return"]:
-            print(f"Arrow key or Enter pressed: {event.keysym}, skipping filter")
+        if event.keysym in ["Up", "Down", "Return", "Escape", "Tab"]:
+            print(f"Navigation key pressed: {event.keysym}, skipping filter")
             return
-        
-        typed_text = dropdown.get().strip().lower()
-        print(f"Key released, typed text: {typed_text}")
-        
-        if typed_text == "":
-            dropdown["values"] = full_values
-            print(f"Restored full values: {full_values}")
-        else:
-            filtered_values = [val for val in full_values if val.lower().startswith(typed_text)]
-            dropdown["values"] = filtered_values
-            print(f"Filtered values: {filtered_values}")
-        
-        self.view.root.after(100, lambda: dropdown.event_generate('<Down>'))
+        if self.typeahead_timer is not None:
+            self.view.root.after_cancel(self.typeahead_timer)
+        self.typeahead_timer = self.view.root.after(
+            TYPEAHEAD_DEBOUNCE_MS, lambda: self._apply_typeahead(dropdown, get_typeahead())
+        )
+
+    def _apply_typeahead(self, dropdown, typeahead):
+        """Filter a dropdown's values with the typeahead index and open its list."""
+        self.typeahead_timer = None
+        if not dropdown.winfo_exists():
+            return
+        typed_text = dropdown.get()
+        values = typeahead.search(typed_text)
+        if list(dropdown["values"]) != values:
+            dropdown["values"] = values
+        print(f"Typeahead for '{typed_text}': {len(values)} values")
+        if typed_text.strip() and values:
+            dropdown.event_generate('<Down>')
         dropdown.focus_set()
 
     def on_table_dropdown_select(self, event, dropdown, row_id, column_name):
@@ -156,8 +362,8 @@ class ShelfController:
         selected_value = dropdown.get()
         print(f"Selected value: {selected_value} for {column_name} in row {row_id}")
         
-        values = self.model.update_cell(row_id, column_name, selected_value)
-        self.view.table_tab_component.update_treeview_row(row_id, values)
+        # The Treeview row and Shelf View are refreshed from the model's change event
+        self.model.update_cell(row_id, column_name, selected_value)
         
         if column_name == "Family":
             if self.view.shelf_tab and hasattr(self.view.shelf_tab, 'family_var'):
@@ -205,6 +411,19 @@ class ShelfController:
             return
         self.update_shelf_view()
 
+    def commit_typeahead(self, dropdown, variable, typeahead):
+        """Resolve typed dropdown text to a catalog value: exact match, else the best typeahead hit."""
+        typed_text = variable.get()
+        if typed_text in typeahead.values:
+            return typed_text
+        # Committing happens once per edit, so it can afford the fuzzy fallback that keystrokes skip
+        matches = typeahead.search(typed_text, fuzzy=True)
+        value = matches[0] if typed_text.strip() and matches else ""
+        variable.set(value)
+        dropdown["values"] = typeahead.values
+        print(f"Resolved typed text '{typed_text}' to '{value}'")
+        return value
+
     def on_family_changed(self, event):
         if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
             self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
@@ -214,6 +433,33 @@ class ShelfController:
         self.view.shelf_tab.update_category_dropdown(categories)
         print(f"Updated Category dropdown for Family '{family}': {categories}")
 
+    def locate_category(self):
+        """List every location holding the selected Family (and Category) in the Locate panel."""
+        if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        family = self.view.shelf_tab.family_var.get()
+        if not family:
+            self.view.show_message("Warning", "Please select a Family to locate.")
+            return
+        category = None if self.view.shelf_tab.locate_family_var.get() else self.view.shelf_tab.category_var.get()
+        hits = self.model.locate(family, category)
+        print(f"Located Family '{family}', Category '{category}': {len(hits)} shelves")
+        self.view.shelf_tab.show_locate_results(hits)
+
+    def jump_to_location(self, section, aisle, side, cells):
+        """Switch the Shelf View to a section/aisle/side and highlight the given cells."""
+        if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        shelf_tab = self.view.shelf_tab
+        shelf_tab.set_location(section, aisle, side)
+        self.selected_cells.clear()
+        self.update_shelf_view()
+        for level, shelf in cells:
+            shelf_tab.highlight_shelf(level, shelf, LOCATE_HIGHLIGHT_COLOR)
+        print(f"Jumped to Section {section}, Aisle {aisle}, Side {side} with {len(cells)} highlighted shelves")
+
     def update_shelf_view(self, event=None):
         if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
             self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
@@ -228,9 +474,352 @@ class ShelfController:
         except ValueError:
             print(f"Invalid aisle or side value: Aisle='{aisle}', Side='{side}'")
             return
-        filtered_df = self.model.get_filtered_data(section, aisle, side)
-        print(f"Updating shelf view with filtered_df: {filtered_df.shape if filtered_df is not None else 'None'}")
-        self.view.shelf_tab.draw_shelf_view(filtered_df, section, aisle, side)
+        start = time.perf_counter()
+        prepared = None
+        with tracer.span("update_shelf_view", section=section, aisle=aisle, side=side):
+            if self.preview_version is not None:
+                filtered_df = self.model.get_history().load_side(self.preview_version, section, aisle, side) if section and aisle and side else None
+            else:
+                prepared = self.get_prepared_side(section, aisle, side)
+                filtered_df = prepared.filtered_df if prepared is not None else None
+            print(f"Updating shelf view with filtered_df: {filtered_df.shape if filtered_df is not None else 'None'}")
+            self.view.shelf_tab.draw_shelf_view(filtered_df, section, aisle, side, prepared)
+        self.view.shelf_tab.draw_performance_hud((time.perf_counter() - start) * 1000)
+        if prepared is not None:
+            self.schedule_prefetch(section, aisle, side)
+
+    def get_prepared_side(self, section, aisle, side):
+        """Return the cached SideData for a side, filtering it from the model on a miss."""
+        key = (section, aisle, side)
+        prepared = self.side_cache.get(key)
+        if prepared is None:
+            filtered_df = self.model.get_filtered_data(section, aisle, side)
+            if filtered_df is None:
+                return None
+            prepared = SideData(filtered_df)
+            self.side_cache.put(key, prepared)
+        return prepared
+
+    def schedule_prefetch(self, section, aisle, side):
+        """Queue the sides around the shown one for preparation once the UI has been idle for a moment."""
+        self.prefetch_queue = neighbour_sides(self.model.shelf_structure, section, aisle, side)
+        if self.prefetch_timer is not None:
+            self.view.root.after_cancel(self.prefetch_timer)
+        self.prefetch_timer = self.view.root.after(PREFETCH_DELAY_MS, self.prefetch_next)
+
+    def prefetch_next(self):
+        """Prepare one queued side, then yield to pending events before the next.
+
+        Sides are prepared on the UI thread between events rather than on a
+        worker thread, since the model's DataFrame is edited in place.
+        """
+        self.prefetch_timer = None
+        if not self.prefetch_queue or self.preview_version is not None:
+            return
+        section, aisle, side = self.prefetch_queue.pop(0)
+        shelf_tab = self.view.shelf_tab
+        with tracer.span("prefetch_side", section=section, aisle=aisle, side=side):
+            prepared = self.get_prepared_side(section, aisle, side)
+            layout_params = shelf_tab.layout_params()
+            if prepared is not None and layout_params is not None:
+                prepared.layout(*layout_params)
+        self.prefetch_timer = self.view.root.after_idle(self.prefetch_next)
+
+    def navigate(self, aisle_step=0, flip_side=False):
+        """Move the Shelf View to a neighbouring aisle or the next side of this aisle."""
+        if not self.is_ui_ready or self.view.shelf_tab is None:
+            return
+        if self.view.notebook.select() != str(self.view.shelf_tab_frame):
+            return
+        shelf_tab = self.view.shelf_tab
+        section = shelf_tab.section_var.get()
+        config = self.model.shelf_structure.get(section)
+        try:
+            aisle = int(shelf_tab.aisle_var.get()) + aisle_step
+            side = int(shelf_tab.side_var.get())
+        except ValueError:
+            return
+        if config is None or not 1 <= aisle <= config["aisles"]:
+            return
+        if flip_side:
+            side = side % config["sides"] + 1
+        self.jump_to_location(section, aisle, side, [])
+        return "break"
+
+    def next_aisle(self, event=None):
+        return self.navigate(aisle_step=1)
+
+    def previous_aisle(self, event=None):
+        return self.navigate(aisle_step=-1)
+
+    def flip_side(self, event=None):
+        return self.navigate(flip_side=True)
+
+    def reset_zoom(self):
+        """Zoom the Shelf View back out to the whole side."""
+        if self.is_ui_ready and self.view.shelf_tab is not None:
+            self.view.shelf_tab.reset_zoom()
+
+    def toggle_performance_hud(self):
+        """Show or hide the frame time / canvas item overlay on the shelf canvas."""
+        if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        self.view.shelf_tab.show_performance_hud = not self.view.shelf_tab.show_performance_hud
+        print(f"Performance HUD {'enabled' if self.view.shelf_tab.show_performance_hud else 'disabled'}")
+        self.update_shelf_view()
+
+    def toggle_tracing(self):
+        """Start or stop recording tracing spans."""
+        tracer.enabled = not tracer.enabled
+        if tracer.enabled:
+            tracer.clear()
+        print(f"Tracing {'started' if tracer.enabled else 'stopped'}")
+
+    def export_trace(self):
+        """Save the recorded spans as a Chrome trace-event JSON file."""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Chrome trace", "*.json")],
+            title="Export Trace"
+        )
+        if not file_path:
+            return
+        try:
+            count = tracer.export_chrome_trace(file_path)
+            self.view.show_message("Success", f"Exported {count} trace events to {file_path}")
+        except Exception as e:
+            self.view.show_message("Error", f"Failed to export trace: {str(e)}")
+
+    def load_comparison(self):
+        """Load another assignment file and outline its differences from the current sheet in the Shelf View."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Excel files", "*.xlsx *.xlsm"), ("All files", "*.*")],
+            title="Compare With"
+        )
+        if not file_path:
+            return
+        try:
+            base_df = read_sheet(file_path)
+        except Exception as e:
+            self.view.show_message("Error", f"Failed to load {file_path}: {str(e)}")
+            return
+        self.clear_comparison()
+        self.comparison = Comparison(base_df, file_path)
+        self.model.subscribe(self.comparison.on_model_changed)
+        with tracer.span("compare_sheets"):
+            changes = self.comparison.update(self.model.df)
+        counts = changes['change'].value_counts()
+        summary = ", ".join(f"{count} {change}" for change, count in counts.items()) or "no differences"
+        self.view.show_message("Success", f"Compared with {file_path}: {summary}")
+        self.view.shelf_tab.schedule_repaint()
+
+    def clear_comparison(self):
+        if self.comparison is not None:
+            self.model.unsubscribe(self.comparison.on_model_changed)
+            self.comparison = None
+            self.view.shelf_tab.schedule_repaint()
+
+    def get_side_changes(self, section, aisle, side):
+        """Return the overlay cells for a side: compare differences, then unresolved merge conflicts."""
+        cells = {}
+        if self.comparison is not None:
+            cells.update(self.comparison.side_changes(self.model.df, section, aisle, side))
+        if self.conflicts is not None:
+            cells.update(self.conflicts.side_conflicts(section, aisle, side, self.model.location_keys))
+        return cells
+
+    def merge_with(self):
+        """Three-way merge another planner's copy into the loaded sheet, then list the conflicts."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        base_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xlsm")], title="Merge: Common Ancestor")
+        if not base_path:
+            return
+        theirs_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xlsm")], title="Merge: Other Edited Copy")
+        if not theirs_path:
+            return
+        try:
+            base_df = read_sheet(base_path)
+            theirs_df = read_sheet(theirs_path)
+        except Exception as e:
+            self.view.show_message("Error", f"Failed to load sheets to merge: {str(e)}")
+            return
+        self.clear_conflicts()
+        applied, conflicts = self.model.merge_versions(base_df, theirs_df)
+        if conflicts.empty:
+            self.view.show_message("Success", f"Merged {applied} changes from {theirs_path} with no conflicts. Save to keep them.")
+            return
+        self.conflicts = ConflictList(conflicts, self.model.undo_stack[-1] if applied else None)
+        self.model.subscribe(self.on_conflicts_model_changed)
+        self.view.shelf_tab.schedule_repaint()
+        self.view.show_message("Warning", f"Merged {applied} changes from {theirs_path}. {len(conflicts)} shelves were changed in both copies and need resolving.")
+        self.open_conflicts()
+
+    def open_conflicts(self):
+        """Open the merge conflict list."""
+        if self.conflicts is None:
+            self.view.show_message("Warning", "There are no merge conflicts to resolve.")
+            return
+        if self.conflict_dialog is not None and self.conflict_dialog.is_open():
+            self.conflict_dialog.refresh()
+            self.conflict_dialog.window.lift()
+            return
+        from view.conflict_dialog import ConflictDialog
+        self.conflict_dialog = ConflictDialog(self.view.root, self)
+
+    def clear_conflicts(self):
+        if self.conflicts is not None:
+            self.model.unsubscribe(self.on_conflicts_model_changed)
+            self.conflicts = None
+            self.view.shelf_tab.schedule_repaint()
+        if self.conflict_dialog is not None and self.conflict_dialog.is_open():
+            self.conflict_dialog.refresh()
+
+    def on_conflicts_model_changed(self, event):
+        """Drop conflicts the user has since edited, so neither the overlay nor Take Theirs works from stale values."""
+        if self.conflicts is None:
+            return
+        if event.full_refresh:
+            # The sheet was replaced (reload, restore or regenerate), so the merge no longer applies
+            self.clear_conflicts()
+            return
+        if not self.conflicts.drop_locations(event.locations):
+            return
+        if self.conflicts.conflicts.empty:
+            self.clear_conflicts()
+        else:
+            self.view.shelf_tab.schedule_repaint()
+            if self.conflict_dialog is not None and self.conflict_dialog.is_open():
+                self.conflict_dialog.refresh()
+
+    def resolve_conflicts(self, positions, choice):
+        """Resolve conflicts by position, keeping ours or taking theirs as one undoable edit."""
+        resolved = self.conflicts.resolve(positions)
+        if self.conflicts.conflicts.empty:
+            self.clear_conflicts()
+        if choice == THEIRS:
+            matched = resolved.merge(self.model.location_rows(), on=LOCATION_COLUMNS, how='inner')
+            writes = pd.DataFrame({'row': matched['row'], 'Family': matched['Family_theirs'], 'Category': matched['Category_theirs']})
+            self.model.apply_assignments(writes, undo_label="conflict resolution")
+        self.view.shelf_tab.schedule_repaint()
+
+    def export_change_list(self):
+        """Save the differences from the compared file as a CSV or Excel change list."""
+        if self.comparison is None:
+            self.view.show_message("Warning", "Use File > Compare With... to load a file to compare first.")
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv")],
+            title="Export Change List"
+        )
+        if not file_path:
+            return
+        try:
+            export_changes(self.comparison.update(self.model.df), file_path)
+            self.view.show_message("Success", f"Exported change list to {file_path}")
+        except Exception as e:
+            self.view.show_message("Error", f"Failed to export change list: {str(e)}")
+
+    def export_side_image(self):
+        """Save the side on screen as a PNG or SVG drawn from the same display list as the canvas."""
+        if not self.is_ui_ready or self.view.shelf_tab is None:
+            return
+        display_list = self.view.shelf_tab.whole_side_display_list()
+        if display_list is None:
+            self.view.show_message("Warning", "Please select Section, Aisle, and Side values before exporting.")
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            filetypes=[("PNG images", "*.png"), ("SVG images", "*.svg")],
+            title="Export Side Image"
+        )
+        if not file_path:
+            return
+        try:
+            if file_path.lower().endswith(".svg"):
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.write(render_svg(display_list, self.model.color_map.colors))
+            else:
+                render_pil(display_list, self.model.color_map.colors, EXPORT_IMAGE_SCALE).save(file_path)
+            self.view.show_message("Success", f"Exported side image to {file_path}")
+        except Exception as e:
+            self.view.show_message("Error", f"Failed to export image: {str(e)}")
+
+    def get_print_spooler(self):
+        """Return the print spooler, creating it and starting its status polling on first use."""
+        if self.print_spooler is None:
+            self.print_spooler = PrintSpooler()
+            self.view.root.after(PRINT_POLL_MS, self.poll_print_jobs)
+        return self.print_spooler
+
+    def submit_print_job(self, title, render):
+        """Queue a print job whose `render(pdf_path)` runs on the spooler thread, and show the print queue."""
+        job = self.get_print_spooler().submit(title, render)
+        print(f"Queued print job {job.job_id}: {title}")
+        self.open_print_queue()
+
+    def cancel_print_job(self, job_id):
+        success, message = self.get_print_spooler().cancel(job_id)
+        if not success:
+            self.view.show_message("Warning", message)
+        else:
+            print(message)
+
+    def open_print_queue(self):
+        """Open the print queue, or refresh it if it is already open."""
+        if self.print_queue_dialog is not None and self.print_queue_dialog.is_open():
+            self.print_queue_dialog.refresh()
+            self.print_queue_dialog.window.lift()
+            return
+        from view.print_queue_dialog import PrintQueueDialog
+        self.print_queue_dialog = PrintQueueDialog(self.view.root, self)
+
+    def poll_print_jobs(self):
+        """Refresh the print queue when jobs changed status on the spooler thread."""
+        changed = False
+        try:
+            while True:
+                self.print_spooler.updates.get_nowait()
+                changed = True
+        except queue.Empty:
+            pass
+        if changed and self.print_queue_dialog is not None and self.print_queue_dialog.is_open():
+            self.print_queue_dialog.refresh()
+        self.view.root.after(PRINT_POLL_MS, self.poll_print_jobs)
+
+    def open_history(self):
+        """Open the version history browser."""
+        if not self.is_ui_ready:
+            self.view.show_message("Warning", "Please wait for the UI to fully initialize.")
+            return
+        from view.history_dialog import HistoryDialog
+        HistoryDialog(self.view.root, self)
+
+    def show_version_preview(self, version_id, label):
+        """Show a past version read-only in the Shelf View, loading only the sides being viewed."""
+        self.preview_version = version_id
+        self.selected_cells.clear()
+        self.view.set_store_status(f"Preview of {label}")
+        self.view.shelf_tab.schedule_repaint()
+
+    def stop_version_preview(self):
+        if self.preview_version is None:
+            return
+        self.preview_version = None
+        self.view.set_store_status(self.workspace.current if self.workspace else "")
+        self.view.shelf_tab.schedule_repaint()
+
+    def restore_version(self, version_id):
+        """Load a past version into the editor; it is written to disk on the next Save."""
+        self.stop_version_preview()
+        success, message = self.model.restore_version(version_id)
+        self.view.show_message("Success" if success else "Warning", message)
 
     def on_resize(self, event):
         if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
@@ -292,6 +881,7 @@ class ShelfController:
         if not section or not aisle or not side:
             self.view.show_message("Warning", "Please select Section, Aisle, and Side values before interacting with the shelf.")
             return
+        start = time.perf_counter()
         current_x = self.view.shelf_tab.canvas.canvasx(event.x)
         current_y = self.view.shelf_tab.canvas.canvasy(event.y)
         self.view.shelf_tab.canvas.coords(self.selection_rect, self.start_x, self.start_y, current_x, current_y)
@@ -306,6 +896,7 @@ class ShelfController:
             else:
                 self.view.shelf_tab.highlight_shelf(level, shelf, "#d3d3d3")
         print(f"Updated selection: {len(self.selected_cells)} cells selected")
+        self.view.shelf_tab.draw_performance_hud((time.perf_counter() - start) * 1000)
 
     def end_selection(self, event):
         if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
@@ -323,6 +914,11 @@ class ShelfController:
         self.start_x = None
         self.start_y = None
         print(f"Ended selection with {len(self.selected_cells)} cells selected")
+        if self.selected_cells and self.preview_version is not None:
+            self.selected_cells.clear()
+            self.view.shelf_tab.schedule_repaint()
+            self.view.show_message("Warning", "A past version is being previewed. Stop the preview in the History window to edit.")
+            return
         if self.selected_cells:
             if self.clear_values_mode:
                 self.clear_selected_values()
@@ -353,26 +949,10 @@ class ShelfController:
             self.view.show_message("Warning", "Invalid Aisle or Side value.")
             return
         
-        updated_rows = 0
-        for level, shelf in self.selected_cells:
-            mask = (
-                (self.model.df['Section'] == section) &
-                (self.model.df['Aisle'] == aisle) &
-                (self.model.df['Side'] == side) &
-                (self.model.df['Level'] == level) &
-                (self.model.df['Shelf'] == shelf)
-            )
-            row_idx = self.model.df.index[mask]
-            if not row_idx.empty:
-                row_idx = row_idx[0]
-                self.model.df.at[row_idx, 'Family'] = ""
-                self.model.df.at[row_idx, 'Category'] = ""
-                updated_rows += 1
-                print(f"Cleared row {row_idx}: Family and Category set to empty")
-        
-        print(f"Cleared Family and Category for {updated_rows} shelves")
+        self.model.clear_selection(self.selected_cells, section, aisle, side)
         self.selected_cells.clear()
-        self.update_shelf_view()
+        # Coalesces with the repaint queued by the CellsCleared event; also drops the selection highlight
+        self.view.shelf_tab.schedule_repaint()
 
     def apply_selection(self):
         if not self.is_ui_ready or not hasattr(self.view, 'shelf_tab') or self.view.shelf_tab is None:
@@ -398,4 +978,5 @@ class ShelfController:
             self.view.show_message("Warning", message)
         if success:
             self.selected_cells.clear()
-            self.update_shelf_view()
\ No newline at end of file
+            # Coalesces with the repaint queued by the CellsAssigned event; also drops the selection highlight
+            self.view.shelf_tab.schedule_repaint()
\ No newline at end of file
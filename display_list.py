@@ -0,0 +1,144 @@
+"""Tk-free display lists for the Shelf View: the polygons and labels every render target draws.
+
+build_display_list() turns a side's bar runs and a target size into a
+DisplayList; layout_side() memoizes it on those inputs so the screen, image
+export and printing share one layout per side and size. Layouts are always
+unpanned: a pan picks which region of the unpanned layout is materialized
+and the Shelf View moves the drawn items by the pan. The backends that draw
+a DisplayList are in render.py.
+"""
+from collections import namedtuple
+from functools import lru_cache
+from layout import (compute_grid_geometry, bar_rect, bar_runs, fit_label, viewport_bounds, pan_window, intersects,
+                    visible_axis_labels, label_readable, LOD_MIN_3D_CELL)
+from constants import SHELF_FRONT_COLOR, SHELF_TOP_COLOR, SHELF_RIGHT_COLOR, DISPLAY_LIST_CACHE_SIZE, PANNED_LAYOUT_CACHE_SIZE
+
+# fill is a color, or a (family|category key, face) pair resolved against the category colors at draw time
+Polygon = namedtuple("Polygon", "points fill outline tag")
+Text = namedtuple("Text", "x y text size bold")
+
+DEFAULT_BAR_COLORS = {'front': "#BEBEBE", 'top': "#D3D3D3", 'right': "#A9A9A9"}  # Categories without a color
+
+
+class DisplayList:
+    """Drawing primitives for one side at one size in paint order, plus the cell rectangles for hit testing.
+
+    Instances are shared through the layout cache and must not be modified.
+    """
+
+    def __init__(self, width, height, geometry, viewport, items):
+        self.width = width
+        self.height = height
+        self.cell_width = geometry["cell_width"]
+        self.cell_height = geometry["cell_height"]
+        self.depth = geometry["depth"]
+        self.offset_x = geometry["offset_x"]  # Top-left corner of the (max_level, 1) cell
+        self.offset_y = geometry["offset_y"]
+        self.viewport = viewport
+        self.visible_cells = geometry["cells"]  # The cells drawn, inside the viewport plus margin
+        self.items = items
+
+
+class SideData:
+    """A side's filtered rows reduced to what its layout depends on: grid size and bar runs."""
+
+    def __init__(self, filtered_df):
+        self.filtered_df = filtered_df
+        self.max_level = int(filtered_df['Level'].max())
+        self.max_shelf = int(filtered_df['Shelf'].max())
+        self.runs = tuple(bar_runs(filtered_df))
+
+    def layout(self, width, height, scale_factor, aspect_ratio, pan_x=0, pan_y=0):
+        """Return the memoized, unpanned DisplayList covering this side's view on a width x height target.
+
+        The items are not moved by the pan; draw them offset by (pan_x, pan_y).
+        """
+        window_x, window_y = pan_window(width, height, pan_x, pan_y)
+        # Panned regions get their own small cache so a drag cannot evict the prefetched unpanned layouts
+        cache = layout_side if (window_x, window_y) == (0, 0) else layout_panned_side
+        return cache(self.runs, self.max_level, self.max_shelf, width, height, scale_factor, aspect_ratio, window_x, window_y)
+
+
+def resolve_fill(fill, colors):
+    """Return the color of a polygon fill, looking bar faces up in `colors` (family|category -> face colors)."""
+    if isinstance(fill, tuple):
+        key, face = fill
+        return colors.get(key, DEFAULT_BAR_COLORS)[face]
+    return fill
+
+
+def build_display_list(runs, max_level, max_shelf, width, height, scale_factor, aspect_ratio, window_x=0, window_y=0):
+    """Lay out the 3D grid, category bars and labels of a side.
+
+    `runs` are layout.bar_runs() tuples. Only cells and bars inside the
+    viewport moved by (window_x, window_y), plus margin, are laid out; cells
+    too narrow for 3D are drawn flat and labels too small to read are dropped.
+    """
+    viewport = viewport_bounds(width, height, window_x=window_x, window_y=window_y)
+    geometry = compute_grid_geometry(max_level, max_shelf, width, height, scale_factor, aspect_ratio, viewport)
+    cell_width = geometry["cell_width"]
+    cell_height = geometry["cell_height"]
+    depth = geometry["depth"]
+    items = []
+
+    axis_labels = (visible_axis_labels(geometry["shelf_labels"], cell_width, viewport) +
+                   visible_axis_labels(geometry["level_labels"], geometry["cell_height"], viewport))
+    for label_x, label_y, text in axis_labels:
+        items.append(Text(label_x, label_y, text, geometry["label_font_size"], False))
+
+    draw_3d = cell_width >= LOD_MIN_3D_CELL
+    for (level, shelf), (x1, y1, x2, y2) in geometry["cells"].items():
+        items.append(Polygon((x1 + depth, y1, x2 + depth, y1, x2, y2, x1, y2),
+                             SHELF_FRONT_COLOR, "black", f"front_face_{level}_{shelf}"))
+        if not draw_3d:
+            continue
+        items.append(Polygon((x1 + depth, y1, x2 + depth, y1, x2, y1 - depth, x1, y1 - depth),
+                             SHELF_TOP_COLOR, "black", None))
+        items.append(Polygon((x2 + depth, y1, x2, y1 - depth, x2 - depth, y2 - depth, x2, y2),
+                             SHELF_RIGHT_COLOR, "black", None))
+
+    labels = []
+    for level, first_shelf, last_shelf, family, category in runs:
+        if not (1 <= level <= max_level and 1 <= first_shelf and last_shelf <= max_shelf):
+            continue
+        x1 = (first_shelf - 1) * cell_width + geometry["offset_x"]
+        x2 = last_shelf * cell_width + geometry["offset_x"]
+        y1 = (max_level - level) * cell_height + geometry["offset_y"]
+        y2 = y1 + cell_height
+        if not intersects((x1, y1, x2, y2), viewport):
+            continue
+        # Long runs are clipped to the materialized region so labels center on what is in view
+        x1 = max(x1, viewport[0])
+        x2 = min(x2, viewport[2])
+        key = f"{family}|{category}"
+        bar_x1, bar_y1, bar_x2, bar_y2 = bar_rect(x1, y1, x2, y2, depth)
+        items.append(Polygon((bar_x1, bar_y1, bar_x2, bar_y1, bar_x2, bar_y2, bar_x1, bar_y2), (key, 'front'), "", None))
+        items.append(Polygon((bar_x1, bar_y1, bar_x2, bar_y1, bar_x2 - depth, bar_y1 - depth, bar_x1 - depth, bar_y1 - depth),
+                             (key, 'top'), "", None))
+        items.append(Polygon((bar_x2, bar_y1, bar_x2 - depth, bar_y1 - depth, bar_x2 - depth, bar_y2 - depth, bar_x2, bar_y2),
+                             (key, 'right'), "", None))
+        labels.append(((x1, y1, x2, y2), category))
+
+    # Labels go last so no bar is painted over them
+    for (x1, y1, x2, y2), category in labels:
+        font_size, lines = fit_label(category, x2 - x1, y2 - y1)
+        if not label_readable(font_size, lines, y2 - y1):
+            continue
+        line_spacing = font_size * 1.1
+        start_y = (y1 + y2) / 2 - len(lines) * line_spacing / 2 + line_spacing / 2
+        for index, line in enumerate(lines):
+            items.append(Text((x1 + x2) / 2 + depth / 2, start_y + index * line_spacing, line, font_size, True))
+
+    return DisplayList(width, height, geometry, viewport, tuple(items))
+
+
+@lru_cache(maxsize=DISPLAY_LIST_CACHE_SIZE)
+def layout_side(runs, max_level, max_shelf, width, height, scale_factor, aspect_ratio, window_x=0, window_y=0):
+    """Memoized build_display_list; `runs` must be a tuple so it can be part of the cache key."""
+    return build_display_list(runs, max_level, max_shelf, width, height, scale_factor, aspect_ratio, window_x, window_y)
+
+
+@lru_cache(maxsize=PANNED_LAYOUT_CACHE_SIZE)
+def layout_panned_side(runs, max_level, max_shelf, width, height, scale_factor, aspect_ratio, window_x, window_y):
+    """Memoized build_display_list for regions away from the unpanned view."""
+    return build_display_list(runs, max_level, max_shelf, width, height, scale_factor, aspect_ratio, window_x, window_y)
@@ -0,0 +1,44 @@
+"""Change events published by ShelfModel to its subscribers."""
+
+
+class ModelEvent:
+    """Base class for model change events.
+
+    `locations` holds the affected (section, aisle, side, level, shelf) keys and
+    `rows` the matching DataFrame index labels. Events that replace the whole
+    sheet leave both empty and set `full_refresh`.
+    """
+    full_refresh = False
+
+    def __init__(self, locations=(), rows=()):
+        self.locations = list(locations)
+        self.rows = list(rows)
+
+    def sides(self):
+        """Return the set of (section, aisle, side) keys touched by this event."""
+        return {location[:3] for location in self.locations}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self.locations)} locations)"
+
+
+class CellsAssigned(ModelEvent):
+    """Family/Category values were written to existing cells."""
+
+
+class CellsCleared(ModelEvent):
+    """Family/Category values were removed from existing cells."""
+
+
+class StructureRegenerated(ModelEvent):
+    """The assignment sheet was regenerated from the shelf structure."""
+    full_refresh = True
+
+
+class DataReloaded(ModelEvent):
+    """The assignment sheet or catalog was reloaded from disk."""
+    full_refresh = True
+
+
+class CatalogUpdated(ModelEvent):
+    """The family/category catalog changed; assignment cells are untouched."""
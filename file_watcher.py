@@ -0,0 +1,66 @@
+import os
+import queue
+import threading
+from constants import FILE_WATCH_INTERVAL_S
+
+
+class FileWatcher:
+    """Poll files for external modifications and load changed files on a background thread.
+
+    When a watched file's modification time or size changes, `loaders[path](path)`
+    runs on the watcher thread and (path, result) is put on `results`. The UI
+    thread drains the queue; nothing here touches Tk.
+    """
+
+    def __init__(self, loaders, interval=FILE_WATCH_INTERVAL_S):
+        self.loaders = dict(loaders)  # Maps path to a function loading that file
+        self.interval = interval
+        self.results = queue.Queue()
+        self.signatures = {path: self.signature(path) for path in self.loaders}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @staticmethod
+    def signature(path):
+        """Return (mtime, size) of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def acknowledge(self, path):
+        """Record the current state of a file so our own writes are not reported as external."""
+        with self._lock:
+            self.signatures[path] = self.signature(path)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+            self._thread.start()
+            print(f"Watching for external changes: {list(self.loaders)}")
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            for path, loader in self.loaders.items():
+                current = self.signature(path)
+                with self._lock:
+                    if current is None or current == self.signatures.get(path):
+                        continue
+                try:
+                    result = loader(path)
+                except Exception as e:
+                    # Usually the file is still being written; retry on the next poll
+                    print(f"Failed to reload {path}: {str(e)}")
+                    continue
+                with self._lock:
+                    # Skip if our own save acknowledged the file while it was loading
+                    if self.signatures.get(path) == current:
+                        continue
+                    self.signatures[path] = current
+                print(f"Detected external change to {path}")
+                self.results.put((path, result))
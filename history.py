@@ -0,0 +1,125 @@
+"""Content-addressed, compressed version history of assignment sheets.
+
+Every recorded version is split into one block per (section, aisle, side).
+Blocks are stored zlib-compressed under the SHA-256 of their content, so a
+save that leaves most sides untouched only writes the blocks that changed
+plus a small manifest. Layout of the history directory:
+
+    objects/ab/cdef...   compressed blocks and manifests, named by content hash
+    versions.jsonl       one line per version: id (manifest hash), time, label, rows
+"""
+import hashlib
+import json
+import os
+import time
+import zlib
+from collections import OrderedDict
+import pandas as pd
+from assignment_sheet import LOCATION_COLUMNS, normalize_assignments
+from constants import HISTORY_BLOCK_CACHE_SIZE
+
+SIDE_COLUMNS = ['Section', 'Aisle', 'Side']
+BLOCK_COLUMNS = ['Level', 'Shelf', 'Family', 'Category']
+
+
+def history_dir_for(output_file):
+    """Return the history directory kept next to an output file."""
+    return output_file + ".history"
+
+
+class HistoryStore:
+    """Record, list and read back versions of an assignment sheet."""
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, "objects")
+        self.index_path = os.path.join(root_dir, "versions.jsonl")
+        self.block_cache = OrderedDict()  # Maps block hash to its decoded columns, most recently used last
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put_object(self, data):
+        """Store bytes under their SHA-256 unless already present; returns (digest, written)."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            return digest, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(zlib.compress(data, 6))
+        os.replace(temp_path, path)  # Readers never see a partially written object
+        return digest, True
+
+    def get_object(self, digest):
+        with open(self.object_path(digest), "rb") as f:
+            return zlib.decompress(f.read())
+
+    def list_versions(self):
+        """Return the recorded versions, newest first."""
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path) as f:
+            versions = [json.loads(line) for line in f if line.strip()]
+        return versions[::-1]
+
+    def record(self, df, label="save"):
+        """Record a sheet as a new version unless it matches the latest one; returns the version entry or None."""
+        sheet = normalize_assignments(df)
+        blocks = []
+        written = 0
+        for (section, aisle, side), block in sheet.groupby(SIDE_COLUMNS, sort=False):
+            data = json.dumps({col: block[col].tolist() for col in BLOCK_COLUMNS}, separators=(",", ":")).encode("utf-8")
+            digest, is_new = self.put_object(data)
+            written += is_new
+            blocks.append([section, int(aisle), int(side), digest])
+        manifest = json.dumps({"blocks": blocks}, separators=(",", ":")).encode("utf-8")
+        version_id, _ = self.put_object(manifest)
+
+        versions = self.list_versions()
+        if versions and versions[0]["id"] == version_id:
+            print("History: sheet unchanged since the last version")
+            return None
+        entry = {"id": version_id, "time": time.time(), "label": label, "rows": len(sheet), "new_blocks": written}
+        with open(self.index_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"History: recorded version {version_id[:12]} ({written} of {len(blocks)} side blocks new)")
+        return entry
+
+    def read_manifest(self, version_id):
+        return json.loads(self.get_object(version_id))["blocks"]
+
+    def read_block(self, digest):
+        """Return a block's decoded columns, caching recently used blocks."""
+        columns = self.block_cache.get(digest)
+        if columns is None:
+            columns = json.loads(self.get_object(digest))
+            self.block_cache[digest] = columns
+            if len(self.block_cache) > HISTORY_BLOCK_CACHE_SIZE:
+                self.block_cache.popitem(last=False)
+        else:
+            self.block_cache.move_to_end(digest)
+        return columns
+
+    def block_frame(self, section, aisle, side, digest):
+        columns = self.read_block(digest)
+        frame = pd.DataFrame(columns, columns=BLOCK_COLUMNS)
+        frame.insert(0, 'Section', section)
+        frame.insert(1, 'Aisle', aisle)
+        frame.insert(2, 'Side', side)
+        return frame
+
+    def load_version(self, version_id):
+        """Rebuild a whole sheet from its blocks, ordered side by side."""
+        frames = [self.block_frame(*block) for block in self.read_manifest(version_id)]
+        if not frames:
+            return pd.DataFrame(columns=LOCATION_COLUMNS + ['Family', 'Category'])
+        return pd.concat(frames, ignore_index=True)
+
+    def load_side(self, version_id, section, aisle, side):
+        """Return one side of a version, or None if that version has no such side."""
+        for block_section, block_aisle, block_side, digest in self.read_manifest(version_id):
+            if (block_section, block_aisle, block_side) == (str(section), int(aisle), int(side)):
+                return self.block_frame(block_section, block_aisle, block_side, digest)
+        return None
@@ -0,0 +1,236 @@
+"""Tk-free geometry for the 3D shelf grid drawn in the Shelf View."""
+import math
+import numpy as np
+from constants import LABEL_FONT_BASE
+
+CANVAS_WIDTH_BASE = 1000
+CANVAS_HEIGHT_BASE = 600
+MAX_CELL_WIDTH_BASE = 60
+MAX_CELL_HEIGHT_BASE = 80
+MIN_FONT_SIZE = 6
+
+# Level-of-detail rules for zoomed-out or very wide sides
+LOD_MIN_LABEL_FONT = 7  # Category labels that would render smaller than this are hidden
+LOD_MIN_3D_CELL = 14  # Cells narrower than this many pixels are drawn flat, without top/right faces
+LOD_MIN_AXIS_LABEL_SPACING = 28  # Minimum pixels between level/shelf axis labels; others are skipped
+VIEWPORT_MARGIN = 0.5  # Fraction of the canvas materialized beyond each edge so short pans need no redraw
+
+
+def base_cell_size(max_level, max_shelf):
+    """Return the unscaled (cell_width, cell_height) for a side with the given dimensions."""
+    cell_width_base = min(CANVAS_WIDTH_BASE // max_shelf, MAX_CELL_WIDTH_BASE)
+    cell_height_base = min(CANVAS_HEIGHT_BASE // max_level, MAX_CELL_HEIGHT_BASE)
+    return cell_width_base, cell_height_base
+
+
+def grid_frame(max_level, max_shelf, canvas_width, canvas_height, scale_factor, aspect_ratio):
+    """Return (cell_width, cell_height, depth, offset_x, offset_y) of the grid centered on the canvas.
+
+    (offset_x, offset_y) is the top-left corner of the front face of the top-left cell, (max_level, 1).
+    """
+    cell_width_base, cell_height_base = base_cell_size(max_level, max_shelf)
+    cell_width = cell_width_base * scale_factor
+    cell_height = cell_height_base * scale_factor
+    if abs(cell_width / cell_height - aspect_ratio) > 0.01:
+        cell_height = cell_width / aspect_ratio
+
+    depth = 10 * scale_factor
+    label_space_left = 50 * scale_factor
+    label_space_top = 30 * scale_factor
+    total_width = max_shelf * cell_width + depth + label_space_left
+    total_height = max_level * cell_height + depth + label_space_top
+    offset_x = (canvas_width - total_width) // 2 + label_space_left
+    offset_y = (canvas_height - total_height) // 2 + label_space_top
+    return cell_width, cell_height, depth, offset_x, offset_y
+
+
+def index_range(offset, cell_size, count, low, high):
+    """Return the 0-based indices of the cells along one axis whose span overlaps [low, high]."""
+    if cell_size <= 0:
+        return range(count)
+    first = max(0, math.ceil((low - offset) / cell_size - 1))
+    last = min(count - 1, math.floor((high - offset) / cell_size))
+    return range(first, last + 1)
+
+
+def compute_grid_geometry(max_level, max_shelf, canvas_width, canvas_height, scale_factor, aspect_ratio, bounds=None):
+    """Compute cell rectangles, label positions and sizes for a max_level x max_shelf grid.
+
+    Cells are keyed by (level, shelf) and map to the (x1, y1, x2, y2) rectangle of
+    their front face; level 1 is drawn at the bottom. With bounds, only the cells
+    and axis labels of the levels and shelves overlapping them are computed, so
+    the cost follows what is in view rather than the size of the side.
+    """
+    cell_width, cell_height, depth, offset_x, offset_y = grid_frame(
+        max_level, max_shelf, canvas_width, canvas_height, scale_factor, aspect_ratio
+    )
+    label_font_size = max(int(LABEL_FONT_BASE * scale_factor), MIN_FONT_SIZE)
+    if bounds is None:
+        columns, rows = range(max_shelf), range(max_level)
+    else:
+        columns = index_range(offset_x, cell_width, max_shelf, bounds[0], bounds[2])
+        rows = index_range(offset_y, cell_height, max_level, bounds[1], bounds[3])
+
+    # Axis labels carry their 0-based index so thinning keeps the same labels wherever the range starts
+    shelf_labels = [
+        (column * cell_width + offset_x + cell_width / 2, offset_y - depth - 10 * scale_factor, f"S{column + 1}", column)
+        for column in columns
+    ]
+    level_labels = [
+        (offset_x - depth - 30 * scale_factor, row * cell_height + offset_y + cell_height / 2, f"L{max_level - row}", max_level - row - 1)
+        for row in rows
+    ]
+
+    cells = {}
+    for row in rows:
+        y1 = row * cell_height + offset_y
+        for column in columns:
+            x1 = column * cell_width + offset_x
+            cells[(max_level - row, column + 1)] = (x1, y1, x1 + cell_width, y1 + cell_height)
+
+    return {
+        "cell_width": cell_width,
+        "cell_height": cell_height,
+        "depth": depth,
+        "label_font_size": label_font_size,
+        "offset_x": offset_x,
+        "offset_y": offset_y,
+        "shelf_labels": shelf_labels,
+        "level_labels": level_labels,
+        "cells": cells,
+    }
+
+
+def viewport_bounds(canvas_width, canvas_height, margin=VIEWPORT_MARGIN, window_x=0, window_y=0):
+    """Return the (x1, y1, x2, y2) region to materialize: the canvas moved by (window_x, window_y), plus a margin on every side."""
+    margin_x = canvas_width * margin
+    margin_y = canvas_height * margin
+    return window_x - margin_x, window_y - margin_y, window_x + canvas_width + margin_x, window_y + canvas_height + margin_y
+
+
+def pan_window(canvas_width, canvas_height, pan_x, pan_y, margin=VIEWPORT_MARGIN):
+    """Return the unpanned region origin to lay out for a pan, snapped to steps of half the margin.
+
+    A panned view shows the unpanned layout's (-pan_x, -pan_y) region. Snapping
+    lets nearby pans share one layout; it is off by at most a quarter of the
+    margin, so the materialized region still covers the canvas.
+    """
+    step_x = canvas_width * margin / 2
+    step_y = canvas_height * margin / 2
+    window_x = round(-pan_x / step_x) * step_x if step_x > 0 else 0
+    window_y = round(-pan_y / step_y) * step_y if step_y > 0 else 0
+    return window_x, window_y
+
+
+def intersects(rect, bounds):
+    """Return True if an (x1, y1, x2, y2) rectangle overlaps the bounds."""
+    return rect[0] <= bounds[2] and rect[2] >= bounds[0] and rect[1] <= bounds[3] and rect[3] >= bounds[1]
+
+
+def visible_axis_labels(labels, cell_size, bounds):
+    """Thin (x, y, text, index) axis labels to at least LOD_MIN_AXIS_LABEL_SPACING apart and drop those outside the bounds."""
+    step = max(1, math.ceil(LOD_MIN_AXIS_LABEL_SPACING / cell_size)) if cell_size > 0 else 1
+    return [
+        (x, y, text) for x, y, text, index in labels
+        if index % step == 0 and bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+    ]
+
+
+def offset_rect(rect, dx, dy):
+    """Return an (x1, y1, x2, y2) rectangle shifted by (dx, dy) pixels."""
+    x1, y1, x2, y2 = rect
+    return x1 + dx, y1 + dy, x2 + dx, y2 + dy
+
+
+def offset_cells(cells, dx, dy):
+    """Return the cells shifted by (dx, dy) pixels."""
+    return {cell: (x1 + dx, y1 + dy, x2 + dx, y2 + dy) for cell, (x1, y1, x2, y2) in cells.items()}
+
+
+def label_readable(font_size, lines, cell_height):
+    """Return True if a fitted label is large enough to read and its lines fit the cell height."""
+    return font_size >= LOD_MIN_LABEL_FONT and len(lines) * font_size * 1.1 <= cell_height
+
+
+def bar_rect(x1, y1, x2, y2, depth):
+    """Return the (x1, y1, x2, y2) front face of the category bar drawn inside a cell."""
+    bar_height = (y2 - y1) * 0.4
+    bar_y1 = (y1 + y2) / 2 - bar_height / 2
+    return x1 + depth, bar_y1, x2 + depth, bar_y1 + bar_height
+
+
+def bar_runs(filtered_df):
+    """Run-length encode a side's assignments into bars spanning adjacent shelves.
+
+    Returns (level, first_shelf, last_shelf, family, category) for every run of
+    consecutive shelves on one level holding the same family and category.
+    Cells without a category are not drawn; the first row wins for duplicated cells.
+    """
+    cells = filtered_df[['Level', 'Shelf', 'Family', 'Category']].drop_duplicates(['Level', 'Shelf'])
+    family = cells['Family'].fillna("").astype(str).replace("nan", "").to_numpy()
+    category = cells['Category'].fillna("").astype(str).replace("nan", "").to_numpy()
+    assigned = category != ""
+    level = cells['Level'].to_numpy(dtype=np.int64)[assigned]
+    shelf = cells['Shelf'].to_numpy(dtype=np.int64)[assigned]
+    family = family[assigned]
+    category = category[assigned]
+    if len(level) == 0:
+        return []
+
+    order = np.lexsort((shelf, level))
+    level, shelf, family, category = level[order], shelf[order], family[order], category[order]
+    starts = np.ones(len(level), dtype=bool)
+    starts[1:] = (
+        (level[1:] != level[:-1]) |
+        (shelf[1:] != shelf[:-1] + 1) |
+        (family[1:] != family[:-1]) |
+        (category[1:] != category[:-1])
+    )
+    first = np.flatnonzero(starts)
+    last = np.append(first[1:], len(level)) - 1
+    return list(zip(level[first].tolist(), shelf[first].tolist(), shelf[last].tolist(), family[first].tolist(), category[first].tolist()))
+
+
+def wrap_lines(words, max_chars_per_line):
+    """Greedily wrap words into lines of at most max_chars_per_line characters."""
+    lines = []
+    current_line = []
+    current_char_count = 0
+    for word in words:
+        word_length = len(word)
+        space_needed = 1 if current_line else 0
+        if current_char_count + word_length + space_needed <= max_chars_per_line:
+            current_line.append(word)
+            current_char_count += word_length + space_needed
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_char_count = word_length
+    if current_line:
+        lines.append(" ".join(current_line))
+    return lines
+
+
+def fit_label(text, cell_width, cell_height):
+    """Return (font_size, lines) for a label wrapped to fit inside a cell.
+
+    The largest font that fits is found first and then reduced by 30% so labels
+    leave some breathing room around the bar.
+    """
+    max_width = cell_width - 20
+    max_height = cell_height - 20
+    words = text.split()
+
+    font_size = max(int(cell_width / 15), MIN_FONT_SIZE)
+    while True:
+        avg_char_width = font_size * 0.7
+        lines = wrap_lines(words, int(max_width / avg_char_width))
+        fits_width = all(len(line) * avg_char_width <= max_width for line in lines)
+        fits_height = len(lines) * font_size * 1.1 <= max_height
+        if (fits_width and fits_height) or font_size <= MIN_FONT_SIZE:
+            break
+        font_size -= 1
+
+    font_size = max(int(font_size * 0.7), MIN_FONT_SIZE)
+    return font_size, lines
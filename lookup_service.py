@@ -0,0 +1,221 @@
+"""Read-only HTTP/JSON shelf lookup service for handheld scanners.
+
+Runs headless on asyncio, without Tk:
+
+    python lookup_service.py [--host 127.0.0.1] [--port 8765] [--output-file PATH]
+
+Endpoints (GET, JSON responses):
+    /locate?family=F[&category=C]    shelves holding a family, optionally one category
+    /side?section=S&aisle=A&side=N   every shelf of one section/aisle/side
+    /health                          rows and load time of the served sheet
+
+Lookups are answered from an immutable, indexed snapshot of the assignment
+sheet. When the sheet is saved, a FileWatcher reloads it on its own thread and
+the new snapshot replaces the old one between requests.
+"""
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit, parse_qs
+from constants import OUTPUT_FILE, LOOKUP_HOST, LOOKUP_PORT, LOOKUP_RELOAD_POLL_S, LOOKUP_RESPONSE_CACHE_SIZE
+from file_watcher import FileWatcher
+from assignment_sheet import LOCATION_COLUMNS, read_sheet, normalize_assignments
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class LookupSnapshot:
+    """Lookup indexes built once from an assignment sheet; never modified after construction."""
+
+    def __init__(self, df, source=""):
+        self.source = source
+        self.loaded_at = time.time()
+        self.rows = len(df)
+        self.by_category = {}  # Maps (family, category), lowercased, to shelf records
+        self.by_family = {}  # Maps lowercased family to shelf records
+        self.by_side = {}  # Maps (section, aisle, side) to its shelf records sorted by level and shelf
+        self.responses = {}  # Maps a normalized lookup to its encoded (status, body)
+
+        assignments = normalize_assignments(df)
+        columns = [assignments[col] for col in LOCATION_COLUMNS + ['Family', 'Category']]
+        for section, aisle, side, level, shelf, family, category in zip(*columns):
+            # Plain ints, since json cannot encode numpy integers
+            record = {
+                "section": section, "aisle": int(aisle), "side": int(side),
+                "level": int(level), "shelf": int(shelf),
+                "family": family, "category": category,
+            }
+            self.by_side.setdefault((section, record["aisle"], record["side"]), []).append(record)
+            if not family and not category:
+                continue
+            self.by_category.setdefault((family.lower(), category.lower()), []).append(record)
+            self.by_family.setdefault(family.lower(), []).append(record)
+        for records in self.by_side.values():
+            records.sort(key=lambda record: (record["level"], record["shelf"]))
+        print(f"Built lookup snapshot: {self.rows} rows, {len(self.by_category)} family/category keys, {len(self.by_side)} sides")
+
+    @staticmethod
+    def location_key(record):
+        return (record["section"], record["aisle"], record["side"], record["level"], record["shelf"])
+
+    def locate(self, family, category=None):
+        """Return the shelf records holding a family (and category), matched case-insensitively."""
+        if category is None:
+            records = self.by_family.get(family.lower(), [])
+        else:
+            records = self.by_category.get((family.lower(), category.lower()), [])
+        return sorted(records, key=self.location_key)
+
+    def side(self, section, aisle, side):
+        """Return the shelf records of one section/aisle/side, or None if it does not exist."""
+        return self.by_side.get((section, aisle, side))
+
+
+def encode(status, payload):
+    return status, json.dumps(payload).encode("utf-8")
+
+
+class LookupService:
+    """Serve lookups over HTTP/1.1 with keep-alive from the current LookupSnapshot."""
+
+    def __init__(self, output_file=OUTPUT_FILE, host=LOOKUP_HOST, port=LOOKUP_PORT):
+        self.output_file = output_file
+        self.host = host
+        self.port = port
+        self.snapshot = self.load_snapshot(output_file)
+        self.watcher = FileWatcher({output_file: self.load_snapshot})
+        self.server = None
+
+    @staticmethod
+    def load_snapshot(path):
+        """Read a sheet and index it; runs on the watcher thread when reloading."""
+        return LookupSnapshot(read_sheet(path), source=path)
+
+    def respond(self, method, target):
+        """Return (status, body bytes) for a request; successful lookups are cached per snapshot."""
+        if method not in ("GET", "HEAD"):
+            return encode(405, {"error": f"Method {method} not allowed"})
+        snapshot = self.snapshot  # Use one snapshot for the whole request even if a reload lands
+        url = urlsplit(target)
+        query = {key: values[0].strip() for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/health":
+            return encode(200, {"rows": snapshot.rows, "source": snapshot.source, "loaded_at": snapshot.loaded_at})
+
+        if url.path == "/locate":
+            family = query.get("family")
+            if not family:
+                return encode(400, {"error": "Missing 'family' parameter"})
+            category = query.get("category") or None
+            cache_key = ("locate", family.lower(), category.lower() if category else None)
+            response = snapshot.responses.get(cache_key)
+            if response is None:
+                records = snapshot.locate(family, category)
+                response = encode(200, {"family": family, "category": category, "count": len(records), "shelves": records})
+                self.cache_response(snapshot, cache_key, response)
+            return response
+
+        if url.path == "/side":
+            try:
+                key = (query["section"], int(query["aisle"]), int(query["side"]))
+            except (KeyError, ValueError):
+                return encode(400, {"error": "Parameters 'section', 'aisle' and integer 'side' are required"})
+            cache_key = ("side",) + key
+            response = snapshot.responses.get(cache_key)
+            if response is None:
+                records = snapshot.side(*key)
+                if records is None:
+                    return encode(404, {"error": f"No shelves for Section {key[0]}, Aisle {key[1]}, Side {key[2]}"})
+                response = encode(200, {"section": key[0], "aisle": key[1], "side": key[2], "shelves": records})
+                self.cache_response(snapshot, cache_key, response)
+            return response
+
+        return encode(404, {"error": f"Unknown path {url.path}"})
+
+    @staticmethod
+    def cache_response(snapshot, key, response):
+        # Unknown families are cached too, so bound the cache against arbitrary queries
+        if len(snapshot.responses) >= LOOKUP_RESPONSE_CACHE_SIZE:
+            snapshot.responses.clear()
+        snapshot.responses[key] = response
+
+    async def handle_connection(self, reader, writer):
+        """Answer requests on one connection until the client closes it or asks not to keep it alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip().lower()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+
+                if len(parts) != 3:
+                    status, body = encode(400, {"error": "Malformed request line"})
+                    method, version = "GET", "HTTP/1.0"
+                else:
+                    method, target, version = parts
+                    status, body = self.respond(method, target)
+                connection = headers.get("connection", "")
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                head = (
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode("latin-1")
+                writer.write(head if method == "HEAD" else head + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def apply_reloads(self):
+        """Swap in snapshots reloaded by the watcher thread after the sheet was saved."""
+        while True:
+            await asyncio.sleep(LOOKUP_RELOAD_POLL_S)
+            while not self.watcher.results.empty():
+                path, snapshot = self.watcher.results.get_nowait()
+                self.snapshot = snapshot
+                print(f"Reloaded {path}; now serving {snapshot.rows} rows")
+
+    async def serve(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.watcher.start()
+        reloads = asyncio.ensure_future(self.apply_reloads())
+        print(f"Shelf lookup service listening on http://{self.host}:{self.port}")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            reloads.cancel()
+            self.watcher.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only shelf lookup service")
+    parser.add_argument("--host", default=LOOKUP_HOST)
+    parser.add_argument("--port", type=int, default=LOOKUP_PORT)
+    parser.add_argument("--output-file", default=OUTPUT_FILE, help="Shelf assignment sheet to serve")
+    args = parser.parse_args()
+    service = LookupService(args.output_file, args.host, args.port)
+    try:
+        asyncio.run(service.serve())
+    except KeyboardInterrupt:
+        print("Shelf lookup service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,87 @@
+import time
+_IMPORT_START = time.perf_counter()
+import argparse
 import tkinter as tk
 import os
 from model import ShelfModel
 from view.view import ShelfView
 from controller import ShelfController
 from constants import FAMILY_FILE, OUTPUT_FILE
+from startup_timing import startup_timer
+from tracing import tracer
+from workspace import StoreWorkspace
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Shelf Assignment Editor")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="Print a per-phase startup timing report (imports, structure, catalog, sheet, UI build)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Record tracing spans for the whole session and export them as Chrome trace JSON on exit")
+    parser.add_argument("--workspace", metavar="DIR",
+                        help="Edit many stores: DIR holds one subdirectory per store with its own data files")
+    return parser.parse_args()
 
 def main():
-    if not os.path.exists(FAMILY_FILE):
+    args = parse_args()
+    startup_timer.enabled = args.startup_timing
+    startup_timer.record("imports", _IMPORT_SECONDS)
+    tracer.enabled = bool(args.trace)
+
+    workspace = None
+    if args.workspace:
+        workspace = StoreWorkspace(args.workspace)
+        if not workspace.get_store_names():
+            print(f"No stores found in workspace: {args.workspace}")
+            return
+    elif not os.path.exists(FAMILY_FILE):
         print(f"Family file not found: {FAMILY_FILE}")
         return
-    
+
     root = tk.Tk()
     try:
-        model = ShelfModel()
+        if workspace is not None:
+            workspace.current = workspace.get_store_names()[0]
+            model = workspace.load_store(workspace.current)
+        else:
+            model = ShelfModel()
         # Check if OUTPUT_FILE exists; if not, generate it
-        if not os.path.exists(OUTPUT_FILE):
+        if model.df is None:
             print(f"Output file not found: {OUTPUT_FILE}. Generating a new one...")
-            success, message = model.generate_shelf_assignment()
+            with startup_timer.phase("sheet generation"):
+                success, message = model.generate_shelf_assignment()
             if not success:
                 print(f"Failed to generate output file: {message}")
                 root.destroy()
                 return
             print(f"Output file generated: {OUTPUT_FILE}")
-        
-        controller = ShelfController(root, model, None)
-        view = ShelfView(root, controller)
-        controller.view = view
-        controller.set_ui_ready()
-        # Initialize the dropdowns (keeping Section, Aisle, Side empty)
-        view.initialize_dropdowns()
-        # Draw the initial empty shelf view
-        controller.update_shelf_view()
+
+        with startup_timer.phase("UI build"):
+            controller = ShelfController(root, model, None, workspace)
+            view = ShelfView(root, controller)
+            controller.view = view
+            controller.set_ui_ready()
+            # Initialize the dropdowns (keeping Section, Aisle, Side empty)
+            view.initialize_dropdowns()
+            # Draw the initial empty shelf view
+            controller.update_shelf_view()
+            root.update_idletasks()
+        controller.start_file_watcher()
+        if workspace is not None:
+            view.set_store_status(workspace.current)
+            controller.poll_store_loads()
         print("ShelfController instance created")
+        if startup_timer.enabled:
+            print(startup_timer.report())
         root.mainloop()
+        controller.stop_file_watcher()
+        if workspace is not None:
+            workspace.shutdown()
+        if args.trace:
+            tracer.export_chrome_trace(args.trace)
     except Exception as e:
         print(f"Failed to initialize application: {str(e)}")
         root.destroy()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
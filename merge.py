@@ -0,0 +1,129 @@
+"""Three-way merge of assignment sheets edited separately from a common ancestor.
+
+    python merge.py base.xlsx ours.xlsx theirs.xlsx -o merged.xlsx [--conflicts conflicts.csv] [--prefer theirs]
+
+Cells changed on only one side take that side's value; cells changed on both
+sides to different values are conflicts and keep the preferred side's value.
+The exit status is 1 when conflicts remain.
+"""
+import argparse
+import sys
+import numpy as np
+from assignment_sheet import LOCATION_COLUMNS, read_sheet, normalize_assignments
+from sheet_writer import write_assignment_sheet
+
+UNCHANGED = "unchanged"
+OURS = "ours"
+THEIRS = "theirs"
+CONFLICT = "conflict"
+
+
+def three_way_merge(base_df, ours_df, theirs_df, prefer=OURS):
+    """Merge two edited sheets against their common ancestor with joins on the location key.
+
+    Returns one row per location in either edited sheet with the merged
+    Family/Category, each version's values (suffixes _base, _ours, _theirs)
+    and 'source': unchanged, ours, theirs or conflict.
+    """
+    base, ours, theirs = (
+        normalize_assignments(df).drop_duplicates(LOCATION_COLUMNS).set_index(LOCATION_COLUMNS).add_suffix(suffix)
+        for df, suffix in ((base_df, "_base"), (ours_df, "_ours"), (theirs_df, "_theirs"))
+    )
+    merged = ours.join(theirs, how='outer').join(base, how='left').fillna("").reset_index()
+
+    def changed(suffix, other):
+        return ((merged['Family' + suffix] != merged['Family' + other]) |
+                (merged['Category' + suffix] != merged['Category' + other])).to_numpy()
+
+    ours_changed = changed("_ours", "_base")
+    theirs_changed = changed("_theirs", "_base")
+    conflict = ours_changed & theirs_changed & changed("_ours", "_theirs")
+    take_theirs = (theirs_changed & ~ours_changed) | (conflict & (prefer == THEIRS))
+    for col in ['Family', 'Category']:
+        merged[col] = np.where(take_theirs, merged[col + '_theirs'], merged[col + '_ours'])
+    merged['source'] = np.select(
+        [conflict, theirs_changed & ~ours_changed, ours_changed],
+        [CONFLICT, THEIRS, OURS],
+        default=UNCHANGED,
+    )
+    return merged.sort_values(LOCATION_COLUMNS).reset_index(drop=True)
+
+
+class ConflictList:
+    """Merge conflicts awaiting resolution, indexed by side for the Shelf View overlay."""
+
+    def __init__(self, conflicts, undo_entry=None):
+        self.conflicts = conflicts.reset_index(drop=True)
+        self.undo_entry = undo_entry  # The merge's entry on the model's undo stack, if it applied anything
+        self.by_side = {}
+        self.build_index()
+
+    def build_index(self):
+        """Index the incoming values by side; the current value is read from the model when drawing."""
+        self.by_side = {}
+        columns = [self.conflicts[col] for col in LOCATION_COLUMNS + ['Family_theirs', 'Category_theirs']]
+        for section, aisle, side, level, shelf, family_theirs, category_theirs in zip(*columns):
+            self.by_side.setdefault((section, int(aisle), int(side)), {})[(int(level), int(shelf))] = (
+                f"{family_theirs} / {category_theirs}".strip(" /")
+            )
+
+    def side_conflicts(self, section, aisle, side, location_keys):
+        """Return {(level, shelf): (CONFLICT, yours, theirs)} for one side, with yours from the model's location_keys."""
+        section, aisle, side = str(section), int(aisle), int(side)
+        cells = {}
+        for (level, shelf), theirs in self.by_side.get((section, aisle, side), {}).items():
+            yours = " / ".join(location_keys.get((section, aisle, side, level, shelf), ())).strip(" /")
+            cells[(level, shelf)] = (CONFLICT, yours, theirs)
+        return cells
+
+    def resolve(self, positions):
+        """Drop resolved conflicts by position in `conflicts`; returns the removed rows."""
+        resolved = self.conflicts.iloc[positions]
+        self.conflicts = self.conflicts.drop(self.conflicts.index[positions]).reset_index(drop=True)
+        self.build_index()
+        return resolved
+
+    def drop_locations(self, locations):
+        """Drop conflicts at (section, aisle, side, level, shelf) locations edited since the merge; returns how many."""
+        locations = set(locations)
+        keys = zip(*(self.conflicts[col].tolist() for col in LOCATION_COLUMNS))
+        edited = np.fromiter((key in locations for key in keys), dtype=bool, count=len(self.conflicts))
+        if not edited.any():
+            return 0
+        self.conflicts = self.conflicts[~edited].reset_index(drop=True)
+        self.build_index()
+        return int(edited.sum())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Three-way merge of shelf assignment sheets")
+    parser.add_argument("base", help="Common ancestor sheet")
+    parser.add_argument("ours", help="First edited sheet")
+    parser.add_argument("theirs", help="Second edited sheet")
+    parser.add_argument("-o", "--output", required=True, help="Merged sheet to write (.xlsx)")
+    parser.add_argument("--conflicts", help="Write conflicting cells to this CSV")
+    parser.add_argument("--prefer", choices=[OURS, THEIRS], default=OURS, help="Value kept for conflicting cells")
+    args = parser.parse_args(argv)
+
+    try:
+        base_df, ours_df, theirs_df = (read_sheet(path) for path in (args.base, args.ours, args.theirs))
+    except Exception as e:
+        print(f"Failed to read sheets: {str(e)}")
+        return 2
+
+    merged = three_way_merge(base_df, ours_df, theirs_df, args.prefer)
+    counts = merged['source'].value_counts()
+    print(f"Merged {len(merged)} shelves: {counts.get(OURS, 0)} from ours, {counts.get(THEIRS, 0)} from theirs, "
+          f"{counts.get(CONFLICT, 0)} conflicts (kept {args.prefer})")
+    write_assignment_sheet(merged[LOCATION_COLUMNS + ['Family', 'Category']], args.output)
+    print(f"Merged sheet written to {args.output}")
+
+    conflicts = merged[merged['source'] == CONFLICT]
+    if args.conflicts and not conflicts.empty:
+        conflicts.drop(columns=['source']).to_csv(args.conflicts, index=False)
+        print(f"Conflicts written to {args.conflicts}")
+    return 1 if not conflicts.empty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,57 +1,139 @@
+import numpy as np
 import pandas as pd
 import os
-from constants import FAMILY_FILE, SHELF_INFO_FILE, OUTPUT_FILE
+from constants import FAMILY_FILE, SHELF_INFO_FILE, OUTPUT_FILE, UNDO_LIMIT
+from typeahead import Typeahead
+from color_map import ColorMap, color_map_path_for
+from sheet_writer import write_assignment_sheet
+from startup_timing import startup_timer
+from tracing import tracer
+from events import CellsAssigned, CellsCleared, StructureRegenerated, DataReloaded, CatalogUpdated
+from assignment_sheet import LOCATION_COLUMNS, read_sheet, normalize_assignments
+from validation import validate_assignments, issue_counts, fix_assignments
+from history import HistoryStore, history_dir_for
+from merge import three_way_merge, THEIRS, CONFLICT
+
+
+def clean_text(value):
+    """Return a cell value as a string, mapping NaN/None to an empty string."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    value = str(value)
+    return "" if value == "nan" else value
+
+
+def read_shelf_structure(path):
+    """Read the shelf information Excel file into a dict mapping section to its configuration."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Shelf information file not found: {path}")
+    
+    # Read the shelf information Excel file
+    # Assuming the first sheet contains the shelf structure with columns:
+    # section, aisles, sides, levels max, shelves max
+    df = pd.read_excel(path, sheet_name=0)
+    
+    # Clean column names (remove spaces, convert to lowercase)
+    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    
+    # Required columns
+    required_columns = ['section', 'aisles', 'sides', 'levels_max', 'shelves_max']
+    if not all(col in df.columns for col in required_columns):
+        missing = [col for col in required_columns if col not in df.columns]
+        raise ValueError(f"Shelf information Excel file missing required columns: {missing}")
+    
+    # Convert section to string and other columns to integers
+    df['section'] = df['section'].astype(str)
+    for col in ['aisles', 'sides', 'levels_max', 'shelves_max']:
+        df[col] = df[col].astype(int)
+    
+    structure = {}
+    for _, row in df.iterrows():
+        structure[row['section']] = {
+            "aisles": row['aisles'],
+            "sides": row['sides'],
+            "max_levels": row['levels_max'],
+            "max_shelves": row['shelves_max']
+        }
+    return structure
+
+
+def read_catalog(path):
+    """Read the family information workbook into (families, {family: categories})."""
+    families = []
+    categories = {}
+    # Read family information to get families and categories
+    xls = pd.ExcelFile(path)
+    for sheet_name in xls.sheet_names:
+        df = pd.read_excel(xls, sheet_name=sheet_name)
+        print(f"\nReading sheet: {sheet_name}")
+        print(f"First few rows of the sheet:\n{df.head()}")
+        
+        # Read family name from cell A2 (row 2 in Excel, index 0 in pandas)
+        family_row = 0
+        family = str(df.iloc[family_row, 0]) if not pd.isna(df.iloc[family_row, 0]) else ""
+        print(f"Family in cell A2 (row 2, index {family_row}): {family}")
+        
+        if family:
+            category_row = family_row
+            family_categories = df.iloc[category_row, 1:].dropna().tolist()
+            print(f"Raw categories in row 2 (B2 onward, index {category_row}): {family_categories}")
+            family_categories = [str(cat) for cat in family_categories]
+            print(f"Categories after converting to strings: {family_categories}")
+            
+            families.append(family)
+            categories[family] = family_categories
+    return families, categories
+
+
+def structure_sheet(shelf_structure):
+    """Return an empty assignment sheet with one row per shelf of the structure, in Section/Aisle/Side/Level/Shelf order."""
+    frames = []
+    for section, config in shelf_structure.items():
+        dims = (config["aisles"], config["sides"], config["max_levels"], config["max_shelves"])
+        grid = np.indices(dims).reshape(4, -1) + 1
+        frames.append(pd.DataFrame({'Section': section, 'Aisle': grid[0], 'Side': grid[1], 'Level': grid[2], 'Shelf': grid[3]}))
+    sheet = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=LOCATION_COLUMNS)
+    sheet['Family'] = ""
+    sheet['Category'] = ""
+    return sheet
+
 
 class ShelfModel:
-    def __init__(self):
+    def __init__(self, family_file=FAMILY_FILE, shelf_info_file=SHELF_INFO_FILE, output_file=OUTPUT_FILE):
+        self.family_file = family_file
+        self.shelf_info_file = shelf_info_file
+        self.output_file = output_file
         self.df = None
         self.families = []
         self.categories = {}  # Maps family to list of categories
         self.shelf_structure = {}  # Maps section to its configuration
         self.sections = []  # List of sections
-        self.load_shelf_structure()  # Load shelf structure first
+        self.location_index = {}  # Maps (family, category) to set of (section, aisle, side, level, shelf)
+        self.location_keys = {}  # Maps (section, aisle, side, level, shelf) to its (family, category)
+        self.family_index = {}  # Maps family to the set of its categories present in location_index
+        self.family_typeahead = Typeahead([])
+        self.category_typeaheads = {}  # Maps family to the Typeahead over its categories
+        self.subscribers = []  # Callbacks receiving ModelEvent instances
+        self.dirty_locations = set()  # Locations edited since the last load or save
+        self.undo_stack = []  # (label, previous 'row'/'Family'/'Category' values) for undoable bulk edits
+        self.validation_issues = None  # Catalog consistency issues found by the last validate()
+        self.history = None  # HistoryStore recording a version on every save, created on first use
+        self.color_map = ColorMap.load(color_map_path_for(output_file))  # Colors of family/category pairs, stable across sessions
+        self.color_map_dirty = False  # Pairs were added in memory that save_data has not written yet
+        with startup_timer.phase("structure load"):
+            self.load_shelf_structure()  # Load shelf structure first
         self.load_data()
 
     def load_shelf_structure(self):
         """Load the shelf structure from the shelf information Excel file."""
         try:
-            if not os.path.exists(SHELF_INFO_FILE):
-                raise FileNotFoundError(f"Shelf information file not found: {SHELF_INFO_FILE}")
-            
-            # Read the shelf information Excel file
-            # Assuming the first sheet contains the shelf structure with columns:
-            # section, aisles, sides, levels max, shelves max
-            df = pd.read_excel(SHELF_INFO_FILE, sheet_name=0)
-            
-            # Clean column names (remove spaces, convert to lowercase)
-            df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-            
-            # Required columns
-            required_columns = ['section', 'aisles', 'sides', 'levels_max', 'shelves_max']
-            if not all(col in df.columns for col in required_columns):
-                missing = [col for col in required_columns if col not in df.columns]
-                raise ValueError(f"Shelf information Excel file missing required columns: {missing}")
-            
-            # Convert section to string and other columns to integers
-            df['section'] = df['section'].astype(str)
-            for col in ['aisles', 'sides', 'levels_max', 'shelves_max']:
-                df[col] = df[col].astype(int)
-            
-            # Populate shelf_structure dictionary
-            for _, row in df.iterrows():
-                section = row['section']
-                self.shelf_structure[section] = {
-                    "aisles": row['aisles'],
-                    "sides": row['sides'],
-                    "max_levels": row['levels_max'],
-                    "max_shelves": row['shelves_max']
-                }
-            
-            # Populate sections list
-            self.sections = list(self.shelf_structure.keys())
+            structure = read_shelf_structure(self.shelf_info_file)
+            # Update in place so views holding references see the new structure
+            self.shelf_structure.clear()
+            self.shelf_structure.update(structure)
+            self.sections[:] = list(self.shelf_structure.keys())
             print(f"Loaded shelf structure: {self.shelf_structure}")
             print(f"Sections: {self.sections}")
-            
         except Exception as e:
             print(f"Error loading shelf structure: {str(e)}")
             raise
@@ -59,69 +141,307 @@ class ShelfModel:
     def load_data(self):
         """Load data from the Excel files."""
         try:
-            # Read the output file if it exists
-            if os.path.exists(OUTPUT_FILE):
-                self.df = pd.read_excel(OUTPUT_FILE)
-                print(f"Read output file. Rows: {len(self.df)}")
-                print(f"Columns in output file: {list(self.df.columns)}")
-            else:
-                # If the file doesn't exist, set df to None; it will be generated later
-                self.df = None
-                print(f"Output file {OUTPUT_FILE} does not exist. It will be generated if needed.")
-            
-            # Read family information to get families and categories
-            xls = pd.ExcelFile(FAMILY_FILE)
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(FAMILY_FILE, sheet_name=sheet_name)
-                print(f"\nReading sheet: {sheet_name}")
-                print(f"First few rows of the sheet:\n{df.head()}")
-                
-                # Read family name from cell A2 (row 2 in Excel, index 0 in pandas)
-                family_row = 0
-                family = str(df.iloc[family_row, 0]) if not pd.isna(df.iloc[family_row, 0]) else ""
-                print(f"Family in cell A2 (row 2, index {family_row}): {family}")
-                
-                if family:
-                    category_row = family_row
-                    categories = df.iloc[category_row, 1:].dropna().tolist()
-                    print(f"Raw categories in row 2 (B2 onward, index {category_row}): {categories}")
-                    categories = [str(cat) for cat in categories]
-                    print(f"Categories after converting to strings: {categories}")
-                    
-                    self.families.append(family)
-                    self.categories[family] = categories
-            print(f"\nFamilies loaded: {self.families}")
-            print(f"Categories loaded: {self.categories}")
-            
-            # Ensure Family and Category columns exist if df is loaded
-            if self.df is not None:
-                if 'Family' not in self.df.columns:
-                    self.df['Family'] = ""
-                if 'Category' not in self.df.columns:
-                    self.df['Category'] = ""
+            with startup_timer.phase("sheet load"):
+                self.load_sheet()
+            with startup_timer.phase("catalog load"):
+                self.load_catalog()
+            with startup_timer.phase("validation"):
+                self.validate()
+            self.publish(DataReloaded())
         except Exception as e:
             print(f"Error loading data: {str(e)}")
             raise
 
+    def load_sheet(self):
+        """Load the shelf assignment sheet from the output file."""
+        # Read the output file if it exists
+        if os.path.exists(self.output_file):
+            self.df = read_sheet(self.output_file)
+        else:
+            # If the file doesn't exist, set df to None; it will be generated later
+            self.df = None
+            print(f"Output file {self.output_file} does not exist. It will be generated if needed.")
+        self.dirty_locations.clear()
+        self.undo_stack.clear()
+        self.build_location_index()
+
+    def load_catalog(self):
+        """Load families and their categories from the family information file."""
+        families, categories = read_catalog(self.family_file)
+        self.set_catalog(families, categories)
+
+    def set_catalog(self, families, categories):
+        """Replace the family/category catalog in place and rebuild its typeahead indexes."""
+        self.families[:] = families
+        self.categories.clear()
+        self.categories.update(categories)
+        print(f"\nFamilies loaded: {self.families}")
+        print(f"Categories loaded: {self.categories}")
+        self.build_typeaheads()
+        self.update_color_map()
+
+    def update_color_map(self):
+        """Give catalog and sheet family/category pairs without a color one; the map is written by save_color_map."""
+        pairs = [(family, category) for family, categories in self.categories.items() for category in categories]
+        if self.df is not None:
+            assigned = self.df[['Family', 'Category']].fillna("").astype(str).drop_duplicates()
+            assigned = assigned[(assigned['Category'] != "") & (assigned['Category'] != "nan")]
+            pairs.extend(zip(assigned['Family'], assigned['Category']))
+        if self.color_map.update(pairs):
+            self.color_map_dirty = True
+
+    def save_color_map(self):
+        """Write the color map next to the output file if pairs were added since it was loaded or last saved."""
+        if not self.color_map_dirty:
+            return
+        try:
+            self.color_map.save(color_map_path_for(self.output_file))
+            self.color_map_dirty = False
+            print(f"Color map now covers {len(self.color_map.indices)} family/category pairs")
+        except Exception as e:
+            print(f"Error saving color map: {str(e)}")
+
+    def subscribe(self, callback):
+        """Register a callback to receive ModelEvent instances after each change."""
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop sending change events to a callback."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def publish(self, event):
+        """Send a change event to every subscriber."""
+        print(f"Publishing {event}")
+        for callback in list(self.subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in change event subscriber {callback}: {str(e)}")
+
     def save_data(self):
         """Save the updated data back to the Excel file."""
+        with tracer.span("save_data"):
+            try:
+                self.validate()
+                self.update_color_map()
+                write_assignment_sheet(self.df, self.output_file)
+                self.save_color_map()
+                self.dirty_locations.clear()
+                print(f"Updated data saved to: {self.output_file}")
+                self.record_history("save")
+                return True, f"Data saved successfully to {self.output_file}"
+            except Exception as e:
+                print(f"Error saving data: {str(e)}")
+                return False, f"Error saving data: {str(e)}"
+
+    def get_history(self):
+        """Return the version history store kept next to the output file."""
+        if self.history is None:
+            self.history = HistoryStore(history_dir_for(self.output_file))
+        return self.history
+
+    def record_history(self, label):
+        """Record the current sheet in the version history; a failure never fails the save."""
+        with tracer.span("record_history"):
+            try:
+                self.get_history().record(self.df, label)
+            except Exception as e:
+                print(f"Error recording history: {str(e)}")
+
+    def restore_version(self, version_id):
+        """Load a past version into the editor; undoable when it covers the same shelves."""
         try:
-            self.df.to_excel(OUTPUT_FILE, index=False)
-            print(f"Updated data saved to: {OUTPUT_FILE}")
-            return True, f"Data saved successfully to {OUTPUT_FILE}"
+            old_df = self.get_history().load_version(version_id)
         except Exception as e:
-            print(f"Error saving data: {str(e)}")
-            return False, f"Error saving data: {str(e)}"
+            return False, f"Error reading version {version_id[:12]}: {str(e)}"
+        changed = self.diff_sheet(old_df) if self.df is not None else None
+        if changed is None:
+            # Different set of shelves, so the version replaces the sheet outright
+            self.replace_sheet(old_df)
+            self.dirty_locations.update(self.location_keys)
+            return True, f"Restored version {version_id[:12]} ({len(old_df)} shelves). Save to keep it."
+        writes = pd.DataFrame({'row': changed['row'], 'Family': changed['Family_new'], 'Category': changed['Category_new']})
+        restored = self.apply_assignments(writes, undo_label=f"restore of version {version_id[:12]}")
+        return True, f"Restored version {version_id[:12]}: {restored} shelves changed. Save to keep it."
+
+    def merge_versions(self, base_df, theirs_df):
+        """Three-way merge another edited copy into the model against their common ancestor.
+
+        Cells changed only in the other copy are applied as one undoable edit.
+        Returns (applied count, conflicts DataFrame from merge.three_way_merge).
+        """
+        with tracer.span("merge_versions"):
+            merged = three_way_merge(base_df, self.df, theirs_df)
+            incoming = merged[merged['source'] == THEIRS].merge(self.location_rows(), on=LOCATION_COLUMNS, how='inner')
+            applied = self.apply_assignments(incoming[['row', 'Family', 'Category']], undo_label="merge")
+            conflicts = merged[merged['source'] == CONFLICT]
+        print(f"Merged {applied} incoming changes; {len(conflicts)} conflicts")
+        return applied, conflicts
+
+    def location_rows(self):
+        """Return the location columns with each location's DataFrame row label in 'row'."""
+        return normalize_assignments(self.df)[LOCATION_COLUMNS].rename_axis('row').reset_index()
 
     def apply_selection(self, selected_cells, section, aisle, side, family, category):
         """Apply the selected Family and Category to the selected shelves in the DataFrame."""
-        if not section or not aisle or not side or not family or not category:
-            return False, "Please select all dropdown values."
+        with tracer.span("apply_selection", cells=len(selected_cells)):
+            if not section or not aisle or not side or not family or not category:
+                return False, "Please select all dropdown values."
         
-        if not selected_cells:
-            return False, "Please select at least one shelf in the grid."
+            if not selected_cells:
+                return False, "Please select at least one shelf in the grid."
         
+            self.widen_assignment_columns()
+            updated_rows = 0
+            locations = []
+            rows = []
+            for level, shelf in selected_cells:
+                mask = (
+                    (self.df['Section'] == section) &
+                    (self.df['Aisle'] == int(aisle)) &
+                    (self.df['Side'] == int(side)) &
+                    (self.df['Level'] == level) &
+                    (self.df['Shelf'] == shelf)
+                )
+                row_idx = self.df.index[mask]
+                if not row_idx.empty:
+                    row_idx = row_idx[0]
+                    self.df.at[row_idx, 'Family'] = family
+                    self.df.at[row_idx, 'Category'] = category
+                    location = (section, int(aisle), int(side), level, shelf)
+                    self.index_location(location, family, category)
+                    locations.append(location)
+                    rows.append(row_idx)
+                    updated_rows += 1
+                    print(f"Updated row {row_idx}: Family={family}, Category={category}")
+            print(f"Applied Family: {family}, Category: {category} to {updated_rows} shelves")
+            if locations:
+                self.dirty_locations.update(locations)
+                self.publish(CellsAssigned(locations, rows))
+            return True, f"Family and Category values applied to {updated_rows} shelves."
+
+    def apply_assignments(self, assignments, undo_label=None):
+        """Write many Family/Category values at once from a DataFrame with 'row', 'Family' and 'Category' columns.
+
+        With an undo_label, the previous values are pushed on the undo stack.
+        """
+        with tracer.span("apply_assignments", cells=len(assignments)):
+            if assignments.empty:
+                return 0
+            rows = assignments['row'].tolist()
+            if undo_label is not None:
+                previous = normalize_assignments(self.df.loc[rows])[['Family', 'Category']].rename_axis('row').reset_index()
+                self.undo_stack.append((undo_label, previous))
+                del self.undo_stack[:-UNDO_LIMIT]
+            self.widen_assignment_columns()
+            for col in ['Family', 'Category']:
+                self.df.loc[rows, col] = assignments[col].values
+            keys = normalize_assignments(self.df.loc[rows])
+            locations = list(zip(*(keys[col].tolist() for col in LOCATION_COLUMNS)))
+            if len(rows) > len(self.df) // 4:
+                self.build_location_index()
+            else:
+                for location, family, category in zip(locations, keys['Family'], keys['Category']):
+                    self.index_location(location, family, category)
+            self.dirty_locations.update(locations)
+            print(f"Applied {len(rows)} bulk assignments")
+            self.publish(CellsAssigned(locations, rows))
+            return len(rows)
+
+    def widen_assignment_columns(self):
+        """Make Family and Category object columns; pandas reads an all-blank column as float64, which rejects text."""
+        for col in ['Family', 'Category']:
+            if self.df[col].dtype != object:
+                self.df[col] = self.df[col].astype(object)
+
+    def validate(self, include_incomplete=False):
+        """Check every row against the catalog and keep the issues in validation_issues.
+
+        Shelves with a family but no category yet are only reported with include_incomplete.
+        """
+        with tracer.span("validate"):
+            if self.df is None:
+                self.validation_issues = None
+                return None
+            self.validation_issues = validate_assignments(self.df, self.families, self.categories, include_incomplete)
+        if not self.validation_issues.empty:
+            print(f"Catalog validation found {len(self.validation_issues)} issues: {issue_counts(self.validation_issues)}")
+        return self.validation_issues
+
+    def apply_validation_fixes(self, mode, include_incomplete=False):
+        """Bulk-fix the validation issues ("suggested" or "clear"); the edit is undoable."""
+        issues = self.validate(include_incomplete)
+        if issues is None or issues.empty:
+            return False, "No catalog issues to fix."
+        writes = fix_assignments(issues, mode)
+        if writes.empty:
+            return False, "None of the issues has a suggested fix."
+        fixed = self.apply_assignments(writes, undo_label="catalog fixes")
+        remaining = len(self.validate(include_incomplete))
+        return True, f"Fixed {fixed} shelves; {remaining} issues remain."
+
+    def undo(self):
+        """Restore the values overwritten by the most recent undoable bulk edit."""
+        if not self.undo_stack:
+            return False, "Nothing to undo."
+        label, previous = self.undo_stack.pop()
+        restored = self.apply_assignments(previous)
+        return True, f"Undid {label}: restored {restored} shelves."
+
+    def replicate_layout(self, source, targets):
+        """Stamp the Family/Category block of one (section, aisle, side) onto target sides in one merge.
+
+        Target shelves outside the source block keep their values; source shelves
+        beyond a target's levels or shelves are clipped. The edit is undoable.
+        """
+        with tracer.span("replicate_layout", targets=len(targets)):
+            section, aisle, side = str(source[0]), int(source[1]), int(source[2])
+            sheet = normalize_assignments(self.df).rename_axis('row').reset_index()
+            block = sheet[
+                (sheet['Section'] == section) & (sheet['Aisle'] == aisle) & (sheet['Side'] == side)
+            ][['Level', 'Shelf', 'Family', 'Category']]
+            if block.empty:
+                return False, f"No shelves found for Section {section}, Aisle {aisle}, Side {side}."
+            
+            target_frame = pd.DataFrame(list(targets), columns=['Section', 'Aisle', 'Side'])
+            target_frame = target_frame.astype({'Section': str, 'Aisle': int, 'Side': int}).drop_duplicates()
+            target_frame = target_frame[~(
+                (target_frame['Section'] == section) & (target_frame['Aisle'] == aisle) & (target_frame['Side'] == side)
+            )]
+            if target_frame.empty:
+                return False, "Please choose at least one target other than the source side."
+            
+            stamped = target_frame.merge(block, how='cross')
+            matched = stamped.merge(sheet, on=LOCATION_COLUMNS, how='inner', suffixes=('', '_old'))
+            changed = matched[(matched['Family'] != matched['Family_old']) | (matched['Category'] != matched['Category_old'])]
+            clipped = len(stamped) - len(matched)
+            self.apply_assignments(changed[['row', 'Family', 'Category']], undo_label=f"layout copy from {section}-{aisle}-{side}")
+            print(f"Replicated {section}-{aisle}-{side} to {len(target_frame)} sides: {len(changed)} changed, {clipped} clipped")
+            return True, (f"Copied the layout of Section {section}, Aisle {aisle}, Side {side} to {len(target_frame)} sides: "
+                          f"{len(changed)} shelves changed, {clipped} shelves clipped.")
+
+    def update_cell(self, row_id, column_name, value):
+        """Update a specific cell in the DataFrame."""
+        self.widen_assignment_columns()
+        self.df.at[int(row_id), column_name] = value
+        if column_name == "Family":
+            self.df.at[int(row_id), "Category"] = ""  # Reset Category if Family changes
+        row = self.df.loc[int(row_id)]
+        location = self.row_location(row)
+        self.index_location(location, row['Family'], row['Category'])
+        self.dirty_locations.add(location)
+        event_type = CellsAssigned if clean_text(value) else CellsCleared
+        self.publish(event_type([location], [int(row_id)]))
+        return list(self.df.iloc[int(row_id)])
+
+    def clear_selection(self, selected_cells, section, aisle, side):
+        """Clear Family and Category for the selected shelves in the DataFrame."""
+        self.widen_assignment_columns()
         updated_rows = 0
+        locations = []
+        rows = []
         for level, shelf in selected_cells:
             mask = (
                 (self.df['Section'] == section) &
@@ -133,37 +453,179 @@ class ShelfModel:
             row_idx = self.df.index[mask]
             if not row_idx.empty:
                 row_idx = row_idx[0]
-                self.df.at[row_idx, 'Family'] = family
-                self.df.at[row_idx, 'Category'] = category
+                self.df.at[row_idx, 'Family'] = ""
+                self.df.at[row_idx, 'Category'] = ""
+                location = (section, int(aisle), int(side), level, shelf)
+                self.index_location(location, "", "")
+                locations.append(location)
+                rows.append(row_idx)
                 updated_rows += 1
-                print(f"Updated row {row_idx}: Family={family}, Category={category}")
-        print(f"Applied Family: {family}, Category: {category} to {updated_rows} shelves")
-        return True, f"Family and Category values applied to {updated_rows} shelves."
+                print(f"Cleared row {row_idx}: Family and Category set to empty")
+        print(f"Cleared Family and Category for {updated_rows} shelves")
+        if locations:
+            self.dirty_locations.update(locations)
+            self.publish(CellsCleared(locations, rows))
+        return updated_rows
 
-    def update_cell(self, row_id, column_name, value):
-        """Update a specific cell in the DataFrame."""
-        self.df.at[int(row_id), column_name] = value
-        if column_name == "Family":
-            self.df.at[int(row_id), "Category"] = ""  # Reset Category if Family changes
-        return list(self.df.iloc[int(row_id)])
+    def diff_sheet(self, new_df):
+        """Compare an externally loaded sheet with the model in one vectorized merge.
 
-    def get_filtered_data(self, section, aisle, side):
-        """Get filtered data for the selected Section, Aisle, and Side."""
-        if not section or not aisle or not side:
-            print(f"Cannot filter data: Section='{section}', Aisle='{aisle}', Side='{side}'")
-            return None
-        if self.df is None:
-            print("Dataframe is not loaded.")
+        Returns a DataFrame of changed cells with the location columns, the model
+        row ('row') and the old/new Family and Category, or None when the two
+        sheets do not cover the same set of locations.
+        """
+        old = normalize_assignments(self.df)
+        old['row'] = self.df.index
+        new = normalize_assignments(new_df)
+        if len(old) != len(new):
             return None
-        filtered_df = self.df[
-            (self.df['Section'] == section) &
-            (self.df['Aisle'] == int(aisle)) &
-            (self.df['Side'] == int(side))
-        ]
-        if filtered_df.empty:
-            print(f"No data found for Section='{section}', Aisle='{aisle}', Side='{side}'")
+        merged = old.merge(new, on=LOCATION_COLUMNS, how='outer', suffixes=('_old', '_new'), indicator=True)
+        if (merged['_merge'] != 'both').any():
             return None
-        return filtered_df
+        changed = merged[
+            (merged['Family_old'] != merged['Family_new']) |
+            (merged['Category_old'] != merged['Category_new'])
+        ].drop(columns='_merge')
+        changed['row'] = changed['row'].astype(int)
+        return changed
+
+    def apply_external_changes(self, changed):
+        """Apply cells changed on disk, keeping unsaved local edits; returns (applied, conflicts).
+
+        `changed` is the result of diff_sheet. Conflicts are the changed cells that
+        were also edited locally since the last load or save.
+        """
+        locations = list(zip(*(changed[col] for col in LOCATION_COLUMNS)))
+        conflict_mask = [location in self.dirty_locations for location in locations]
+        conflicts = changed[conflict_mask]
+        to_apply = changed[[not conflict for conflict in conflict_mask]]
+        if to_apply.empty:
+            return 0, conflicts
+        
+        rows = to_apply['row'].to_numpy()
+        self.widen_assignment_columns()
+        self.df.loc[rows, 'Family'] = to_apply['Family_new'].to_numpy()
+        self.df.loc[rows, 'Category'] = to_apply['Category_new'].to_numpy()
+        
+        assigned_locations, assigned_rows, cleared_locations, cleared_rows = [], [], [], []
+        for location, row, family, category in zip(
+            (loc for loc, conflict in zip(locations, conflict_mask) if not conflict),
+            rows, to_apply['Family_new'], to_apply['Category_new']
+        ):
+            self.index_location(location, family, category)
+            if family or category:
+                assigned_locations.append(location)
+                assigned_rows.append(row)
+            else:
+                cleared_locations.append(location)
+                cleared_rows.append(row)
+        if assigned_locations:
+            self.publish(CellsAssigned(assigned_locations, assigned_rows))
+        if cleared_locations:
+            self.publish(CellsCleared(cleared_locations, cleared_rows))
+        print(f"Applied {len(to_apply)} external changes, {len(conflicts)} conflicts with unsaved edits")
+        return len(to_apply), conflicts
+
+    def replace_sheet(self, new_df):
+        """Replace the whole assignment sheet, e.g. when an external edit changed its shape."""
+        self.df = new_df
+        self.dirty_locations.clear()
+        self.undo_stack.clear()
+        self.build_location_index()
+        self.publish(DataReloaded())
+
+    def apply_external_catalog(self, families, categories):
+        """Replace the catalog if it differs from the loaded one; returns True if it changed."""
+        if families == self.families and categories == self.categories:
+            return False
+        self.set_catalog(families, categories)
+        self.publish(CatalogUpdated())
+        return True
+
+    def apply_external_structure(self, structure):
+        """Replace the shelf structure if it differs from the loaded one; returns True if it changed."""
+        if structure == self.shelf_structure:
+            return False
+        self.shelf_structure.clear()
+        self.shelf_structure.update(structure)
+        self.sections[:] = list(self.shelf_structure.keys())
+        self.publish(DataReloaded())
+        return True
+
+    def build_typeaheads(self):
+        """Build the typeahead indexes for the Family and Category dropdowns from the catalog."""
+        self.family_typeahead = Typeahead(self.families)
+        self.category_typeaheads = {family: Typeahead(categories) for family, categories in self.categories.items()}
+
+    def get_category_typeahead(self, family):
+        """Return the typeahead index over the categories of a family."""
+        return self.category_typeaheads.get(family, Typeahead([]))
+
+    @staticmethod
+    def row_location(row):
+        """Return the (section, aisle, side, level, shelf) key of a DataFrame row."""
+        return (str(row['Section']), int(row['Aisle']), int(row['Side']), int(row['Level']), int(row['Shelf']))
+
+    def build_location_index(self):
+        """Rebuild the reverse index from (family, category) to shelf locations."""
+        self.location_index = {}
+        self.location_keys = {}
+        self.family_index = {}
+        if self.df is None:
+            return
+        columns = [self.df[col] for col in LOCATION_COLUMNS + ['Family', 'Category']]
+        for section, aisle, side, level, shelf, family, category in zip(*columns):
+            self.index_location((str(section), int(aisle), int(side), int(level), int(shelf)), family, category)
+        print(f"Built location index with {len(self.location_index)} family/category keys")
+
+    def index_location(self, location, family, category):
+        """Move a single location to its new (family, category) key in the reverse index."""
+        family = clean_text(family)
+        category = clean_text(category)
+        old_key = self.location_keys.pop(location, None)
+        if old_key is not None:
+            locations = self.location_index.get(old_key)
+            if locations is not None:
+                locations.discard(location)
+                if not locations:
+                    del self.location_index[old_key]
+                    self.family_index[old_key[0]].discard(old_key[1])
+                    if not self.family_index[old_key[0]]:
+                        del self.family_index[old_key[0]]
+        if not family and not category:
+            return
+        key = (family, category)
+        self.location_keys[location] = key
+        self.location_index.setdefault(key, set()).add(location)
+        self.family_index.setdefault(family, set()).add(category)
+
+    def locate(self, family, category=None):
+        """Return the sorted locations holding a family, optionally narrowed to one category."""
+        if category is not None:
+            return sorted(self.location_index.get((family, category), ()))
+        hits = []
+        for cat in self.family_index.get(family, ()):
+            hits.extend(self.location_index[(family, cat)])
+        return sorted(hits)
+
+    def get_filtered_data(self, section, aisle, side):
+        """Get filtered data for the selected Section, Aisle, and Side."""
+        with tracer.span("get_filtered_data", section=section, aisle=aisle, side=side):
+            if not section or not aisle or not side:
+                print(f"Cannot filter data: Section='{section}', Aisle='{aisle}', Side='{side}'")
+                return None
+            if self.df is None:
+                print("Dataframe is not loaded.")
+                return None
+            filtered_df = self.df[
+                (self.df['Section'] == section) &
+                (self.df['Aisle'] == int(aisle)) &
+                (self.df['Side'] == int(side))
+            ]
+            if filtered_df.empty:
+                print(f"No data found for Section='{section}', Aisle='{aisle}', Side='{side}'")
+                return None
+            return filtered_df
 
     def get_unique_values(self, column):
         """Get unique values for a given column in the DataFrame."""
@@ -174,40 +636,18 @@ class ShelfModel:
     def generate_shelf_assignment(self):
         """Generate the shelf assignment output file based on shelf structure."""
         try:
-            data = []
-            for section, config in self.shelf_structure.items():
-                aisles = config["aisles"]
-                sides = config["sides"]
-                max_levels = config["max_levels"]
-                max_shelves = config["max_shelves"]
-                
-                for aisle in range(1, aisles + 1):
-                    for side in range(1, sides + 1):
-                        for level in range(1, max_levels + 1):
-                            for shelf in range(1, max_shelves + 1):
-                                data.append({
-                                    'Section': section,
-                                    'Aisle': aisle,
-                                    'Side': side,
-                                    'Level': level,
-                                    'Shelf': shelf,
-                                    'Family': '',
-                                    'Category': ''
-                                })
-            
-            # Create DataFrame and save to Excel
-            output_df = pd.DataFrame(data)
-            output_df.to_excel(OUTPUT_FILE, index=False)
+            output_df = structure_sheet(self.shelf_structure)
+            write_assignment_sheet(output_df, self.output_file)
             
             # Reload the data to update the model
-            self.df = pd.read_excel(OUTPUT_FILE)
-            if 'Family' not in self.df.columns:
-                self.df['Family'] = ""
-            if 'Category' not in self.df.columns:
-                self.df['Category'] = ""
+            self.df = read_sheet(self.output_file)
+            self.dirty_locations.clear()
+            self.undo_stack.clear()
+            self.build_location_index()
+            self.publish(StructureRegenerated())
                 
-            print(f"Shelf assignment generated and saved to {OUTPUT_FILE}")
-            return True, f"Shelf assignment generated and saved to {OUTPUT_FILE}"
+            print(f"Shelf assignment generated and saved to {self.output_file}")
+            return True, f"Shelf assignment generated and saved to {self.output_file}"
         except Exception as e:
             print(f"Error generating shelf assignment: {str(e)}")
             return False, f"Error generating shelf assignment: {str(e)}"
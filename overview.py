@@ -0,0 +1,94 @@
+"""Tk-free data for the whole-store overview: one small cell grid per side, colored with NumPy."""
+import colorsys
+import numpy as np
+import pandas as pd
+from assignment_sheet import normalize_assignments
+
+NO_SHELF = -2  # Grid position outside the side's shelves
+EMPTY = -1  # Shelf with no assignment
+BACKGROUND_RGB = (240, 240, 232)
+EMPTY_RGB = (211, 211, 211)
+UNKNOWN_FAMILY_RGB = (128, 128, 128)  # Assigned, but the family is not in the catalog
+
+
+class SideGrid:
+    """Family codes of one (section, aisle, side) laid out as levels x shelves, top level first."""
+
+    def __init__(self, section, aisle, side, codes):
+        self.section = section
+        self.aisle = aisle
+        self.side = side
+        self.codes = codes
+        shelves = codes != NO_SHELF
+        self.fill_rate = float((codes >= 0).sum()) / max(int(shelves.sum()), 1)
+
+
+def build_side_grids(df, families):
+    """Scatter the sheet into one code grid per side with vectorized indexing.
+
+    Codes are positions in `families`, len(families) for families missing from
+    the catalog, EMPTY for unassigned shelves and NO_SHELF outside the side.
+    """
+    sheet = normalize_assignments(df)
+    family_codes = pd.Categorical(sheet['Family'], categories=pd.unique(pd.Series(families, dtype=object))).codes.astype(np.int32)
+    assigned = ((sheet['Family'] != "") | (sheet['Category'] != "")).to_numpy()
+    codes = np.where(assigned, np.where(family_codes >= 0, family_codes, len(families)), EMPTY)
+
+    sheet['code'] = codes
+    sheet = sheet.sort_values(['Section', 'Aisle', 'Side'], kind='stable')
+    levels = sheet['Level'].to_numpy()
+    shelves = sheet['Shelf'].to_numpy()
+    values = sheet['code'].to_numpy()
+    side_keys = sheet[['Section', 'Aisle', 'Side']]
+    starts = np.flatnonzero((side_keys != side_keys.shift()).any(axis=1).to_numpy())
+    ends = np.append(starts[1:], len(sheet))
+
+    grids = []
+    sections = side_keys['Section'].to_numpy()
+    aisles = side_keys['Aisle'].to_numpy()
+    sides = side_keys['Side'].to_numpy()
+    for start, end in zip(starts, ends):
+        side_levels = levels[start:end]
+        side_shelves = shelves[start:end]
+        max_level = int(side_levels.max())
+        grid = np.full((max_level, int(side_shelves.max())), NO_SHELF, dtype=np.int32)
+        grid[max_level - side_levels, side_shelves - 1] = values[start:end]
+        grids.append(SideGrid(sections[start], int(aisles[start]), int(sides[start]), grid))
+    return grids
+
+
+def family_palette(count):
+    """Return a (count + 1, 3) uint8 palette of distinct colors; the last row is for unknown families."""
+    colors = []
+    for index in range(count):
+        hue = (index * 0.618033988749895) % 1.0  # Golden-ratio steps keep neighbouring codes far apart
+        red, green, blue = colorsys.hsv_to_rgb(hue, 0.55, 0.9)
+        colors.append((int(red * 255), int(green * 255), int(blue * 255)))
+    colors.append(UNKNOWN_FAMILY_RGB)
+    return np.array(colors, dtype=np.uint8)
+
+
+def fill_rate_rgb(rate):
+    """Map a fill rate in [0, 1] onto a red-to-green ramp."""
+    red, green, blue = colorsys.hsv_to_rgb(rate / 3, 0.7, 0.85)
+    return int(red * 255), int(green * 255), int(blue * 255)
+
+
+def tile_pixels(grid, mode, palette, cell_px):
+    """Return an (h, w, 3) uint8 RGB array for a side, cell_px pixels per shelf.
+
+    mode "family" colors each shelf by its family; mode "fill" colors assigned
+    shelves by the side's fill rate so sparse sides stand out.
+    """
+    codes = grid.codes
+    pixels = np.empty(codes.shape + (3,), dtype=np.uint8)
+    pixels[...] = BACKGROUND_RGB
+    pixels[codes == EMPTY] = EMPTY_RGB
+    assigned = codes >= 0
+    if mode == "fill":
+        pixels[assigned] = fill_rate_rgb(grid.fill_rate)
+    else:
+        pixels[assigned] = palette[codes[assigned]]
+    if cell_px > 1:
+        pixels = np.repeat(np.repeat(pixels, cell_px, axis=0), cell_px, axis=1)
+    return pixels
@@ -0,0 +1,50 @@
+"""Shelf View sides prepared ahead of navigation, kept in a bounded cache.
+
+The cache holds each side's SideData (filtered rows and bar runs); display
+lists are memoized separately by display_list.layout_side.
+"""
+from collections import OrderedDict
+from constants import PREFETCH_CACHE_SIZE
+
+
+class SideCache:
+    """LRU cache of SideData keyed by (section, aisle, side), invalidated by model change events."""
+
+    def __init__(self, capacity=PREFETCH_CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def on_model_changed(self, event):
+        """Drop the sides an event touched, or everything for whole-sheet changes."""
+        if event.full_refresh:
+            self.clear()
+            return
+        for key in event.sides():
+            self.entries.pop(key, None)
+
+
+def neighbour_sides(shelf_structure, section, aisle, side):
+    """Return the sides a planner most likely opens next: the other sides of this aisle, then the adjacent aisles."""
+    config = shelf_structure.get(section)
+    if config is None:
+        return []
+    neighbours = [(section, aisle, other) for other in range(1, config["sides"] + 1) if other != side]
+    for next_aisle in (aisle + 1, aisle - 1):
+        if 1 <= next_aisle <= config["aisles"]:
+            neighbours.append((section, next_aisle, side))
+    return neighbours
@@ -0,0 +1,207 @@
+"""Print queue that renders and submits jobs on a worker thread.
+
+Each job renders its PDF into its own temporary directory and is then handed
+to the platform print command, so the UI never waits on a printer and two
+jobs never share a file. Status changes are put on `updates` for the UI
+thread to drain; nothing here touches Tk.
+
+The print command defaults to `lp` on Linux and `lpr` on macOS and can be
+replaced with SHELF_PRINT_COMMAND, e.g. a stub script to check submission:
+
+    SHELF_PRINT_COMMAND=./lp_stub python print_spooler.py layout.pdf
+"""
+import argparse
+import itertools
+import os
+import platform
+import queue
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from constants import PRINT_COMMAND_ENV, PRINT_SUBMIT_TIMEOUT_S
+
+QUEUED = "queued"
+RENDERING = "rendering"
+SUBMITTING = "submitting"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+ACROBAT_PATHS = [
+    r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+]
+
+
+class PrintCancelled(Exception):
+    """Raised on the worker thread when the job being processed is cancelled."""
+
+
+class PrintJob:
+    """One queued print: `render(pdf_path)` writes the PDF, then it is submitted to the printer."""
+
+    def __init__(self, job_id, title, render):
+        self.job_id = job_id
+        self.title = title
+        self.render = render
+        self.status = QUEUED
+        self.message = ""
+        self.cancel_requested = False
+        self.process = None  # Print command while it runs, so a cancel can stop it
+
+
+def print_command():
+    """Return the print command as an argument list, or None where printing goes through a PDF reader."""
+    configured = os.environ.get(PRINT_COMMAND_ENV)
+    if configured:
+        return shlex.split(configured)
+    system = platform.system()
+    if system == "Linux":
+        return ["lp"]
+    if system == "Darwin":
+        return ["lpr"]
+    return None
+
+
+class PrintSpooler:
+    """Run print jobs one at a time on a daemon thread; `updates` receives each job after its status changes."""
+
+    def __init__(self, command=None):
+        self.command = command  # Argument list; None picks print_command() per job
+        self.jobs = []  # Every submitted job, oldest first
+        self.updates = queue.Queue()
+        self._pending = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, title, render):
+        """Queue a job and return it; starts the worker thread on first use."""
+        job = PrintJob(next(self._ids), title, render)
+        with self._lock:
+            self.jobs.append(job)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="PrintSpooler", daemon=True)
+            self._thread.start()
+        self._pending.put(job)
+        self.updates.put(job)
+        return job
+
+    def cancel(self, job_id):
+        """Cancel a job that has not finished; returns (success, message)."""
+        with self._lock:
+            job = next((job for job in self.jobs if job.job_id == job_id), None)
+            if job is None:
+                return False, f"No print job {job_id}"
+            if job.status in FINISHED:
+                return False, f"Print job {job_id} already {job.status}"
+            job.cancel_requested = True
+            if job.status == QUEUED:
+                job.status = CANCELLED
+                job.message = "Cancelled before printing"
+            elif job.process is not None:
+                job.process.terminate()
+        self.updates.put(job)
+        return True, f"Cancelling print job {job_id}"
+
+    def clear_finished(self):
+        with self._lock:
+            self.jobs = [job for job in self.jobs if job.status not in FINISHED]
+
+    def _set_status(self, job, status, message=""):
+        with self._lock:
+            if job.cancel_requested and status not in FINISHED:
+                raise PrintCancelled()
+            job.status = status
+            job.message = message
+        self.updates.put(job)
+
+    def _run(self):
+        while True:
+            job = self._pending.get()
+            if job.status == CANCELLED:
+                continue
+            job_dir = tempfile.mkdtemp(prefix=f"shelf_print_{job.job_id}_")
+            keep_dir = False
+            try:
+                pdf_path = os.path.join(job_dir, "shelf_layout.pdf")
+                self._set_status(job, RENDERING)
+                job.render(pdf_path)
+                self._set_status(job, SUBMITTING)
+                message, keep_dir = self._submit(job, pdf_path)
+                status = DONE
+            except PrintCancelled:
+                status, message = CANCELLED, "Cancelled"
+            except Exception as e:
+                status, message = (CANCELLED, "Cancelled") if job.cancel_requested else (FAILED, str(e))
+            # Clean up before reporting, so nothing is left behind once the job shows as finished
+            if not keep_dir:
+                shutil.rmtree(job_dir, ignore_errors=True)
+            print(f"Print job {job.job_id} ({job.title}): {status} {message}")
+            self._set_status(job, status, message)
+
+    def _submit(self, job, pdf_path):
+        """Send the PDF to the printer; returns (status message, whether the file must outlive the job)."""
+        command = self.command or print_command()
+        if command is None:
+            return self._submit_windows(pdf_path)
+        if shutil.which(command[0]) is None:
+            raise FileNotFoundError(f"Printing command '{command[0]}' not found. Please ensure printing utilities are installed.")
+        # Output goes to files rather than pipes so a cancelled command returns at once even if it left children running
+        output_path = os.path.join(os.path.dirname(pdf_path), "print_command.log")
+        with open(output_path, "w+") as output:
+            with self._lock:
+                if job.cancel_requested:
+                    raise PrintCancelled()
+                job.process = subprocess.Popen(command + [pdf_path], stdout=output, stderr=subprocess.STDOUT, text=True)
+            try:
+                returncode = job.process.wait(timeout=PRINT_SUBMIT_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                job.process.kill()
+                job.process.wait()
+                raise RuntimeError(f"'{command[0]}' did not finish within {PRINT_SUBMIT_TIMEOUT_S} s")
+            finally:
+                job.process = None
+            output.seek(0)
+            text = output.read().strip()
+        if job.cancel_requested:
+            raise PrintCancelled()
+        if returncode != 0:
+            raise RuntimeError(f"'{command[0]}' exited with status {returncode}: {text}")
+        return text or "Sent to default printer", False
+
+    def _submit_windows(self, pdf_path):
+        try:
+            import win32print
+        except ImportError:
+            win32print = None
+        acrobat_path = next((path for path in ACROBAT_PATHS if os.path.exists(path)), None)
+        if win32print is None or acrobat_path is None:
+            # No silent printing available; let the user print from their PDF reader
+            os.startfile(pdf_path)
+            return "Opened in the default PDF application; print from there", True
+        subprocess.run([acrobat_path, "/p", "/h", pdf_path], check=True, timeout=PRINT_SUBMIT_TIMEOUT_S)
+        return f"Sent to printer: {win32print.GetDefaultPrinter()}", False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Submit PDF files through the print spooler")
+    parser.add_argument("pdfs", nargs="+", help="PDF files to print")
+    parser.add_argument("--command", help=f"Print command (default: ${PRINT_COMMAND_ENV}, else lp/lpr)")
+    args = parser.parse_args(argv)
+
+    spooler = PrintSpooler(shlex.split(args.command) if args.command else None)
+    for path in args.pdfs:
+        spooler.submit(os.path.basename(path), lambda pdf_path, source=path: shutil.copyfile(source, pdf_path))
+    while any(job.status not in FINISHED for job in spooler.jobs):
+        spooler.updates.get()
+    failed = [job for job in spooler.jobs if job.status != DONE]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
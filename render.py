@@ -0,0 +1,113 @@
+"""Backends that draw a display_list.DisplayList on a Tk canvas, a PIL image, an SVG document or a reportlab PDF.
+
+None of them computes geometry; they only translate primitives. PIL is
+imported when its backend is used; the reportlab backend draws on a canvas
+the caller created.
+"""
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from display_list import Polygon, resolve_fill
+
+FONT_FAMILY = "Helvetica"
+TEXT_COLOR = "black"
+
+
+def render_tk(display_list, canvas, colors, group_tag=None):
+    """Create the canvas items of a display list; returns {tag: item id} for tagged polygons.
+
+    Every item is also tagged group_tag, if given, so they can be moved or deleted together.
+    """
+    tagged = {}
+    group = (group_tag,) if group_tag else ()
+    for item in display_list.items:
+        if isinstance(item, Polygon):
+            item_id = canvas.create_polygon(*item.points, fill=resolve_fill(item.fill, colors), outline=item.outline,
+                                            tags=((item.tag,) if item.tag else ()) + group)
+            if item.tag:
+                tagged[item.tag] = item_id
+        else:
+            font = (FONT_FAMILY, item.size, 'bold') if item.bold else (FONT_FAMILY, item.size)
+            canvas.create_text(item.x, item.y, text=item.text, font=font, fill=TEXT_COLOR, anchor="center", tags=group)
+    return tagged
+
+
+@lru_cache(maxsize=32)
+def _pil_font(size, bold):
+    from PIL import ImageFont
+    for name in (("arialbd.ttf", "DejaVuSans-Bold.ttf") if bold else ("arial.ttf", "DejaVuSans.ttf")):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def render_pil(display_list, colors, scale=1.0, background="white"):
+    """Rasterize a display list into an RGB PIL image, `scale` pixels per canvas pixel."""
+    from PIL import Image, ImageDraw
+    image = Image.new("RGB", (max(1, int(display_list.width * scale)), max(1, int(display_list.height * scale))), background)
+    draw = ImageDraw.Draw(image)
+    for item in display_list.items:
+        if isinstance(item, Polygon):
+            points = [(x * scale, y * scale) for x, y in zip(item.points[::2], item.points[1::2])]
+            draw.polygon(points, fill=resolve_fill(item.fill, colors), outline=item.outline or None)
+        else:
+            font = _pil_font(max(1, int(item.size * scale)), item.bold)
+            left, top, right, bottom = draw.textbbox((0, 0), item.text, font=font)
+            # Center on the anchor point; bitmap fonts do not support PIL's text anchors
+            draw.text((item.x * scale - (left + right) / 2, item.y * scale - (top + bottom) / 2), item.text, fill=TEXT_COLOR, font=font)
+    return image
+
+
+def render_svg(display_list, colors, background="white"):
+    """Return a display list as an SVG document string."""
+    width, height = display_list.width, display_list.height
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f'<rect width="100%" height="100%" fill="{background}"/>',
+    ]
+    for item in display_list.items:
+        if isinstance(item, Polygon):
+            points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(item.points[::2], item.points[1::2]))
+            parts.append(f'<polygon points="{points}" fill="{resolve_fill(item.fill, colors)}" stroke="{item.outline or "none"}"/>')
+        else:
+            weight = ' font-weight="bold"' if item.bold else ""
+            parts.append(
+                f'<text x="{item.x:.1f}" y="{item.y:.1f}" font-family="{FONT_FAMILY}" font-size="{item.size}"{weight} '
+                f'fill="{TEXT_COLOR}" text-anchor="middle" dominant-baseline="central">{escape(item.text)}</text>'
+            )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def render_reportlab(display_list, colors, pdf, x, y, width, height):
+    """Draw a display list on a reportlab canvas, scaled to fit the box at (x, y) of width x height points."""
+    scale = min(width / display_list.width, height / display_list.height)
+    left = x + (width - display_list.width * scale) / 2
+    top = y + height - (height - display_list.height * scale) / 2
+
+    def page_point(canvas_x, canvas_y):
+        # Canvas y grows downwards, PDF y upwards
+        return left + canvas_x * scale, top - canvas_y * scale
+
+    pdf.saveState()
+    for item in display_list.items:
+        if isinstance(item, Polygon):
+            path = pdf.beginPath()
+            points = list(zip(item.points[::2], item.points[1::2]))
+            path.moveTo(*page_point(*points[0]))
+            for point in points[1:]:
+                path.lineTo(*page_point(*point))
+            path.close()
+            pdf.setFillColor(resolve_fill(item.fill, colors))  # reportlab parses color names and #RRGGBB strings
+            if item.outline:
+                pdf.setStrokeColor(item.outline)
+                pdf.setLineWidth(0.5)
+            pdf.drawPath(path, fill=1, stroke=1 if item.outline else 0)
+        else:
+            font_size = item.size * scale
+            pdf.setFillColor(TEXT_COLOR)
+            pdf.setFont(f"{FONT_FAMILY}-Bold" if item.bold else FONT_FAMILY, font_size)
+            text_x, text_y = page_point(item.x, item.y)
+            pdf.drawCentredString(text_x, text_y - font_size * 0.35, item.text)
+    pdf.restoreState()
@@ -0,0 +1,198 @@
+"""Roll a master planogram out to every store of a chain.
+
+    python rollout.py master.xlsx STORES_DIR [--workers N] [--keep-unmapped] [--dry-run]
+                      [--report rollout_report.csv] [--flagged flagged.csv]
+
+STORES_DIR holds one subdirectory per store with its shelf information file
+and, optionally, its own family file (the master's --family-file is used
+otherwise), laid out like an editor workspace. Each store's assignment sheet
+is mapped from the master by location: master cells past the store's
+structure are clipped and flagged with the reason, and store shelves the
+master does not cover are cleared unless --keep-unmapped is given. Stores
+are processed in a process pool, each worker loading its own ShelfModel and
+saving through it, and a summary line per store is written to the report.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from constants import FAMILY_FILE, SHELF_INFO_FILE, OUTPUT_FILE
+from assignment_sheet import LOCATION_COLUMNS, read_sheet, normalize_assignments
+from model import ShelfModel, structure_sheet
+from bulk_assign import RANGE_LIMITS, structure_frame
+
+COUNT_COLUMNS = ['shelves', 'mapped', 'changed', 'cleared', 'unmapped', 'clipped']
+REPORT_COLUMNS = ['store', 'status'] + COUNT_COLUMNS + ['clipped_reasons', 'catalog_issues', 'seconds', 'message']
+
+_master = None  # Normalized master sheet, set once per worker process by init_worker
+
+
+def init_worker(master):
+    global _master
+    _master = master
+
+
+def find_stores(stores_dir, family_file):
+    """Map each store subdirectory with a shelf information file to its ShelfModel file paths."""
+    stores = {}
+    for name in sorted(os.listdir(stores_dir)):
+        directory = os.path.join(stores_dir, name)
+        paths = {
+            "family_file": os.path.join(directory, os.path.basename(FAMILY_FILE)),
+            "shelf_info_file": os.path.join(directory, os.path.basename(SHELF_INFO_FILE)),
+            "output_file": os.path.join(directory, os.path.basename(OUTPUT_FILE)),
+        }
+        if not os.path.isdir(directory) or not os.path.exists(paths["shelf_info_file"]):
+            continue
+        if not os.path.exists(paths["family_file"]):
+            paths["family_file"] = family_file
+        stores[name] = paths
+    return stores
+
+
+def read_master(path):
+    """Read the master assignment sheet as normalized locations, the last row winning for repeated locations."""
+    master = normalize_assignments(read_sheet(path))
+    return master.drop_duplicates(LOCATION_COLUMNS, keep='last').reset_index(drop=True)
+
+
+def clip_reasons(clipped, shelf_structure):
+    """Return why each clipped master cell has no shelf in the store: the first location column past the structure."""
+    structure = structure_frame(shelf_structure).reindex(columns=['Section'] + list(RANGE_LIMITS.values()))
+    limits = clipped[LOCATION_COLUMNS].merge(structure, on='Section', how='left')
+    reasons = pd.Series("not in store sheet", index=clipped.index)
+    for col, limit in reversed(list(RANGE_LIMITS.items())):
+        reasons[(limits[col] > limits[limit]).to_numpy()] = f"{col} beyond store"
+    reasons[limits[list(RANGE_LIMITS.values())[0]].isna().to_numpy()] = "Section not in store"
+    return reasons
+
+
+def plan_rollout(sheet, master, shelf_structure, keep_unmapped):
+    """Map the master onto a store sheet; returns (changes, clipped, counts)."""
+    store = normalize_assignments(sheet).rename_axis('row').reset_index()
+    merged = store.merge(master, on=LOCATION_COLUMNS, how='left', suffixes=('_old', ''), indicator=True)
+    mapped = (merged['_merge'] == 'both').to_numpy()
+    for col in ['Family', 'Category']:
+        keep = ~mapped if keep_unmapped else np.zeros(len(merged), dtype=bool)
+        merged[col] = np.where(keep, merged[f'{col}_old'], merged[col].fillna(""))
+    changed = merged[(merged['Family'] != merged['Family_old']) | (merged['Category'] != merged['Category_old'])]
+
+    # Only assigned master cells are lost when they have no shelf; blank ones are clipped silently
+    clipped = master[master['Family'] != ""].merge(store[LOCATION_COLUMNS], on=LOCATION_COLUMNS, how='left', indicator=True)
+    clipped = clipped[clipped['_merge'] == 'left_only'].drop(columns='_merge').reset_index(drop=True)
+    clipped['reason'] = clip_reasons(clipped, shelf_structure)
+
+    counts = {
+        "shelves": len(store),
+        "mapped": int(mapped.sum()),
+        "changed": len(changed),
+        "cleared": int(((changed['Family'] == "") & (changed['Family_old'] != "")).sum()),
+        "unmapped": int((~mapped).sum()),
+        "clipped": len(clipped),
+        "clipped_reasons": "; ".join(f"{reason}: {count}" for reason, count in clipped['reason'].value_counts().items()),
+    }
+    return changed[['row', 'Family', 'Category']], clipped, counts
+
+
+def roll_out_store(name, paths, keep_unmapped=False, dry_run=False, verbose=False):
+    """Apply the master to one store and save it; returns (report record, clipped cells). Runs in a worker process."""
+    start = time.perf_counter()
+    record = {'store': name, 'status': "failed", 'message': ""}
+    clipped = None
+    output = sys.stdout if verbose else io.StringIO()  # The model's progress prints would interleave across workers
+    try:
+        with contextlib.redirect_stdout(output):
+            model = ShelfModel(**paths)
+            if model.df is None:
+                if dry_run:
+                    model.df = structure_sheet(model.shelf_structure)
+                    model.build_location_index()
+                else:
+                    success, message = model.generate_shelf_assignment()
+                    if not success:
+                        raise RuntimeError(message)
+            changes, clipped, counts = plan_rollout(model.df, _master, model.shelf_structure, keep_unmapped)
+            record.update(counts)
+            model.apply_assignments(changes)
+            if dry_run:
+                model.validate()
+                record['status'], record['message'] = "ok", "Dry run: nothing written"
+            else:
+                success, message = model.save_data()
+                record['status'], record['message'] = ("ok" if success else "failed"), message
+            record['catalog_issues'] = 0 if model.validation_issues is None else len(model.validation_issues)
+    except Exception as e:
+        record['message'] = str(e)
+    record['seconds'] = round(time.perf_counter() - start, 3)
+    if clipped is not None:
+        clipped.insert(0, 'store', name)
+    return record, clipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roll a master shelf assignment out to every store in a directory")
+    parser.add_argument("master", help="Master assignment sheet (.xlsx)")
+    parser.add_argument("stores_dir", help="Directory with one subdirectory per store")
+    parser.add_argument("--family-file", default=FAMILY_FILE, help="Family catalog for stores without their own")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--keep-unmapped", action="store_true", help="Keep store assignments on shelves the master does not cover")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("--report", default="rollout_report.csv", help="Summary CSV with one row per store")
+    parser.add_argument("--flagged", help="CSV listing every clipped master cell per store")
+    parser.add_argument("--verbose", action="store_true", help="Show each store's model output")
+    args = parser.parse_args(argv)
+
+    try:
+        master = read_master(args.master)
+        stores = find_stores(args.stores_dir, args.family_file)
+    except Exception as e:
+        print(f"Failed to load: {str(e)}")
+        return 1
+    if not stores:
+        print(f"No stores with a {os.path.basename(SHELF_INFO_FILE)} found in {args.stores_dir}")
+        return 1
+    workers = min(args.workers or os.cpu_count() or 1, len(stores))
+    print(f"Rolling out {len(master)} master cells to {len(stores)} stores with {workers} workers")
+
+    start = time.perf_counter()
+    records, flagged = [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(master,)) as executor:
+        futures = [executor.submit(roll_out_store, name, paths, args.keep_unmapped, args.dry_run, args.verbose)
+                   for name, paths in stores.items()]
+        for done, future in enumerate(as_completed(futures), 1):
+            record, clipped = future.result()
+            records.append(record)
+            if clipped is not None and not clipped.empty:
+                flagged.append(clipped)
+            if record['status'] == "ok":
+                print(f"[{done}/{len(stores)}] {record['store']}: {record['changed']} changed, {record['clipped']} clipped, "
+                      f"{record['catalog_issues']} catalog issues ({record['seconds']:.1f} s)")
+            else:
+                print(f"[{done}/{len(stores)}] {record['store']}: FAILED {record['message']}")
+
+    report = pd.DataFrame(records).reindex(columns=REPORT_COLUMNS).sort_values('store')
+    # Failed stores have no counts; nullable integers keep the others from turning into floats
+    report[COUNT_COLUMNS + ['catalog_issues']] = report[COUNT_COLUMNS + ['catalog_issues']].astype("Int64")
+    report.to_csv(args.report, index=False)
+    print(f"Report written to {args.report}")
+    if args.flagged:
+        columns = ['store'] + LOCATION_COLUMNS + ['Family', 'Category', 'reason']
+        frame = pd.concat(flagged, ignore_index=True) if flagged else pd.DataFrame(columns=columns)
+        frame[columns].to_csv(args.flagged, index=False)
+        print(f"Clipped cells written to {args.flagged}")
+
+    failed = report[report['status'] != "ok"]
+    ok = report[report['status'] == "ok"]
+    print(f"Stores: {len(report)}, succeeded: {len(ok)}, failed: {len(failed)}, "
+          f"shelves changed: {int(ok['changed'].sum())}, cells clipped: {int(ok['clipped'].sum())} "
+          f"in {time.perf_counter() - start:.1f} s")
+    return 1 if len(failed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
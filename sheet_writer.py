@@ -0,0 +1,88 @@
+"""Streaming Excel writer for assignment sheets.
+
+Rows are written in xlsxwriter's constant-memory mode, one typed cell at a
+time, so saving does not build the openpyxl object tree that makes
+DataFrame.to_excel slow on large sheets. The header row is bold and frozen
+and has an autofilter. Without xlsxwriter the sheet is written with
+DataFrame.to_excel as before.
+"""
+import os
+import pandas as pd
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+SHEET_NAME = "Sheet1"  # The name DataFrame.to_excel uses, so existing readers find the same sheet
+MIN_COLUMN_WIDTH = 8
+MAX_COLUMN_WIDTH = 40
+
+
+def column_cells(series):
+    """Return (values, kind) for a column: kind is "number", "bool" or "text"; missing values become None."""
+    if pd.api.types.is_bool_dtype(series):
+        kind = "bool"
+    elif pd.api.types.is_numeric_dtype(series):
+        kind = "number"
+    else:
+        kind = "text"
+    values = series.tolist()
+    missing = series.isna().to_numpy()
+    if missing.any():
+        values = [None if m else v for v, m in zip(values, missing.tolist())]
+    return values, kind
+
+
+def column_width(name, values, kind, sample=1000):
+    """Estimate a column width in characters from the header and a sample of its values."""
+    if kind != "text":
+        return max(MIN_COLUMN_WIDTH, len(str(name)) + 2)
+    longest = max((len(str(v)) for v in values[:sample] if v is not None), default=0)
+    return min(max(MIN_COLUMN_WIDTH, len(str(name)) + 2, longest + 1), MAX_COLUMN_WIDTH)
+
+
+def write_assignment_sheet(df, path):
+    """Write a sheet to an .xlsx file, replacing it only once the new file is complete."""
+    if xlsxwriter is None:
+        print("xlsxwriter is not installed; writing the sheet with DataFrame.to_excel")
+        df.to_excel(path, index=False)
+        return
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    workbook = xlsxwriter.Workbook(temp_path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet(SHEET_NAME)
+        header_format = workbook.add_format({'bold': True})
+        columns = [column_cells(df[name]) for name in df.columns]
+
+        for col, (name, (values, kind)) in enumerate(zip(df.columns, columns)):
+            worksheet.set_column(col, col, column_width(name, values, kind))
+            worksheet.write_string(0, col, str(name), header_format)
+        worksheet.freeze_panes(1, 0)
+        worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
+
+        def write_text(row, col, value):
+            # Text is never parsed, so a category starting with "=" stays text instead of becoming a formula
+            if isinstance(value, str):
+                worksheet.write_string(row, col, value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                worksheet.write_number(row, col, value)
+            else:
+                worksheet.write(row, col, value)
+
+        # Constant-memory mode flushes each row once the next one starts, so rows go strictly in order
+        writers = {"number": worksheet.write_number, "bool": worksheet.write_boolean, "text": write_text}
+        column_writers = [(col, values, writers[kind]) for col, (values, kind) in enumerate(columns)]
+        for row in range(len(df)):
+            excel_row = row + 1
+            for col, values, write in column_writers:
+                value = values[row]
+                if value is not None and value != "":
+                    write(excel_row, col, value)
+        workbook.close()
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
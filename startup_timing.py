@@ -0,0 +1,40 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Collect wall-clock durations of the application's startup phases."""
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = []  # List of (phase name, seconds) in the order they finished
+
+    def record(self, name, seconds):
+        """Record the duration of a phase measured elsewhere."""
+        if self.enabled:
+            self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as a startup phase when timing is enabled."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self):
+        """Return the phase timings formatted like `python -X importtime`."""
+        lines = ["startup time: self [us] | cumulative | phase"]
+        cumulative = 0.0
+        for name, seconds in self.phases:
+            cumulative += seconds
+            lines.append(f"startup time: {int(seconds * 1e6):>9} | {int(cumulative * 1e6):>10} | {name}")
+        return "\n".join(lines)
+
+
+# Shared timer used by main.py and the model; disabled unless --startup-timing is given
+startup_timer = StartupTimer()
@@ -0,0 +1,57 @@
+"""Lightweight tracing spans exported in Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+MAX_TRACE_EVENTS = 100000  # Oldest events are dropped beyond this many
+
+
+class Tracer:
+    """Record timed spans while enabled; a disabled tracer costs one attribute check per span."""
+
+    def __init__(self, max_events=MAX_TRACE_EVENTS):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self.last_durations = {}  # Maps span name to its most recent duration in seconds
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name, **args):
+        """Time the enclosed block as a complete ("X") trace event."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.last_durations[name] = end - start
+            self.events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def clear(self):
+        """Drop all recorded events."""
+        self.events.clear()
+        self.last_durations.clear()
+
+    def export_chrome_trace(self, path):
+        """Write the recorded spans as a Chrome trace-event JSON file."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+        print(f"Exported {len(self.events)} trace events to {path}")
+        return len(self.events)
+
+
+# Shared tracer used by the model, controller and views
+tracer = Tracer()
@@ -0,0 +1,56 @@
+import bisect
+import heapq
+from constants import TYPEAHEAD_LIMIT
+
+
+class Typeahead:
+    """Prefix index over a fixed list of dropdown values with optional fuzzy ranking."""
+
+    def __init__(self, values, limit=TYPEAHEAD_LIMIT):
+        self.values = [str(value) for value in values]
+        self.limit = limit
+        # Sorted (lowercase value, original position) pairs for bisect prefix lookups
+        entries = sorted((value.lower(), position) for position, value in enumerate(self.values))
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+        self.lowered = [value.lower() for value in self.values]
+
+    def prefix_matches(self, text):
+        """Return the positions of values starting with text, in catalog order."""
+        lo = bisect.bisect_left(self.keys, text)
+        hi = bisect.bisect_left(self.keys, text + "\uffff", lo)
+        return sorted(self.positions[lo:hi])
+
+    def search(self, text, fuzzy=False):
+        """Return up to `limit` values matching the typed text.
+
+        Prefix matches are returned in catalog order. With fuzzy, a text that
+        prefixes nothing falls back to substring and then subsequence matches,
+        ranked by how early and how tightly the typed characters appear. Every
+        value is scored and the best `limit` are kept.
+        """
+        text = text.strip().lower()
+        if not text:
+            return list(self.values)
+        positions = self.prefix_matches(text)[:self.limit]
+        if fuzzy and not positions:
+            scored = ((self.fuzzy_score(text, value), position) for position, value in enumerate(self.lowered))
+            ranked = heapq.nsmallest(self.limit, (entry for entry in scored if entry[0] is not None))
+            positions = [position for _, position in ranked]
+        return [self.values[position] for position in positions]
+
+    @staticmethod
+    def fuzzy_score(text, value):
+        """Score a substring/subsequence match of text in value; lower is better, None if no match."""
+        start = value.find(text)
+        if start >= 0:
+            return (0, start, len(text))
+        index = -1
+        first = None
+        for char in text:
+            index = value.find(char, index + 1)
+            if index < 0:
+                return None
+            if first is None:
+                first = index
+        return (1, index - first, first)
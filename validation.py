@@ -0,0 +1,129 @@
+"""Catalog consistency checks for the assignment sheet, vectorized over the whole sheet."""
+import difflib
+import numpy as np
+import pandas as pd
+from assignment_sheet import normalize_assignments
+
+UNKNOWN_FAMILY = "unknown family"
+INVALID_CATEGORY = "category not in family"
+ORPHANED_CATEGORY = "category without family"
+MISSING_CATEGORY = "family without category"
+ISSUE_TYPES = [UNKNOWN_FAMILY, INVALID_CATEGORY, ORPHANED_CATEGORY, MISSING_CATEGORY]
+PAIR_SEPARATOR = "\x1f"  # Cannot appear in a cell typed into Excel
+
+
+def normalize_name(value):
+    """Fold case and whitespace so near-identical spellings compare equal."""
+    return " ".join(value.split()).lower()
+
+
+def closest_name(value, candidates):
+    """Return the catalog name a misspelled value most likely means, or an empty string."""
+    by_normalized = {normalize_name(candidate): candidate for candidate in candidates}
+    match = by_normalized.get(normalize_name(value))
+    if match is not None:
+        return match
+    matches = difflib.get_close_matches(normalize_name(value), list(by_normalized), n=1, cutoff=0.8)
+    return by_normalized[matches[0]] if matches else ""
+
+
+def validate_assignments(df, families, categories, include_incomplete=False):
+    """Check every row's Family/Category against the catalog in one pass.
+
+    Families and (family, category) pairs are encoded as categorical codes over
+    the catalog, so membership is a code >= 0 test. Returns a DataFrame with one
+    row per problem cell: 'row', the location columns, Family, Category,
+    'issue' and the suggested 'fix_family'/'fix_category' ("" if none).
+    A family without a category is how the Shelf View leaves a shelf that is
+    still being filled in, so those rows are only reported with include_incomplete.
+    """
+    sheet = normalize_assignments(df)
+    family_codes = pd.Categorical(sheet['Family'], categories=pd.unique(pd.Series(families, dtype=object))).codes
+    pairs = [family + PAIR_SEPARATOR + category for family in families for category in categories.get(family, [])]
+    pair_codes = pd.Categorical(sheet['Family'] + PAIR_SEPARATOR + sheet['Category'], categories=pd.unique(pd.Series(pairs, dtype=object))).codes
+
+    has_family = (sheet['Family'] != "").to_numpy()
+    has_category = (sheet['Category'] != "").to_numpy()
+    issue = np.select(
+        [
+            has_family & (family_codes < 0),
+            has_family & has_category & (pair_codes < 0),
+            ~has_family & has_category,
+            has_family & ~has_category & include_incomplete,
+        ],
+        ISSUE_TYPES,
+        default="",
+    )
+    issues = sheet[issue != ""].copy()
+    issues['issue'] = issue[issue != ""]
+    issues = issues.rename_axis('row').reset_index()
+    suggest_fixes(issues, families, categories)
+    return issues
+
+
+def suggest_fixes(issues, families, categories):
+    """Fill 'fix_family'/'fix_category' with the catalog values each issue most likely meant."""
+    issues['fix_family'] = issues['Family']
+    issues['fix_category'] = issues['Category']
+    # Suggestions are computed once per distinct value, then mapped back onto the rows
+    unknown = issues['issue'] == UNKNOWN_FAMILY
+    family_fixes = {value: closest_name(value, families) for value in issues.loc[unknown, 'Family'].unique()}
+    issues.loc[unknown, 'fix_family'] = issues.loc[unknown, 'Family'].map(family_fixes)
+
+    needs_category = issues['issue'].isin([UNKNOWN_FAMILY, INVALID_CATEGORY]) & (issues['fix_family'] != "")
+    pairs = issues.loc[needs_category, ['fix_family', 'Category']].drop_duplicates()
+    category_fixes = {
+        (family, category): closest_name(category, categories.get(family, []))
+        for family, category in zip(pairs['fix_family'], pairs['Category'])
+    }
+    issues.loc[needs_category, 'fix_category'] = [
+        category_fixes[key] for key in zip(issues.loc[needs_category, 'fix_family'], issues.loc[needs_category, 'Category'])
+    ]
+
+    # A category belonging to exactly one family identifies the missing family
+    orphaned = issues['issue'] == ORPHANED_CATEGORY
+    owners = {}
+    for family in families:
+        for category in categories.get(family, []):
+            owners.setdefault(category, set()).add(family)
+    owner = {category: next(iter(names)) for category, names in owners.items() if len(names) == 1}
+    issues.loc[orphaned, 'fix_family'] = issues.loc[orphaned, 'Category'].map(owner).fillna("")
+
+    # A family with a single category can only mean that category
+    missing = issues['issue'] == MISSING_CATEGORY
+    only_category = {family: values[0] for family, values in categories.items() if len(values) == 1}
+    issues.loc[missing, 'fix_category'] = issues.loc[missing, 'Family'].map(only_category).fillna("")
+
+    unfixable = (issues['fix_family'] == "") | (issues['fix_category'] == "")
+    issues.loc[unfixable, ['fix_family', 'fix_category']] = ""
+
+
+def summarize_issues(issues):
+    """Count issues per (section, aisle, side) and issue type, largest groups first."""
+    if issues.empty:
+        return pd.DataFrame(columns=['Section', 'Aisle', 'Side'] + ISSUE_TYPES + ['total'])
+    counts = issues.pivot_table(index=['Section', 'Aisle', 'Side'], columns='issue', values='row', aggfunc='count', fill_value=0)
+    counts = counts.reindex(columns=ISSUE_TYPES, fill_value=0)
+    counts['total'] = counts.sum(axis=1)
+    return counts.sort_values('total', ascending=False).reset_index()
+
+
+def issue_counts(issues):
+    """Return a one-line summary such as "3 unknown family, 1 category not in family"."""
+    counts = issues['issue'].value_counts()
+    return ", ".join(f"{counts[name]} {name}" for name in ISSUE_TYPES if name in counts)
+
+
+def fix_assignments(issues, mode):
+    """Return the 'row'/'Family'/'Category' writes for a bulk fix.
+
+    mode "suggested" applies the suggested catalog values where one exists;
+    mode "clear" blanks every problem cell.
+    """
+    if mode == "suggested":
+        fixable = issues[issues['fix_family'] != ""]
+        return pd.DataFrame({'row': fixable['row'], 'Family': fixable['fix_family'], 'Category': fixable['fix_category']})
+    if mode == "clear":
+        return pd.DataFrame({'row': issues['row'], 'Family': "", 'Category': ""})
+    raise ValueError(f"Unknown fix mode: {mode}")
+
@@ -0,0 +1,78 @@
+import tkinter as tk
+from tkinter import ttk
+from constants import LARGE_FONT, BUTTON_STYLE, CUSTOM_FRAME_STYLE, TREEVIEW_STYLE
+from merge import OURS, THEIRS
+
+
+class ConflictDialog:
+    """List of merge conflicts; resolve by keeping yours or taking theirs."""
+
+    def __init__(self, parent, controller):
+        self.controller = controller
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Merge Conflicts")
+        self.window.transient(parent)
+        frame = ttk.Frame(self.window, style=CUSTOM_FRAME_STYLE, padding=10)
+        frame.pack(fill="both", expand=True)
+
+        self.summary_label = ttk.Label(frame, font=LARGE_FONT)
+        self.summary_label.pack(anchor="w", pady=(0, 10))
+
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("location", "base", "ours", "theirs"), show="headings", style=TREEVIEW_STYLE)
+        for column, heading, width in (("location", "Location", 160), ("base", "Ancestor", 180), ("ours", "Yours", 180), ("theirs", "Theirs", 180)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width)
+        yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=yscroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+        self.tree.bind("<Double-1>", self.on_double_click)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="Keep Mine", command=lambda: self.resolve(OURS), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Take Theirs", command=lambda: self.resolve(THEIRS), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Keep All Mine", command=lambda: self.resolve(OURS, everything=True), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Take All Theirs", command=lambda: self.resolve(THEIRS, everything=True), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy, style=BUTTON_STYLE).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def is_open(self):
+        return bool(self.window.winfo_exists())
+
+    def refresh(self):
+        """List the unresolved conflicts; item ids are positions in the conflict list."""
+        self.tree.delete(*self.tree.get_children())
+        if self.controller.conflicts is None:
+            self.summary_label.config(text="All conflicts resolved. Save to keep the merged sheet.")
+            return
+        conflicts = self.controller.conflicts.conflicts
+        self.summary_label.config(text=f"{len(conflicts)} shelves changed in both copies")
+        for position, row in enumerate(conflicts.itertuples(index=False)):
+            self.tree.insert("", "end", iid=str(position), values=(
+                f"{row.Section}-{row.Aisle}-{row.Side} L{row.Level} S{row.Shelf}",
+                f"{row.Family_base} / {row.Category_base}",
+                f"{row.Family_ours} / {row.Category_ours}",
+                f"{row.Family_theirs} / {row.Category_theirs}",
+            ))
+
+    def resolve(self, choice, everything=False):
+        if self.controller.conflicts is None:
+            return
+        items = self.tree.get_children() if everything else self.tree.selection()
+        if not items:
+            return
+        self.controller.resolve_conflicts(sorted(int(item) for item in items), choice)
+        self.refresh()
+
+    def on_double_click(self, event):
+        """Show the conflicting shelf in the Shelf View."""
+        item = self.tree.focus()
+        if not item or self.controller.conflicts is None:
+            return
+        row = self.controller.conflicts.conflicts.iloc[int(item)]
+        self.controller.jump_to_location(row['Section'], int(row['Aisle']), int(row['Side']), [(int(row['Level']), int(row['Shelf']))])
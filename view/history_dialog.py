@@ -0,0 +1,71 @@
+import time
+import tkinter as tk
+from tkinter import ttk
+from constants import LARGE_FONT, BUTTON_STYLE, CUSTOM_FRAME_STYLE, TREEVIEW_STYLE
+
+
+class HistoryDialog:
+    """Browser listing saved versions, with read-only preview and restore."""
+
+    def __init__(self, parent, controller):
+        self.controller = controller
+        self.versions = {}  # Maps tree item id to its version entry
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Version History")
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        frame = ttk.Frame(self.window, style=CUSTOM_FRAME_STYLE, padding=10)
+        frame.pack(fill="both", expand=True)
+
+        ttk.Label(frame, text="Saved versions (newest first)", font=LARGE_FONT).pack(anchor="w", pady=(0, 10))
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("time", "label", "rows", "new_blocks"), show="headings", selectmode="browse", style=TREEVIEW_STYLE)
+        for column, heading, width in (("time", "Saved", 160), ("label", "Label", 100), ("rows", "Shelves", 80), ("new_blocks", "Changed Sides", 110)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width)
+        yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=yscroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self.preview())
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="Preview", command=self.preview, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Stop Preview", command=self.controller.stop_version_preview, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Restore", command=self.restore, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Close", command=self.close, style=BUTTON_STYLE).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        self.versions.clear()
+        for version in self.controller.model.get_history().list_versions():
+            saved = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(version["time"]))
+            item = self.tree.insert("", "end", values=(saved, version["label"], version["rows"], version.get("new_blocks", "")))
+            self.versions[item] = version
+
+    def selected_version(self):
+        selection = self.tree.selection()
+        return self.versions.get(selection[0]) if selection else None
+
+    def preview(self):
+        version = self.selected_version()
+        if version is not None:
+            saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(version["time"]))
+            self.controller.show_version_preview(version["id"], saved)
+
+    def restore(self):
+        version = self.selected_version()
+        if version is None:
+            return
+        saved = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(version["time"]))
+        if self.controller.view.ask_yes_no("Restore Version", f"Replace the current assignments with the version saved {saved}?"):
+            self.controller.restore_version(version["id"])
+
+    def close(self):
+        self.controller.stop_version_preview()
+        self.window.destroy()
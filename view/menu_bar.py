@@ -8,5 +8,50 @@ def create_menu_bar(root, controller):
     # File menu
     file_menu = tk.Menu(menubar, tearoff=0)
     menubar.add_cascade(label="File", menu=file_menu)
+    file_menu.add_command(label="Version History...", command=controller.open_history)
+    file_menu.add_command(label="Compare With...", command=controller.load_comparison)
+    file_menu.add_command(label="Export Change List...", command=controller.export_change_list)
+    file_menu.add_command(label="Export Side Image...", command=controller.export_side_image)
+    file_menu.add_command(label="Clear Comparison", command=controller.clear_comparison)
+    file_menu.add_separator()
+    file_menu.add_command(label="Merge With...", command=controller.merge_with)
+    file_menu.add_command(label="Merge Conflicts...", command=controller.open_conflicts)
+    file_menu.add_separator()
+    file_menu.add_command(label="Print Queue...", command=controller.open_print_queue)
+    file_menu.add_separator()
     file_menu.add_command(label="Exit", command=root.quit)
+    
+    # Edit menu
+    edit_menu = tk.Menu(menubar, tearoff=0)
+    menubar.add_cascade(label="Edit", menu=edit_menu)
+    edit_menu.add_command(label="Undo Bulk Edit", accelerator="Ctrl+Z", command=controller.undo)
+    edit_menu.add_separator()
+    edit_menu.add_command(label="Validate Catalog...", command=controller.open_validation)
+    root.bind("<Control-z>", controller.undo)
+    
+    # View menu
+    view_menu = tk.Menu(menubar, tearoff=0)
+    menubar.add_cascade(label="View", menu=view_menu)
+    view_menu.add_command(label="Next Aisle", accelerator="Alt+Right", command=controller.next_aisle)
+    view_menu.add_command(label="Previous Aisle", accelerator="Alt+Left", command=controller.previous_aisle)
+    view_menu.add_command(label="Flip Side", accelerator="Alt+Up", command=controller.flip_side)
+    root.bind("<Alt-Right>", controller.next_aisle)
+    root.bind("<Alt-Left>", controller.previous_aisle)
+    root.bind("<Alt-Up>", controller.flip_side)
+    view_menu.add_command(label="Reset Zoom", command=controller.reset_zoom)
+    view_menu.add_command(label="Toggle Performance HUD", command=controller.toggle_performance_hud)
+    view_menu.add_separator()
+    view_menu.add_command(label="Start/Stop Tracing", command=controller.toggle_tracing)
+    view_menu.add_command(label="Export Trace...", command=controller.export_trace)
+    
+    # Store menu (workspace mode only)
+    store_names = controller.get_store_names()
+    if store_names:
+        store_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Store", menu=store_menu)
+        store_var = tk.StringVar(root, value=controller.workspace.current)
+        for name in store_names:
+            store_menu.add_radiobutton(label=name, variable=store_var, value=name,
+                                       command=lambda name=name: controller.switch_store(name))
+        root.store_var = store_var  # Keep a reference so the selection is not garbage collected
     print("Created menu bar")
\ No newline at end of file
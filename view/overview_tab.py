@@ -0,0 +1,123 @@
+import time
+import tkinter as tk
+from tkinter import ttk
+from PIL import Image, ImageTk
+from constants import *
+from overview import build_side_grids, family_palette, tile_pixels
+from tracing import tracer
+
+
+class OverviewTab:
+    """Whole-store overview: one image tile per side, click a tile to open it in the Shelf View."""
+
+    def __init__(self, tab, controller, view):
+        self.tab = tab
+        self.controller = controller
+        self.view = view
+        self.canvas = None
+        self.mode_var = None
+        self.status_label = None
+        self.stale = True  # Redraw the next time the tab is shown
+        self.images = []  # PhotoImage references; Tk drops images that are not referenced
+        self.tiles = {}  # Maps canvas item id to its (section, aisle, side)
+
+    def create(self):
+        """Create the overview tab with a mode switch and a scrollable tile canvas."""
+        frame = ttk.Frame(self.tab, style=CUSTOM_FRAME_STYLE)
+        frame.pack(padx=20, pady=20, fill="both", expand=True)
+
+        controls = ttk.Frame(frame, style=CUSTOM_FRAME_STYLE)
+        controls.pack(fill="x", pady=(0, 10))
+        ttk.Label(controls, text="Color by:", font=LARGE_FONT).pack(side="left", padx=5)
+        self.mode_var = tk.StringVar(value="family")
+        ttk.Radiobutton(controls, text="Family", variable=self.mode_var, value="family", command=self.redraw).pack(side="left", padx=5)
+        ttk.Radiobutton(controls, text="Fill rate", variable=self.mode_var, value="fill", command=self.redraw).pack(side="left", padx=5)
+        self.status_label = ttk.Label(controls, text="")
+        self.status_label.pack(side="right", padx=5)
+
+        canvas_frame = ttk.Frame(frame, style=CUSTOM_FRAME_STYLE)
+        canvas_frame.pack(fill="both", expand=True)
+        self.canvas = tk.Canvas(canvas_frame, bg=CANVAS_BG_COLOR)
+        yscroll = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=yscroll.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+        self.canvas.tag_bind("tile", "<Button-1>", self.on_tile_click)
+
+        self.controller.model.subscribe(self.on_model_changed)
+        print("Created Overview tab")
+
+    def bind_model(self, old_model, model):
+        """Switch the overview to another store's model."""
+        old_model.unsubscribe(self.on_model_changed)
+        model.subscribe(self.on_model_changed)
+        self.stale = True
+
+    def on_model_changed(self, event):
+        """Mark the tiles stale; redraw once the current event burst is over if the tab is showing."""
+        was_stale = self.stale
+        self.stale = True
+        if not was_stale and self.view.notebook.select() == str(self.tab):
+            self.canvas.after_idle(self.refresh)
+
+    def refresh(self):
+        """Redraw if the model changed since the last draw; called when the tab is shown."""
+        if self.stale:
+            self.redraw()
+
+    def redraw(self):
+        """Lay out one tile per side, grouped in rows by section."""
+        start = time.perf_counter()
+        self.canvas.delete("all")
+        self.images.clear()
+        self.tiles.clear()
+        model = self.controller.model
+        if model.df is None:
+            return
+        with tracer.span("overview_grids"):
+            grids = build_side_grids(model.df, model.families)
+        palette = family_palette(len(model.families))
+        mode = self.mode_var.get()
+        canvas_width = max(self.canvas.winfo_width(), 400)
+
+        with tracer.span("overview_tiles", tiles=len(grids)):
+            x = y = OVERVIEW_PADDING
+            row_height = 0
+            section = None
+            for grid in grids:
+                if grid.section != section:
+                    # Each section starts a new row with its name
+                    section = grid.section
+                    if x > OVERVIEW_PADDING:
+                        y += row_height + OVERVIEW_PADDING
+                    self.canvas.create_text(OVERVIEW_PADDING, y, text=f"Section {section}", anchor="nw", font=LARGE_FONT)
+                    y += 28
+                    x = OVERVIEW_PADDING
+                    row_height = 0
+                levels, shelves = grid.codes.shape
+                cell_px = max(1, min(OVERVIEW_CELL_PX, OVERVIEW_TILE_MAX_WIDTH // shelves))
+                image = ImageTk.PhotoImage(Image.fromarray(tile_pixels(grid, mode, palette, cell_px), "RGB"))
+                if x + image.width() > canvas_width and x > OVERVIEW_PADDING:
+                    x = OVERVIEW_PADDING
+                    y += row_height + OVERVIEW_PADDING
+                    row_height = 0
+                self.canvas.create_text(x, y, text=f"A{grid.aisle} S{grid.side}", anchor="nw", font=('Helvetica', 8))
+                item = self.canvas.create_image(x, y + 14, image=image, anchor="nw", tags="tile")
+                self.images.append(image)
+                self.tiles[item] = (grid.section, grid.aisle, grid.side)
+                x += image.width() + OVERVIEW_PADDING
+                row_height = max(row_height, image.height() + 14)
+            self.canvas.configure(scrollregion=(0, 0, canvas_width, y + row_height + OVERVIEW_PADDING))
+        self.stale = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.status_label.config(text=f"{len(grids)} sides in {elapsed_ms:.0f} ms")
+        print(f"Drew overview of {len(grids)} sides in {elapsed_ms:.1f} ms")
+
+    def on_tile_click(self, event):
+        """Open the clicked side in the Shelf View."""
+        items = self.canvas.find_withtag("current")
+        if not items or items[0] not in self.tiles:
+            return
+        section, aisle, side = self.tiles[items[0]]
+        self.view.notebook.select(self.view.shelf_tab_frame)
+        self.controller.jump_to_location(section, aisle, side, [])
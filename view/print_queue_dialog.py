@@ -0,0 +1,56 @@
+import tkinter as tk
+from tkinter import ttk
+from constants import LARGE_FONT, BUTTON_STYLE, CUSTOM_FRAME_STYLE, TREEVIEW_STYLE
+
+
+class PrintQueueDialog:
+    """Status of queued and finished print jobs, with cancel."""
+
+    def __init__(self, parent, controller):
+        self.controller = controller
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Print Queue")
+        self.window.transient(parent)
+        frame = ttk.Frame(self.window, style=CUSTOM_FRAME_STYLE, padding=10)
+        frame.pack(fill="both", expand=True)
+
+        ttk.Label(frame, text="Print jobs", font=LARGE_FONT).pack(anchor="w", pady=(0, 10))
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("job", "title", "status", "message"), show="headings", style=TREEVIEW_STYLE)
+        for column, heading, width in (("job", "Job", 50), ("title", "Layout", 180), ("status", "Status", 100), ("message", "Details", 320)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width)
+        yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=yscroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="Cancel Job", command=self.cancel, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Clear Finished", command=self.clear_finished, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy, style=BUTTON_STYLE).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def is_open(self):
+        return bool(self.window.winfo_exists())
+
+    def refresh(self):
+        """List every job; item ids are job ids so the selection survives refreshes."""
+        selection = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for job in self.controller.get_print_spooler().jobs:
+            self.tree.insert("", "end", iid=str(job.job_id), values=(job.job_id, job.title, job.status, job.message))
+        self.tree.selection_set([item for item in selection if self.tree.exists(item)])
+
+    def cancel(self):
+        for item in self.tree.selection():
+            self.controller.cancel_print_job(int(item))
+        self.refresh()
+
+    def clear_finished(self):
+        self.controller.get_print_spooler().clear_finished()
+        self.refresh()
@@ -0,0 +1,68 @@
+"""Printing and PDF export of the Shelf View.
+
+The side is drawn into the PDF from the same display list as the screen;
+printing goes through the controller's print spooler. Imported lazily the
+first time the Print dialog opens so that reportlab does not slow down
+application startup.
+"""
+from tkinter import filedialog
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas as reportlab_canvas
+from render import render_reportlab
+
+
+def write_layout_pdf(display_list, colors, section, aisle, side, file_path):
+    """Write a landscape letter PDF with a header and the side drawn as vectors from its display list."""
+    pdf_width, pdf_height = landscape(letter)
+    margin = 0.5 * inch
+    header_height = 130
+    
+    c = reportlab_canvas.Canvas(file_path, pagesize=landscape(letter))
+    c.setFont("Helvetica-Bold", 16)
+    c.drawCentredString(pdf_width / 2, pdf_height - 50, "Shelf Layout")
+    c.setFont("Helvetica", 12)
+    c.drawCentredString(pdf_width / 2, pdf_height - 80, f"Section: {section}")
+    c.drawCentredString(pdf_width / 2, pdf_height - 100, f"Aisle: {aisle}")
+    c.drawCentredString(pdf_width / 2, pdf_height - 120, f"Side: {side}")
+    render_reportlab(display_list, colors, c, margin, margin, pdf_width - 2 * margin, pdf_height - 2 * margin - header_height)
+    c.showPage()
+    c.save()
+
+
+def save_as_pdf(shelf_tab, section, aisle, side, dialog):
+    """Save the shelf layout as a PDF file."""
+    dialog.destroy()
+    
+    display_list = shelf_tab.whole_side_display_list()
+    if display_list is None:
+        shelf_tab.view.show_message("Warning", "Please select Section, Aisle, and Side values before saving.")
+        return
+    file_path = filedialog.asksaveasfilename(
+        defaultextension=".pdf",
+        filetypes=[("PDF files", "*.pdf")],
+        title="Save Shelf Layout as PDF"
+    )
+    if not file_path:
+        return
+    
+    try:
+        write_layout_pdf(display_list, shelf_tab.controller.model.color_map.colors, section, aisle, side, file_path)
+        shelf_tab.view.show_message("Success", f"Shelf layout saved as PDF to {file_path}")
+    except Exception as e:
+        shelf_tab.view.show_message("Error", f"Failed to save PDF: {str(e)}")
+
+def print_to_printer(shelf_tab, section, aisle, side, dialog):
+    """Queue the shelf layout on the print spooler, which renders and prints it in the background."""
+    dialog.destroy()
+    
+    display_list = shelf_tab.whole_side_display_list()
+    if display_list is None:
+        shelf_tab.view.show_message("Warning", "Please select Section, Aisle, and Side values before printing.")
+        return
+    # The display list is immutable; the colors are copied so later catalog changes cannot reach the worker thread
+    colors = dict(shelf_tab.controller.model.color_map.colors)
+    shelf_tab.controller.submit_print_job(
+        f"Section {section}, Aisle {aisle}, Side {side}",
+        lambda pdf_path: write_layout_pdf(display_list, colors, section, aisle, side, pdf_path)
+    )
@@ -0,0 +1,84 @@
+import tkinter as tk
+from tkinter import ttk
+from constants import LARGE_FONT, BUTTON_STYLE, CUSTOM_FRAME_STYLE
+
+
+def parse_numbers(text, maximum):
+    """Parse "1-4, 6" into a sorted list of numbers within 1..maximum; blank means all."""
+    text = text.strip()
+    if not text:
+        return list(range(1, maximum + 1))
+    numbers = set()
+    for part in text.split(","):
+        low, _, high = part.strip().partition("-")
+        low = int(low)
+        high = int(high) if high else low
+        numbers.update(range(max(low, 1), min(high, maximum) + 1))
+    return sorted(numbers)
+
+
+class ReplicateDialog:
+    """Dialog choosing the sides the current side's layout is copied to."""
+
+    def __init__(self, parent, controller, section, aisle, side):
+        self.controller = controller
+        self.source = (section, int(aisle), int(side))
+        self.shelf_structure = controller.model.get_shelf_structure()
+        self.sections = list(self.shelf_structure.keys())
+        source_config = self.shelf_structure[section]
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Replicate Layout")
+        self.window.transient(parent)
+        frame = ttk.Frame(self.window, style=CUSTOM_FRAME_STYLE, padding=10)
+        frame.pack(fill="both", expand=True)
+
+        ttk.Label(frame, text=f"Copy Section {section}, Aisle {aisle}, Side {side} to:", font=LARGE_FONT).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
+
+        ttk.Label(frame, text="Aisles (e.g. 1-4, 6; blank for all):").grid(row=1, column=0, sticky="w")
+        self.aisles_var = tk.StringVar()
+        ttk.Entry(frame, textvariable=self.aisles_var, width=20).grid(row=1, column=1, sticky="w", pady=2)
+
+        ttk.Label(frame, text="Sides:").grid(row=2, column=0, sticky="w")
+        sides_frame = ttk.Frame(frame)
+        sides_frame.grid(row=2, column=1, sticky="w", pady=2)
+        self.side_vars = {}
+        for number in range(1, max(config["sides"] for config in self.shelf_structure.values()) + 1):
+            self.side_vars[number] = tk.BooleanVar(value=True)
+            ttk.Checkbutton(sides_frame, text=str(number), variable=self.side_vars[number]).pack(side="left")
+
+        # Sections list their levels x shelves; ones matching the source are marked compatible
+        ttk.Label(frame, text="Sections:").grid(row=3, column=0, sticky="nw")
+        self.section_list = tk.Listbox(frame, selectmode="extended", height=min(len(self.sections), 12), exportselection=False)
+        for index, name in enumerate(self.sections):
+            config = self.shelf_structure[name]
+            compatible = (config["max_levels"], config["max_shelves"]) == (source_config["max_levels"], source_config["max_shelves"])
+            self.section_list.insert("end", f"{name} ({config['max_levels']}x{config['max_shelves']}){' - compatible' if compatible else ''}")
+            if name == section:
+                self.section_list.selection_set(index)
+        self.section_list.grid(row=3, column=1, sticky="we", pady=2)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(button_frame, text="Apply", command=self.apply, style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy, style=BUTTON_STYLE).pack(side="left", padx=5)
+
+    def get_targets(self):
+        """Return the (section, aisle, side) targets chosen in the dialog."""
+        sides = [number for number, var in self.side_vars.items() if var.get()]
+        targets = []
+        for index in self.section_list.curselection():
+            section = self.sections[index]
+            config = self.shelf_structure[section]
+            for aisle in parse_numbers(self.aisles_var.get(), config["aisles"]):
+                targets.extend((section, aisle, side) for side in sides if side <= config["sides"])
+        return targets
+
+    def apply(self):
+        try:
+            targets = self.get_targets()
+        except ValueError:
+            self.controller.view.show_message("Warning", "Invalid aisle list. Use numbers and ranges such as 1-4, 6.")
+            return
+        if self.controller.replicate_layout(self.source, targets):
+            self.window.destroy()
@@ -1,25 +1,12 @@
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import pandas as pd
-import os
-import subprocess
-import platform
-import pyautogui
-import shutil
-from PIL import Image, ImageTk
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch  # Added import for inch
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfgen import canvas as reportlab_canvas
-from reportlab.platypus import SimpleDocTemplate, Image as ReportLabImage
+from tkinter import ttk
 from constants import *
-
-try:
-    import win32api
-    import win32print
-except ImportError:
-    win32api = None
-    win32print = None
+from layout import base_cell_size, grid_frame, offset_rect, offset_cells
+from display_list import SideData
+from render import render_tk
+from tracing import tracer
+from events import DataReloaded, CatalogUpdated
 
 class ShelfTab:
     def __init__(self, tab, controller, view):
@@ -35,8 +22,18 @@ class ShelfTab:
         self.initial_cell_height = None
         self.initial_aspect_ratio = None
         self.scale_factor = 1.0
-        self.front_face_ids = {}
-        self.cell_coords = {}
+        self.zoom = 1.0  # User zoom on top of scale_factor; 1.0 fits the whole side
+        self.pan_x = 0.0  # User pan of the grid in pixels
+        self.pan_y = 0.0
+        self.view_side = None  # (section, aisle, side) the zoom and pan apply to
+        self.last_filtered_df = None  # Data of the side on screen, redrawn directly while panning
+        self.last_side_data = None  # SideData of the side on screen
+        self.visible_coords = {}  # Canvas rectangles of the cells materialized (inside the viewport plus margin)
+        self.viewport = (0, 0, 0, 0)  # Canvas region, plus margin, in which cells are materialized
+        self.grid_origin = (0, 0)  # Canvas position of the top-left cell's front face, on screen or not
+        self.pan_start = None  # Last pointer position while dragging with the middle button
+        self.pan_redraw_pending = None  # after id of the redraw following a pan
+        self.front_face_ids = {}  # Maps front face tag to its canvas item id
         self.section_var = None
         self.aisle_var = None
         self.side_var = None
@@ -47,6 +44,15 @@ class ShelfTab:
         self.canvas = None
         self.clear_button = None
         self.print_button = None
+        self.replicate_button = None
+        self.committed_family = None
+        self.show_performance_hud = False
+        self.repaint_pending = None  # after_idle id of a queued repaint
+        self.locate_tree = None
+        self.locate_family_var = None
+        self.locate_hits = {}  # Maps Locate tree item id to (section, aisle, side, cells)
+        self.compare_cells = {}  # Maps (level, shelf) to (change, old text, new text) for the compare overlay
+        self.compare_tip_cell = None  # Cell whose old value is shown in the hover tip
         self.base_dropdown_width = 7
         self.base_dropdown_font_size = 8
 
@@ -88,23 +94,31 @@ class ShelfTab:
         
         ttk.Label(self.dropdown_frame, text="Family:", font=LARGE_FONT).grid(row=0, column=6, padx=5, sticky="e")
         self.family_var = tk.StringVar()
-        self.family_dropdown = ttk.Combobox(self.dropdown_frame, textvariable=self.family_var, values=self.families, state="readonly", style=COMBOBOX_STYLE, font=DROPDOWN_FONT, width=self.base_dropdown_width)
+        self.family_dropdown = ttk.Combobox(self.dropdown_frame, textvariable=self.family_var, values=self.families, state="normal", style=COMBOBOX_STYLE, font=DROPDOWN_FONT, width=self.base_dropdown_width)
         self.family_dropdown.grid(row=0, column=7, padx=5, sticky="w")
         self.family_dropdown.bind("<<ComboboxSelected>>", self.controller.on_family_changed)
+        self.family_dropdown.bind("<KeyRelease>", lambda e: self.controller.on_typeahead_key_release(e, self.family_dropdown, lambda: self.controller.model.family_typeahead))
+        self.family_dropdown.bind("<Return>", self.on_family_typed)
+        self.family_dropdown.bind("<FocusOut>", self.on_family_typed)
         print("Added Family dropdown")
         
         ttk.Label(self.dropdown_frame, text="Category:", font=LARGE_FONT).grid(row=0, column=8, padx=5, sticky="e")
         self.category_var = tk.StringVar()
-        self.category_dropdown = ttk.Combobox(self.dropdown_frame, textvariable=self.category_var, state="readonly", style=COMBOBOX_STYLE, font=DROPDOWN_FONT, width=self.base_dropdown_width)
+        self.category_dropdown = ttk.Combobox(self.dropdown_frame, textvariable=self.category_var, state="normal", style=COMBOBOX_STYLE, font=DROPDOWN_FONT, width=self.base_dropdown_width)
         self.category_dropdown.grid(row=0, column=9, padx=5, sticky="w")
+        self.category_dropdown.bind("<KeyRelease>", lambda e: self.controller.on_typeahead_key_release(e, self.category_dropdown, self.current_category_typeahead))
+        self.category_dropdown.bind("<Return>", self.on_category_typed)
+        self.category_dropdown.bind("<FocusOut>", self.on_category_typed)
         print("Added Category dropdown")
         
         self.canvas_frame = ttk.Frame(frame, style=CUSTOM_FRAME_STYLE)
         self.canvas_frame.pack(fill="both", expand=True)
         print("Created canvas frame for Shelf View tab")
         
+        self.create_locate_panel()
+        
         self.canvas = tk.Canvas(self.canvas_frame, bg=CANVAS_BG_COLOR)
-        self.canvas.pack(fill="both", expand=True)
+        self.canvas.pack(side="left", fill="both", expand=True)
         print("Created canvas for 3D shelf visualization")
         
         self.canvas.bind("<Button-1>", self.controller.start_selection)
@@ -115,6 +129,26 @@ class ShelfTab:
         self.canvas.bind("<Configure>", self.controller.on_resize)
         print("Bound resize event to canvas")
         
+        self.canvas.bind("<Motion>", self.on_canvas_motion)
+        
+        # Zoom with Ctrl+wheel, pan with the wheel (Shift for horizontal) or a middle-button drag
+        self.canvas.bind("<Control-MouseWheel>", lambda e: self.zoom_at(e.x, e.y, SHELF_ZOOM_STEP if e.delta > 0 else 1 / SHELF_ZOOM_STEP))
+        self.canvas.bind("<Control-Button-4>", lambda e: self.zoom_at(e.x, e.y, SHELF_ZOOM_STEP))
+        self.canvas.bind("<Control-Button-5>", lambda e: self.zoom_at(e.x, e.y, 1 / SHELF_ZOOM_STEP))
+        self.canvas.bind("<MouseWheel>", lambda e: self.pan_by(0, WHEEL_PAN_PIXELS if e.delta > 0 else -WHEEL_PAN_PIXELS))
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self.pan_by(WHEEL_PAN_PIXELS if e.delta > 0 else -WHEEL_PAN_PIXELS, 0))
+        self.canvas.bind("<Button-4>", lambda e: self.pan_by(0, WHEEL_PAN_PIXELS))
+        self.canvas.bind("<Button-5>", lambda e: self.pan_by(0, -WHEEL_PAN_PIXELS))
+        self.canvas.bind("<Shift-Button-4>", lambda e: self.pan_by(WHEEL_PAN_PIXELS, 0))
+        self.canvas.bind("<Shift-Button-5>", lambda e: self.pan_by(-WHEEL_PAN_PIXELS, 0))
+        self.canvas.bind("<ButtonPress-2>", self.start_pan)
+        self.canvas.bind("<B2-Motion>", self.drag_pan)
+        self.canvas.bind("<ButtonRelease-2>", lambda e: setattr(self, "pan_start", None))
+        self.canvas.bind("<Double-Button-2>", lambda e: self.reset_zoom())
+        self.canvas.bind("<Leave>", lambda e: self.hide_compare_tip())
+        
+        self.controller.model.subscribe(self.on_model_changed)
+        
         button_frame = ttk.Frame(frame, style=CUSTOM_FRAME_STYLE)
         button_frame.pack(pady=10)
         
@@ -125,6 +159,84 @@ class ShelfTab:
         self.print_button = ttk.Button(button_frame, text="Print Shelf Layout", command=self.print_shelf_layout, style=BUTTON_STYLE)
         self.print_button.grid(row=0, column=1, padx=5)
         print("Added Print Shelf Layout button to Shelf View tab")
+        
+        self.replicate_button = ttk.Button(button_frame, text="Replicate Layout...", command=self.open_replicate_dialog, style=BUTTON_STYLE)
+        self.replicate_button.grid(row=0, column=2, padx=5)
+        print("Added Replicate Layout button to Shelf View tab")
+
+    def open_replicate_dialog(self):
+        """Open the dialog copying the current side's layout to other aisles, sides and sections."""
+        section, aisle, side = self.section_var.get(), self.aisle_var.get(), self.side_var.get()
+        if not section or not aisle or not side:
+            self.view.show_message("Warning", "Please select a Section, Aisle and Side to copy.")
+            return
+        from .replicate_dialog import ReplicateDialog
+        ReplicateDialog(self.tab, self.controller, section, aisle, side)
+
+    def create_locate_panel(self):
+        """Create the Locate panel listing where a family/category is placed."""
+        locate_frame = ttk.Frame(self.canvas_frame, style=CUSTOM_FRAME_STYLE)
+        locate_frame.pack(side="right", fill="y", padx=(10, 0))
+        
+        ttk.Label(locate_frame, text="Locate", font=LARGE_FONT).pack(anchor="w")
+        self.locate_family_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(locate_frame, text="Whole family", variable=self.locate_family_var).pack(anchor="w", pady=2)
+        ttk.Button(locate_frame, text="Locate", command=self.controller.locate_category, style=BUTTON_STYLE).pack(fill="x", pady=5)
+        
+        tree_frame = ttk.Frame(locate_frame, style=CUSTOM_FRAME_STYLE)
+        tree_frame.pack(fill="both", expand=True)
+        self.locate_tree = ttk.Treeview(tree_frame, show="tree", selectmode="browse", style=TREEVIEW_STYLE)
+        self.locate_tree.column("#0", width=220)
+        yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.locate_tree.yview)
+        self.locate_tree.configure(yscrollcommand=yscroll.set)
+        self.locate_tree.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+        self.locate_tree.bind("<<TreeviewSelect>>", self.on_locate_selected)
+        print("Added Locate panel to Shelf View tab")
+
+    def show_locate_results(self, hits):
+        """Fill the Locate panel with hits grouped by (section, aisle, side)."""
+        self.locate_tree.delete(*self.locate_tree.get_children())
+        self.locate_hits = {}
+        if not hits:
+            self.locate_tree.insert("", "end", text="No shelves found")
+            return
+        groups = {}
+        for section, aisle, side, level, shelf in hits:
+            groups.setdefault((section, aisle, side), []).append((level, shelf))
+        for (section, aisle, side), cells in groups.items():
+            parent = self.locate_tree.insert("", "end", text=f"Section {section} / Aisle {aisle} / Side {side} ({len(cells)})", open=False)
+            self.locate_hits[parent] = (section, aisle, side, cells)
+            for level, shelf in cells:
+                family, category = self.controller.model.location_keys.get((section, aisle, side, level, shelf), ("", ""))
+                child = self.locate_tree.insert(parent, "end", text=f"L{level} S{shelf}: {category or family}")
+                self.locate_hits[child] = (section, aisle, side, cells)
+        print(f"Locate panel shows {len(hits)} shelves in {len(groups)} sides")
+
+    def on_locate_selected(self, event):
+        """Jump to the side of the selected Locate hit."""
+        selection = self.locate_tree.selection()
+        if not selection or selection[0] not in self.locate_hits:
+            return
+        section, aisle, side, cells = self.locate_hits[selection[0]]
+        self.controller.jump_to_location(section, aisle, side, cells)
+
+    def set_location(self, section, aisle, side):
+        """Set the Section, Aisle and Side dropdowns without resetting aisle and side."""
+        self.section_var.set(section)
+        self.load_section_options(section)
+        self.aisle_var.set(aisle)
+        self.side_var.set(side)
+
+    def load_section_options(self, selected_section):
+        """Fill the Aisle and Side dropdown values for the given section."""
+        if selected_section and selected_section in self.shelf_structure:
+            config = self.shelf_structure[selected_section]
+            self.aisles = list(range(1, config["aisles"] + 1))
+            self.sides = list(range(1, config["sides"] + 1))
+            self.aisle_dropdown['values'] = self.aisles
+            self.side_dropdown['values'] = self.sides
+            print(f"Updated Aisle and Side dropdowns for Section '{selected_section}': {self.aisles}, {self.sides}")
 
     def initialize_dropdowns(self):
         """Initialize dropdown values after the UI is fully ready."""
@@ -138,17 +250,9 @@ class ShelfTab:
         """Update the Aisle and Side dropdowns based on the selected section."""
         selected_section = self.section_var.get()
         if selected_section and selected_section in self.shelf_structure:
-            config = self.shelf_structure[selected_section]
-            self.aisles = list(range(1, config["aisles"] + 1))
-            self.sides = list(range(1, config["sides"] + 1))
-            
-            self.aisle_dropdown['values'] = self.aisles
+            self.load_section_options(selected_section)
             self.aisle_var.set(self.aisles[0] if self.aisles else "")
-            print(f"Updated Aisle dropdown for Section '{selected_section}': {self.aisles}")
-            
-            self.side_dropdown['values'] = self.sides
             self.side_var.set(self.sides[0] if self.sides else "")
-            print(f"Updated Side dropdown for Section '{selected_section}': {self.sides}")
         
         self.controller.on_section_changed(event)
 
@@ -160,8 +264,23 @@ class ShelfTab:
         """Handle Side dropdown change."""
         self.controller.on_side_changed(event)
 
+    def current_category_typeahead(self):
+        """Return the typeahead index for the categories of the committed family."""
+        return self.controller.model.get_category_typeahead(self.committed_family)
+
+    def on_family_typed(self, event):
+        """Resolve typed Family text and refresh the categories if the family changed."""
+        self.controller.commit_typeahead(self.family_dropdown, self.family_var, self.controller.model.family_typeahead)
+        if self.family_var.get() != self.committed_family:
+            self.controller.on_family_changed(event)
+
+    def on_category_typed(self, event):
+        """Resolve typed Category text to a category of the committed family."""
+        self.controller.commit_typeahead(self.category_dropdown, self.category_var, self.current_category_typeahead())
+
     def update_category_dropdown(self, categories):
         """Update the Category dropdown with the given categories."""
+        self.committed_family = self.family_var.get()
         self.category_dropdown['values'] = categories
         self.category_var.set(categories[0] if categories else "")
 
@@ -195,6 +314,13 @@ class ShelfTab:
             self.view.show_message("Warning", "Please select Section, Aisle, and Side values before printing.")
             return
         
+        # Load the printing dependencies only when printing is actually used
+        try:
+            from . import printing
+        except Exception as e:
+            self.view.show_message("Error", f"Printing is unavailable: {str(e)}")
+            return
+        
         print_dialog = tk.Toplevel(self.tab)
         print_dialog.title("Print Shelf Layout")
         
@@ -216,217 +342,85 @@ class ShelfTab:
         button_width = 20
         button_spacing = 10
         
-        ttk.Button(print_dialog, text="Save as PDF", width=button_width, command=lambda: self.save_as_pdf(section, aisle, side, print_dialog), style=BUTTON_STYLE).pack(pady=button_spacing)
-        ttk.Button(print_dialog, text="Print to Printer", width=button_width, command=lambda: self.print_to_printer(section, aisle, side, print_dialog), style=BUTTON_STYLE).pack(pady=button_spacing)
+        ttk.Button(print_dialog, text="Save as PDF", width=button_width, command=lambda: printing.save_as_pdf(self, section, aisle, side, print_dialog), style=BUTTON_STYLE).pack(pady=button_spacing)
+        ttk.Button(print_dialog, text="Print to Printer", width=button_width, command=lambda: printing.print_to_printer(self, section, aisle, side, print_dialog), style=BUTTON_STYLE).pack(pady=button_spacing)
         ttk.Button(print_dialog, text="Cancel", width=button_width, command=print_dialog.destroy, style=BUTTON_STYLE).pack(pady=button_spacing)
 
-    def save_as_pdf(self, section, aisle, side, dialog):
-        """Save the shelf layout as a PDF file, including the dropdown frame and canvas."""
-        dialog.destroy()
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf")],
-            title="Save Shelf Layout as PDF"
-        )
-        if not file_path:
-            return
-        
+    def current_side(self):
+        """Return the (section, aisle, side) on screen, or None if the dropdowns are incomplete."""
         try:
-            # Ensure the window is in focus and visible for the screenshot
-            self.tab.winfo_toplevel().focus_force()
-            self.tab.winfo_toplevel().update()
-            
-            # Get the dropdown frame coordinates and dimensions
-            self.dropdown_frame.update_idletasks()
-            dropdown_x = self.dropdown_frame.winfo_rootx()
-            dropdown_y = self.dropdown_frame.winfo_rooty()
-            dropdown_width = self.dropdown_frame.winfo_width()
-            dropdown_height = self.dropdown_frame.winfo_height()
-            
-            # Get the canvas coordinates and dimensions
-            self.canvas.update_idletasks()
-            canvas_x = self.canvas.winfo_rootx()
-            canvas_y = self.canvas.winfo_rooty()
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            # Calculate the combined screenshot region (dropdown frame + canvas)
-            x = min(dropdown_x, canvas_x)
-            y = dropdown_y
-            width = max(dropdown_width, canvas_width)
-            height = dropdown_height + canvas_height + 10
-            
-            # Validate coordinates and dimensions
-            if width <= 0 or height <= 0:
-                raise ValueError("Screenshot width or height is invalid.")
-            
-            # Capture a screenshot of the combined area
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-            screenshot_path = "temp_shelf_layout.png"
-            screenshot.save(screenshot_path)
-            
-            # Verify the screenshot file exists
-            if not os.path.exists(screenshot_path):
-                raise FileNotFoundError(f"Screenshot file not created: {screenshot_path}")
-            
-            # Create a PDF using reportlab with letter size in landscape orientation
-            from reportlab.lib.pagesizes import landscape
-            pdf = SimpleDocTemplate(file_path, pagesize=landscape(letter))
-            pdf_width, pdf_height = landscape(letter)
-            
-            # Create content for the PDF
-            elements = []
-            
-            # Add header text directly in the PDF
-            margin = 0.5 * inch
-            c = reportlab_canvas.Canvas("temp_header.pdf", pagesize=landscape(letter))
-            c.setFont("Helvetica-Bold", 16)
-            c.drawCentredString(pdf_width / 2, pdf_height - 50, "Shelf Layout")
-            
-            c.setFont("Helvetica", 12)
-            c.drawCentredString(pdf_width / 2, pdf_height - 80, f"Section: {section}")
-            c.drawCentredString(pdf_width / 2, pdf_height - 100, f"Aisle: {aisle}")
-            c.drawCentredString(pdf_width / 2, pdf_height - 120, f"Side: {side}")
-            c.showPage()
-            c.save()
-            
-            # Load the shelf layout image (dropdown + canvas)
-            img = ImageReader(screenshot_path)
-            img_width = pdf_width - 2 * margin
-            img_height = (height / width) * img_width
-            if img_height > pdf_height - 2 * margin - 150:
-                img_height = pdf_height - 2 * margin - 150
-                img_width = (width / height) * img_height
-            
-            image = ReportLabImage(screenshot_path, width=img_width, height=img_height)
-            image.hAlign = 'CENTER'
-            image.vAlign = 'TOP'
-            image.spaceBefore = 150
-            elements.append(image)
-            
-            # Build the PDF
-            pdf.build(elements)
-            
-            self.view.show_message("Success", f"Shelf layout with dropdowns saved as PDF to {file_path}")
-            
-        except Exception as e:
-            self.view.show_message("Error", f"Failed to save PDF: {str(e)}")
-        
-        finally:
-            temp_files = ["temp_shelf_layout.png", "temp_header.pdf"]
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        print(f"Failed to remove temporary file {temp_file}: {str(e)}")
+            return (self.section_var.get(), int(self.aisle_var.get()), int(self.side_var.get()))
+        except (ValueError, tk.TclError):
+            return None
 
-    def print_to_printer(self, section, aisle, side, dialog):
-        """Print the shelf layout to a local printer."""
-        dialog.destroy()
-        
-        try:
-            pdf_file = "temp_shelf_layout_with_info.pdf"
-            
-            self.tab.winfo_toplevel().focus_force()
-            self.tab.winfo_toplevel().update()
-            
-            self.canvas.update_idletasks()
-            x = self.canvas.winfo_rootx()
-            y = self.canvas.winfo_rooty()
-            width = self.canvas.winfo_width()
-            height = self.canvas.winfo_height()
-            
-            if width <= 0 or height <= 0:
-                raise ValueError("Canvas width or height is invalid for screenshot.")
-            
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-            screenshot_path = "temp_shelf_layout.png"
-            screenshot.save(screenshot_path)
-            
-            if not os.path.exists(screenshot_path):
-                raise FileNotFoundError(f"Screenshot file not created: {screenshot_path}")
-            
-            from reportlab.lib.pagesizes import landscape
-            pdf = SimpleDocTemplate(pdf_file, pagesize=landscape(letter))
-            pdf_width, pdf_height = landscape(letter)
-            
-            elements = []
-            
-            margin = 0.5 * inch
-            c = reportlab_canvas.Canvas("temp_header.pdf", pagesize=landscape(letter))
-            c.setFont("Helvetica-Bold", 16)
-            c.drawCentredString(pdf_width / 2, pdf_height - 50, "Shelf Layout")
-            
-            c.setFont("Helvetica", 12)
-            c.drawCentredString(pdf_width / 2, pdf_height - 80, f"Section: {section}")
-            c.drawCentredString(pdf_width / 2, pdf_height - 100, f"Aisle: {aisle}")
-            c.drawCentredString(pdf_width / 2, pdf_height - 120, f"Side: {side}")
-            c.showPage()
-            c.save()
-            
-            img_width = pdf_width - 2 * margin
-            img_height = pdf_height - 2 * margin - 150
-            image = ReportLabImage(screenshot_path, width=img_width, height=img_height)
-            image.hAlign = 'CENTER'
-            image.vAlign = 'TOP'
-            image.spaceBefore = 150
-            elements.append(image)
-            
-            pdf.build(elements)
-            
-            system = platform.system()
-            if system == "Windows":
-                if win32api is None or win32print is None:
-                    self.view.show_message("Error", "Printing on Windows requires the pywin32 library. Please install it using 'pip install pywin32'.")
-                    os.startfile(pdf_file)
-                    self.view.show_message("Info", f"PDF opened with default application. Please print manually using your PDF reader.")
-                else:
-                    try:
-                        printer_name = win32print.GetDefaultPrinter()
-                        acrobat_path = r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe"
-                        if not os.path.exists(acrobat_path):
-                            acrobat_path = r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe"
-                        if not os.path.exists(acrobat_path):
-                            raise FileNotFoundError("Adobe Acrobat Reader not found. Please install a PDF reader and set it as the default for .pdf files.")
-                        
-                        subprocess.run([acrobat_path, "/p", "/h", pdf_file], check=True)
-                        self.view.show_message("Success", f"Shelf layout sent to printer: {printer_name}")
-                    except FileNotFoundError:
-                        os.startfile(pdf_file)
-                        self.view.show_message("Info", f"PDF opened with default application. Please print manually using your PDF reader to {printer_name}.")
-                    except Exception as e:
-                        self.view.show_message("Error", f"Failed to print: {str(e)}. Ensure a PDF reader is installed and set it as the default for .pdf files.")
-            elif system in ["Linux", "Darwin"]:
-                if not shutil.which("lp" if system == "Linux" else "lpr"):
-                    raise FileNotFoundError("Printing command 'lp' or 'lpr' not found. Please ensure printing utilities are installed.")
-                subprocess.run(["lp" if system == "Linux" else "lpr", pdf_file], check=True)
-                self.view.show_message("Success", "Shelf layout sent to default printer.")
-            else:
-                self.view.show_message("Error", f"Printing not supported on this platform: {system}")
-            
-        except Exception as e:
-            self.view.show_message("Error", f"Failed to print: {str(e)}")
-        
-        finally:
-            temp_files = ["temp_shelf_layout.png", pdf_file, "temp_header.pdf"]
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        print(f"Failed to remove temporary file {temp_file}: {str(e)}")
-
-    def draw_shelf_view(self, filtered_df, section, aisle, side):
-        """Draw the 3D shelf visualization based on the filtered data."""
+    def on_model_changed(self, event):
+        """Queue a repaint when a change event touches the side currently on screen."""
+        if isinstance(event, (DataReloaded, CatalogUpdated)):
+            self.refresh_dropdown_values()
+        if event.full_refresh or self.current_side() in event.sides():
+            self.schedule_repaint()
+
+    def bind_model(self, old_model, model):
+        """Switch the Shelf View to another store's model, resetting the dropdowns."""
+        old_model.unsubscribe(self.on_model_changed)
+        self.sections = model.get_sections()
+        self.shelf_structure = model.get_shelf_structure()
+        self.families = model.families
+        model.subscribe(self.on_model_changed)
+        
+        self.section_var.set("")
+        self.aisle_var.set("")
+        self.side_var.set("")
+        self.aisles = []
+        self.sides = []
+        self.aisle_dropdown['values'] = []
+        self.side_dropdown['values'] = []
+        self.committed_family = None
+        self.refresh_dropdown_values()
+        self.initialize_dropdowns()
+        self.show_locate_results([])
+        self.schedule_repaint()
+
+    def refresh_dropdown_values(self):
+        """Reload the Section and Family dropdown values after the structure or catalog changed."""
+        self.section_dropdown['values'] = self.sections
+        self.family_dropdown['values'] = self.families
+        if self.section_var.get() in self.shelf_structure:
+            self.load_section_options(self.section_var.get())
+        if self.family_var.get() not in self.families:
+            self.initialize_dropdowns()
+
+    def schedule_repaint(self):
+        """Redraw the shelf view once on the next idle cycle, however many changes arrive before it."""
+        if self.repaint_pending is None:
+            self.repaint_pending = self.canvas.after_idle(self._repaint)
+
+    def _repaint(self):
+        self.repaint_pending = None
+        self.controller.update_shelf_view()
+
+    def layout_params(self):
+        """Return the (canvas_width, canvas_height, scale_factor, aspect_ratio) of an unzoomed side, or None before the first draw."""
+        if self.initial_aspect_ratio is None:
+            return None
+        return self.canvas.winfo_width(), self.canvas.winfo_height(), self.scale_factor, self.initial_aspect_ratio
+
+    def draw_shelf_view(self, filtered_df, section, aisle, side, prepared=None):
+        """Draw the 3D shelf visualization based on the filtered data.
+
+        `prepared` is the side's SideData when the caller has it cached; the
+        display list itself is memoized by display_list.layout_side.
+        """
         self.canvas.delete("all")
         self.front_face_ids.clear()
+        self.compare_cells = {}
+        self.compare_tip_cell = None
         
         self.update_dropdown_sizes()
         
         if not section or not aisle or not side or filtered_df is None:
             print("Section, Aisle, or Side is empty or no data; displaying reminder message")
+            self.last_side_data = None
             self.canvas.update_idletasks()
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
@@ -441,284 +435,172 @@ class ShelfTab:
             )
             return
         
-        max_level = filtered_df['Level'].max()
-        max_shelf = filtered_df['Shelf'].max()
-        
-        self.max_level = int(max_level)
-        self.max_shelf = int(max_shelf)
+        if (section, aisle, side) != self.view_side:
+            # A different side starts fully zoomed out
+            self.view_side = (section, aisle, side)
+            self.zoom = 1.0
+            self.pan_x = self.pan_y = 0.0
+        self.last_filtered_df = filtered_df
+        side_data = prepared if prepared is not None else SideData(filtered_df)
+        self.last_side_data = side_data
+        self.max_level = side_data.max_level
+        self.max_shelf = side_data.max_shelf
         print(f"Max Level: {self.max_level}, Max Shelf: {self.max_shelf}")
         
-        canvas_width_base = 1000
-        canvas_height_base = 600
-        cell_width_base = canvas_width_base // self.max_shelf
-        cell_height_base = canvas_height_base // self.max_level
-        self.cell_width_base = min(cell_width_base, 60)
-        self.cell_height_base = min(cell_height_base, 80)
-        
         if self.initial_aspect_ratio is None:
-            self.initial_cell_width = self.cell_width_base
-            self.initial_cell_height = self.cell_height_base
+            self.initial_cell_width, self.initial_cell_height = base_cell_size(self.max_level, self.max_shelf)
             self.initial_aspect_ratio = self.initial_cell_width / self.initial_cell_height
             print(f"Initial aspect ratio: {self.initial_aspect_ratio}")
         
-        self.cell_width = self.cell_width_base * self.scale_factor
-        self.cell_height = self.cell_height_base * self.scale_factor
-        
-        current_aspect_ratio = self.cell_width / self.cell_height
-        if abs(current_aspect_ratio - self.initial_aspect_ratio) > 0.01:
-            self.cell_height = self.cell_width / self.initial_aspect_ratio
-            print(f"Adjusted cell height to maintain aspect ratio: cell_width={self.cell_width}, cell_height={self.cell_height}")
-        
-        self.depth = 10 * self.scale_factor
-        label_font_size = int(LABEL_FONT_BASE * self.scale_factor)
-        self.label_font = ('Helvetica', max(label_font_size, 6))
-        print(f"Scaled sizes: cell_width={self.cell_width}, cell_height={self.cell_height}, depth={self.depth}, label_font_size={label_font_size}")
-        
-        label_space_left = 50 * self.scale_factor
-        label_space_top = 30 * self.scale_factor
-        total_width = self.max_shelf * self.cell_width + self.depth + label_space_left
-        total_height = self.max_level * self.cell_height + self.depth + label_space_top
-        
         self.canvas.update_idletasks()
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        offset_x = (canvas_width - total_width) // 2 + label_space_left
-        offset_y = (canvas_height - total_height) // 2 + label_space_top
-        print(f"Centering shelf grid: offset_x={offset_x}, offset_y={offset_y}")
-        
-        for shelf in range(1, self.max_shelf + 1):
-            label_x = (shelf - 1) * self.cell_width + offset_x + self.cell_width / 2
-            label_y = offset_y - self.depth - 10 * self.scale_factor
-            self.canvas.create_text(
-                label_x, label_y,
-                text=f"S{shelf}",
-                font=self.label_font,
-                fill="black",
-                anchor="center"
-            )
-        
-        for level in range(1, self.max_level + 1):
-            display_row = self.max_level - level
-            label_y = display_row * self.cell_height + offset_y + self.cell_height / 2
-            label_x = offset_x - self.depth - 30 * self.scale_factor
-            self.canvas.create_text(
-                label_x, label_y,
-                text=f"L{level}",
-                font=self.label_font,
-                fill="black",
-                anchor="center"
-            )
-        
-        self.cell_coords = {}
-        for level in range(1, self.max_level + 1):
-            display_row = self.max_level - level
-            for shelf in range(1, self.max_shelf + 1):
-                x1 = (shelf - 1) * self.cell_width + offset_x
-                y1 = display_row * self.cell_height + offset_y
-                x2 = x1 + self.cell_width
-                y2 = y1 + self.cell_height
-                
-                x1_3d = x1 + self.depth
-                y1_3d = y1
-                x2_3d = x2 + self.depth
-                y2_3d = y2
-                
-                front_face_tag = f"front_face_{level}_{shelf}"
-                front_face_id = self.canvas.create_polygon(
-                    x1_3d, y1_3d,
-                    x2_3d, y1_3d,
-                    x2, y2,
-                    x1, y2,
-                    fill=SHELF_FRONT_COLOR, outline="black",
-                    tags=front_face_tag
-                )
-                self.front_face_ids[(level, shelf)] = front_face_id
-                
-                self.canvas.create_polygon(
-                    x1_3d, y1_3d,
-                    x2_3d, y1_3d,
-                    x2_3d - self.depth, y1_3d - self.depth,
-                    x1_3d - self.depth, y1_3d - self.depth,
-                    fill=SHELF_TOP_COLOR, outline="black"
-                )
-                
-                self.canvas.create_polygon(
-                    x2_3d, y1_3d,
-                    x2_3d - self.depth, y1_3d - self.depth,
-                    x2 - self.depth, y2 - self.depth,
-                    x2, y2,
-                    fill=SHELF_RIGHT_COLOR, outline="black"
-                )
-                
-                self.cell_coords[(level, shelf)] = (x1, y1, x2, y2)
-        
-        if not section or not aisle or not side:
-            print("Skipping category information drawing due to empty dropdown values")
-            print(f"Drew 3D shelf grid with {self.max_level} levels and {self.max_shelf} shelves")
+        with tracer.span("layout_side"):
+            display_list = side_data.layout(self.canvas.winfo_width(), self.canvas.winfo_height(),
+                                            self.scale_factor * self.zoom, self.initial_aspect_ratio, self.pan_x, self.pan_y)
+        # The display list is unpanned; its items are moved by the pan once drawn
+        self.viewport = offset_rect(display_list.viewport, self.pan_x, self.pan_y)
+        self.cell_width = display_list.cell_width
+        self.cell_height = display_list.cell_height
+        self.depth = display_list.depth
+        self.grid_origin = (display_list.offset_x + self.pan_x, display_list.offset_y + self.pan_y)
+        self.visible_coords = offset_cells(display_list.visible_cells, self.pan_x, self.pan_y)
+        
+        with tracer.span("render_tk", items=len(display_list.items)):
+            self.front_face_ids = render_tk(display_list, self.canvas, self.controller.model.color_map.colors, SHELF_CONTENT_TAG)
+            if self.pan_x or self.pan_y:
+                self.canvas.move(SHELF_CONTENT_TAG, self.pan_x, self.pan_y)
+        with tracer.span("draw_compare_overlay"):
+            self.draw_compare_overlay(section, aisle, side)
+        print(f"Drew 3D shelf grid with {self.max_level} levels and {self.max_shelf} shelves ({len(self.visible_coords)} in view)")
+
+    def whole_side_display_list(self):
+        """Return the unzoomed display list of the side on screen, as shared with export and printing, or None."""
+        if self.last_side_data is None or self.initial_aspect_ratio is None:
+            return None
+        return self.last_side_data.layout(*self.layout_params())
+
+    def draw_compare_overlay(self, section, aisle, side):
+        """Outline shelves that differ from the compared file or have merge conflicts, colored by change type."""
+        self.compare_cells = self.controller.get_side_changes(section, aisle, side)
+        for (level, shelf), (change, old_text, new_text) in self.compare_cells.items():
+            coords = self.visible_coords.get((level, shelf))
+            if coords is None:
+                continue
+            self.canvas.create_rectangle(*coords, outline=COMPARE_COLORS[change], width=3, tags=("compare_overlay", SHELF_CONTENT_TAG))
+
+    def on_canvas_motion(self, event):
+        """Show the compared file's value for the shelf under the mouse."""
+        if not self.compare_cells:
             return
-        
-        family_category_counts = filtered_df.groupby('Family')['Category'].nunique()
-        max_categories = family_category_counts.max() if not family_category_counts.empty else 0
-        print(f"Maximum number of categories in any family in current view: {max_categories}")
-        
-        for family in family_category_counts.index:
-            if family not in self.view.family_color_usage:
-                self.view.family_color_usage[family] = set()
-            
-            categories_in_family = sorted(filtered_df[filtered_df['Family'] == family]['Category'].dropna().unique())
-            for category in categories_in_family:
-                key = f"{family}|{category}"
-                if key in self.view.category_colors:
-                    continue
-                
-                used_colors = self.view.family_color_usage[family]
-                available_color_indices = [i for i in range(len(self.view.available_colors)) if i not in used_colors]
-                if not available_color_indices:
-                    color_idx = len(used_colors) % len(self.view.available_colors)
-                else:
-                    color_idx = available_color_indices[0]
-                
-                self.view.category_colors[key] = self.view.available_colors[color_idx]
-                self.view.family_color_usage[family].add(color_idx)
-        
-        print(f"Updated category color mapping: {self.view.category_colors}")
-        
-        for level in range(1, self.max_level + 1):
-            display_row = self.max_level - level
-            for shelf in range(1, self.max_shelf + 1):
-                x1 = (shelf - 1) * self.cell_width + offset_x
-                y1 = display_row * self.cell_height + offset_y
-                x2 = x1 + self.cell_width
-                y2 = y1 + self.cell_height
-                
-                x1_3d = x1 + self.depth
-                y1_3d = y1
-                x2_3d = x2 + self.depth
-                y2_3d = y2
-                
-                mask = (
-                    (filtered_df['Level'] == level) &
-                    (filtered_df['Shelf'] == shelf)
-                )
-                row = filtered_df[mask]
-                if not row.empty:
-                    category = str(row.iloc[0]['Category'])
-                    family = str(row.iloc[0]['Family'])
-                    if pd.isna(category) or category == "" or category == "nan":
-                        continue
-                    
-                    key = f"{family}|{category}"
-                    colors = self.view.category_colors.get(key, {
-                        'front': "gray",
-                        'top': "lightgray",
-                        'right':  "darkgray"
-                    })
-                    bar_color_front = colors['front']
-                    bar_color_top = colors['top']
-                    bar_color_right = colors['right']
-                    
-                    bar_width = self.cell_width
-                    bar_height = self.cell_height * 0.4
-                    bar_x1 = x1_3d
-                    bar_x2 = x2_3d
-                    bar_y1 = (y1_3d + y2_3d) / 2 - bar_height / 2
-                    bar_y2 = bar_y1 + bar_height
-                    
-                    print(f"Drawing 3D horizontal bar for L{level} S{shelf} (Family: {family}, Category: {category}): x1={bar_x1}, x2={bar_x2}, y1={bar_y1}, y2={bar_y2}, front_color={bar_color_front}")
-                    self.canvas.create_polygon(
-                        bar_x1, bar_y1,
-                        bar_x2, bar_y1,
-                        bar_x2, bar_y2,
-                        bar_x1, bar_y2,
-                        fill=bar_color_front, outline=""
-                    )
-                    self.canvas.create_polygon(
-                        bar_x1, bar_y1,
-                        bar_x2, bar_y1,
-                        bar_x2 - self.depth, bar_y1 - self.depth,
-                        bar_x1 - self.depth, bar_y1 - self.depth,
-                        fill=bar_color_top, outline=""
-                    )
-                    self.canvas.create_polygon(
-                        bar_x2, bar_y1,
-                        bar_x2 - self.depth, bar_y1 - self.depth,
-                        bar_x2 - self.depth, bar_y2 - self.depth,
-                        bar_x2, bar_y2,
-                        fill=bar_color_right, outline=""
-                    )
-                    
-                    max_width = self.cell_width - 20
-                    max_height = self.cell_height - 20
-                    
-                    font_size = int(self.cell_width / 15)
-                    font_size = max(font_size, 6)
-                    
-                    words = category.split()
-                    lines = []
-                    
-                    while font_size > 6:
-                        avg_char_width = font_size * 0.7
-                        max_chars_per_line = int(max_width / avg_char_width)
-                        print(f"Trying font size {font_size}, max_chars_per_line={max_chars_per_line} for category '{category}'")
-                        
-                        lines = []
-                        current_line = []
-                        current_char_count = 0
-                        
-                        for word in words:
-                            word_length = len(word)
-                            space_needed = 1 if current_line else 0
-                            if current_char_count + word_length + space_needed <= max_chars_per_line:
-                                current_line.append(word)
-                                current_char_count += word_length + space_needed
-                            else:
-                                if current_line:
-                                    lines.append(" ".join(current_line))
-                                current_line = [word]
-                                current_char_count = word_length
-                        if current_line:
-                            lines.append(" ".join(current_line))
-                        
-                        num_lines = len(lines)
-                        line_spacing = font_size * 1.1
-                        total_text_height = num_lines * line_spacing
-                        
-                        fits_width = all(len(line) * avg_char_width <= max_width for line in lines)
-                        fits_height = total_text_height <= max_height
-                        print(f"Font size {font_size}: num_lines={num_lines}, total_text_height={total_text_height}, fits_width={fits_width}, fits_height={fits_height}")
-                        
-                        if fits_width and fits_height:
-                            break
-                        font_size -= 1
-                    
-                    original_font_size = font_size
-                    font_size = int(font_size * 0.7)
-                    font_size = max(font_size, 6)
-                    print(f"Reduced font size by 30%: from {original_font_size} to {font_size} for category '{category}'")
-                    
-                    line_spacing = font_size * 1.1
-                    total_text_height = num_lines * line_spacing
-                    
-                    self.shelf_text_font = ('Helvetica', font_size, 'bold')
-                    print(f"Final font size {font_size} for category '{category}' on shelf L{level} S{shelf}, lines={num_lines}")
-                    
-                    start_y = (y1 + y2) / 2 - total_text_height / 2 + line_spacing / 2
-                    
-                    for idx, line in enumerate(lines):
-                        text_x = (x1 + x2) / 2 + self.depth / 2
-                        text_y = start_y + idx * line_spacing
-                        self.canvas.create_text(
-                            text_x, text_y,
-                            text=line,
-                            font=self.shelf_text_font,
-                            fill="black",
-                            anchor="center"
-                        )
-        print(f"Drew 3D shelf grid with {self.max_level} levels and {self.max_shelf} shelves")
+        for cell, (change, old_text, new_text) in self.compare_cells.items():
+            coords = self.visible_coords.get(cell)  # Any cell under the pointer is materialized
+            if coords and coords[0] <= event.x <= coords[2] and coords[1] <= event.y <= coords[3]:
+                if cell != self.compare_tip_cell:
+                    if change == "conflict":
+                        text = f"conflict: yours {old_text or '(empty)'}, theirs {new_text or '(empty)'}"
+                    else:
+                        text = f"{change}: was {old_text or '(empty)'}, now {new_text or '(empty)'}"
+                    self.show_compare_tip(cell, event.x, event.y, text)
+                return
+        self.hide_compare_tip()
+
+    def show_compare_tip(self, cell, x, y, text):
+        self.hide_compare_tip()
+        self.compare_tip_cell = cell
+        text_id = self.canvas.create_text(x + 12, y + 12, text=text, anchor="nw", font=('Helvetica', 10), tags="compare_tip")
+        self.canvas.create_rectangle(*self.canvas.bbox(text_id), fill="#FFFFE0", outline="black", tags="compare_tip")
+        self.canvas.tag_raise(text_id)
+
+    def hide_compare_tip(self):
+        self.canvas.delete("compare_tip")
+        self.compare_tip_cell = None
+
+    def draw_performance_hud(self, frame_ms):
+        """Overlay the last frame time and live canvas item count in the canvas corner."""
+        self.canvas.delete("perf_hud")
+        if not self.show_performance_hud:
+            return
+        item_count = len(self.canvas.find_all())
+        self.canvas.create_text(
+            8, 8,
+            text=f"frame {frame_ms:.1f} ms | items {item_count}",
+            font=('Courier', 10, 'bold'),
+            fill="#b00000",
+            anchor="nw",
+            tags="perf_hud"
+        )
 
     def get_selection_coords(self):
-        """Return the coordinates of the shelves for selection."""
-        return self.cell_coords
+        """Return the coordinates of the shelves drawn on the canvas, which are the ones a drag can select."""
+        return self.visible_coords
+
+    def zoom_at(self, x, y, factor):
+        """Zoom the grid by a factor, keeping the point under the pointer fixed."""
+        if self.last_filtered_df is None:
+            return
+        zoom = min(max(self.zoom * factor, SHELF_ZOOM_MIN), SHELF_ZOOM_MAX)
+        if zoom == self.zoom:
+            return
+        origin_x, origin_y = self.grid_origin
+        grid_x = (x - origin_x) / self.cell_width
+        grid_y = (y - origin_y) / self.cell_height
+        self.zoom = zoom
+        if zoom == SHELF_ZOOM_MIN:
+            self.pan_x = self.pan_y = 0.0
+        else:
+            # Pan so that the grid position under the pointer stays under it at the new zoom
+            cell_width, cell_height, _, new_origin_x, new_origin_y = grid_frame(
+                self.max_level, self.max_shelf, self.canvas.winfo_width(), self.canvas.winfo_height(),
+                self.scale_factor * self.zoom, self.initial_aspect_ratio
+            )
+            self.pan_x = x - grid_x * cell_width - new_origin_x
+            self.pan_y = y - grid_y * cell_height - new_origin_y
+        print(f"Zoom {self.zoom:.2f}x, pan ({self.pan_x:.0f}, {self.pan_y:.0f})")
+        self.redraw_viewport()
+
+    def reset_zoom(self):
+        self.zoom = 1.0
+        self.pan_x = self.pan_y = 0.0
+        self.redraw_viewport()
+
+    def start_pan(self, event):
+        self.pan_start = (event.x, event.y)
+
+    def drag_pan(self, event):
+        if self.pan_start is None:
+            return
+        dx, dy = event.x - self.pan_start[0], event.y - self.pan_start[1]
+        self.pan_start = (event.x, event.y)
+        self.pan_by(dx, dy)
+
+    def pan_by(self, dx, dy):
+        """Move the drawn shelf items at once, then draw cells that came into view after panning pauses.
+
+        Only SHELF_CONTENT_TAG items move; the performance HUD and other screen overlays stay put.
+        """
+        if self.last_filtered_df is None or (dx == 0 and dy == 0):
+            return
+        self.pan_x += dx
+        self.pan_y += dy
+        self.canvas.move(SHELF_CONTENT_TAG, dx, dy)
+        self.visible_coords = offset_cells(self.visible_coords, dx, dy)
+        self.viewport = offset_rect(self.viewport, dx, dy)
+        self.grid_origin = (self.grid_origin[0] + dx, self.grid_origin[1] + dy)
+        self.hide_compare_tip()
+        if self.pan_redraw_pending is not None:
+            self.canvas.after_cancel(self.pan_redraw_pending)
+        self.pan_redraw_pending = self.canvas.after(PAN_REDRAW_MS, self.redraw_viewport)
+
+    def redraw_viewport(self):
+        """Redraw the side on screen at the current zoom and pan without refetching it from the model."""
+        self.pan_redraw_pending = None
+        if self.last_filtered_df is None or self.view_side is None:
+            return
+        start = time.perf_counter()
+        with tracer.span("redraw_viewport", zoom=self.zoom):
+            self.draw_shelf_view(self.last_filtered_df, *self.view_side, self.last_side_data)
+            for level, shelf in self.controller.selected_cells:
+                self.highlight_shelf(level, shelf, "lightblue")
+        self.draw_performance_hud((time.perf_counter() - start) * 1000)
 
     def highlight_shelf(self, level, shelf, color):
         """Highlight the front face of a shelf with the given color."""
@@ -9,6 +9,9 @@ class TableTab:
         self.view = view
         self.tree = None
         self.dropdown = None
+        self.pending_rows = set()  # DataFrame rows changed since the last flush
+        self.pending_full_refresh = False
+        self.flush_pending = None  # after_idle id of a queued flush
 
     def create(self):
         """Create the table view tab with a Treeview for data editing."""
@@ -47,6 +50,8 @@ class TableTab:
         save_button = ttk.Button(frame, text="Save", command=self.controller.save_data, style=BUTTON_STYLE)
         save_button.grid(row=2, column=0, pady=10, columnspan=2)
         print("Added Save button to Table View tab")
+        
+        self.controller.model.subscribe(self.on_model_changed)
 
     def update_treeview(self):
         """Update the Treeview with the latest data."""
@@ -64,4 +69,38 @@ class TableTab:
     def update_treeview_row(self, row_id, values):
         """Update a specific row in the Treeview."""
         print(f"Updating Treeview row {row_id} with values: {values}")
-        self.tree.item(row_id, values=values)
\ No newline at end of file
+        self.tree.item(row_id, values=values)
+
+    def bind_model(self, old_model, model):
+        """Switch the Table View to another store's model."""
+        old_model.unsubscribe(self.on_model_changed)
+        model.subscribe(self.on_model_changed)
+        if self.dropdown is not None:
+            self.dropdown.destroy()
+            self.dropdown = None
+        self.pending_rows.clear()
+        self.pending_full_refresh = False
+        self.update_treeview()
+
+    def on_model_changed(self, event):
+        """Collect changed rows and flush them to the Treeview once per idle cycle."""
+        if event.full_refresh:
+            self.pending_full_refresh = True
+        else:
+            self.pending_rows.update(event.rows)
+        if self.flush_pending is None:
+            self.flush_pending = self.tree.after_idle(self.flush_changes)
+
+    def flush_changes(self):
+        """Apply the coalesced model changes to the Treeview."""
+        self.flush_pending = None
+        if self.pending_full_refresh:
+            self.update_treeview()
+        else:
+            df = self.controller.get_data()
+            for row in self.pending_rows:
+                if self.tree.exists(str(row)):
+                    self.update_treeview_row(str(row), list(df.loc[row]))
+        print(f"Flushed {len(self.pending_rows)} changed rows (full refresh: {self.pending_full_refresh})")
+        self.pending_rows.clear()
+        self.pending_full_refresh = False
\ No newline at end of file
@@ -0,0 +1,82 @@
+import tkinter as tk
+from tkinter import ttk
+from constants import LARGE_FONT, BUTTON_STYLE, CUSTOM_FRAME_STYLE, TREEVIEW_STYLE
+from validation import summarize_issues, issue_counts
+
+MAX_LISTED_CELLS = 200  # Shelves listed under each side; the side row still shows the full count
+
+
+class ValidationDialog:
+    """Dialog listing catalog issues grouped by section/aisle/side, with bulk fixes."""
+
+    def __init__(self, parent, controller):
+        self.controller = controller
+        self.sides = {}  # Maps tree item id to (section, aisle, side, cells)
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Catalog Validation")
+        self.window.transient(parent)
+        frame = ttk.Frame(self.window, style=CUSTOM_FRAME_STYLE, padding=10)
+        frame.pack(fill="both", expand=True)
+
+        self.summary_label = ttk.Label(frame, font=LARGE_FONT)
+        self.summary_label.pack(anchor="w", pady=(0, 10))
+        self.include_incomplete_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Include shelves with a family but no category yet", variable=self.include_incomplete_var,
+                        command=self.refresh).pack(anchor="w", pady=(0, 10))
+
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("value", "issue", "fix"), style=TREEVIEW_STYLE)
+        self.tree.heading("#0", text="Location")
+        self.tree.heading("value", text="Family / Category")
+        self.tree.heading("issue", text="Issue")
+        self.tree.heading("fix", text="Suggested Fix")
+        self.tree.column("#0", width=220)
+        yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=yscroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        yscroll.pack(side="right", fill="y")
+        self.tree.bind("<Double-1>", self.on_double_click)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="Apply Suggested Fixes", command=lambda: self.apply_fixes("suggested"), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Clear Invalid Values", command=lambda: self.apply_fixes("clear"), style=BUTTON_STYLE).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy, style=BUTTON_STYLE).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def refresh(self):
+        """Re-run validation and list the issues."""
+        issues = self.controller.model.validate(self.include_incomplete_var.get())
+        self.tree.delete(*self.tree.get_children())
+        self.sides.clear()
+        if issues is None or issues.empty:
+            self.summary_label.config(text="No catalog issues found.")
+            return
+        self.summary_label.config(text=f"{len(issues)} issues: {issue_counts(issues)}")
+
+        groups = dict(tuple(issues.groupby(['Section', 'Aisle', 'Side'], sort=False)))
+        for summary in summarize_issues(issues).itertuples(index=False):
+            key = (summary.Section, summary.Aisle, summary.Side)
+            cells = groups[key]
+            parent = self.tree.insert("", "end", text=f"Section {key[0]} / Aisle {key[1]} / Side {key[2]}",
+                                      values=("", f"{summary.total} issues", ""), open=False)
+            self.sides[parent] = key + (list(zip(cells['Level'], cells['Shelf'])),)
+            for cell in cells.head(MAX_LISTED_CELLS).itertuples(index=False):
+                fix = f"{cell.fix_family} / {cell.fix_category}" if cell.fix_family else ""
+                child = self.tree.insert(parent, "end", text=f"L{cell.Level} S{cell.Shelf}",
+                                         values=(f"{cell.Family} / {cell.Category}", cell.issue, fix))
+                self.sides[child] = key + ([(cell.Level, cell.Shelf)],)
+
+    def on_double_click(self, event):
+        """Show the side of the double-clicked row in the Shelf View with its problem shelves highlighted."""
+        item = self.tree.focus()
+        if item in self.sides:
+            section, aisle, side, cells = self.sides[item]
+            self.controller.jump_to_location(section, int(aisle), int(side), [(int(level), int(shelf)) for level, shelf in cells])
+
+    def apply_fixes(self, mode):
+        self.controller.apply_validation_fixes(mode, self.include_incomplete_var.get())
+        self.refresh()
@@ -5,6 +5,7 @@ from .menu_bar import create_menu_bar
 from .logo_display import create_logo
 from .table_tab import TableTab
 from .shelf_tab import ShelfTab
+from .overview_tab import OverviewTab
 from .styles import apply_styles
 from constants import LARGE_FONT
 
@@ -29,41 +30,19 @@ class ShelfView:
         position_y = (screen_height - window_height) // 2
         self.root.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
         
-        # Maximize the window on start
-        self.root.state('zoomed')
+        # Maximize the window on start ('zoomed' is Windows/macOS only; X11 uses the -zoomed attribute)
+        try:
+            self.root.state('zoomed')
+        except tk.TclError:
+            self.root.attributes('-zoomed', True)
         
         # Initialize attributes
         self.table_tab_component = None
         self.shelf_tab = None
+        self.overview_tab = None
         self.notebook = None
         self.style = None
         
-        # Persistent color mapping for categories within families
-        self.category_colors = {}
-        self.family_color_usage = {}
-        self.available_colors = [
-            {'front': "#87CEEB", 'top': "#B0E0E6", 'right': "#5F9EA0"},
-            {'front': "#90EE90", 'top': "#ADFF2F", 'right': "#7FFF00"},
-            {'front': "#F08080", 'top': "#FF4040", 'right': "#CD5C5C"},
-            {'front': "#FFFF99", 'top': "#FFFFCC", 'right': "#EEE8AA"},
-            {'front': "#FFB6C1", 'top': "#FFC1CC", 'right': "#FF9999"},
-            {'front': "#E0FFFF", 'top': "#EFFFFF", 'right': "#B0E0E6"},
-            {'front': "#FFA07A", 'top': "#FFBB99", 'right': "#FF8C69"},
-            {'front': "#D3D3D3", 'top': "#E6E6E6", 'right': "#C0C0C0"},
-            {'front': "#98FB98", 'top': "#BFFFBA", 'right': "#90EE90"},
-            {'front': "#FFDAB9", 'top': "#FFE4C4", 'right': "#FFCC99"},
-            {'front': "#FFECB3", 'top': "#FFF9C4", 'right': "#FFD54F"},
-            {'front': "#B0C4DE", 'top': "#C6D9F1", 'right': "#9AC0CD"},
-            {'front': "#F0E68C", 'top': "#FFFACD", 'right': "#EEE8AA"},
-            {'front': "#FFE4E1", 'top': "#FFE4E4", 'right': "#FFB6C1"},
-            {'front': "#E6E6FA", 'top': "#F0F0FF", 'right': "#D8BFD8"},
-            {'front': "#FFDEAD", 'top': "#FFEFD5", 'right': "#FFCE96"},
-            {'front': "#DDA0DD", 'top': "#E6B0E6", 'right': "#DA70D6"},
-            {'front': "#F5F5DC", 'top': "#FFFFE4", 'right': "#F0EAD6"},
-            {'front': "#AFEEEE", 'top': "#C1F0F0", 'right': "#96CDCD"},
-            {'front': "#FFFACD", 'top': "#FFFDE7", 'right': "#FFFACD"},
-        ]
-        
         # Load the original logo image to get its aspect ratio
         try:
             logo_image = Image.open("enson_logo.jpg")
@@ -110,15 +89,19 @@ class ShelfView:
         # Create tabs with original names
         self.table_tab = ttk.Frame(self.notebook, style="Custom.TFrame")
         self.shelf_tab_frame = ttk.Frame(self.notebook, style="Custom.TFrame")
+        self.overview_tab_frame = ttk.Frame(self.notebook, style="Custom.TFrame")
         self.notebook.add(self.table_tab, text="Table View")
         self.notebook.add(self.shelf_tab_frame, text="Shelf View")
-        print("Tabs created: Table View, Shelf View")
+        self.notebook.add(self.overview_tab_frame, text="Overview")
+        print("Tabs created: Table View, Shelf View, Overview")
         
         # Initialize tab views
         self.table_tab_component = TableTab(self.table_tab, self.controller, self)
         self.shelf_tab = ShelfTab(self.shelf_tab_frame, self.controller, self)
+        self.overview_tab = OverviewTab(self.overview_tab_frame, self.controller, self)
         self.table_tab_component.create()
         self.shelf_tab.create()
+        self.overview_tab.create()
         
         # Bind tab change event after tabs are fully initialized
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
@@ -135,9 +118,14 @@ class ShelfView:
         selected_tab = self.notebook.tab(self.notebook.select(), "text")
         print(f"Tab changed to: {selected_tab}")
         if selected_tab == "Table View":
-            self.table_tab_component.update_treeview()
+            # The Treeview is kept current by model change events; only flush anything still queued
+            if self.table_tab_component.flush_pending is not None:
+                self.table_tab_component.tree.after_cancel(self.table_tab_component.flush_pending)
+                self.table_tab_component.flush_changes()
         elif selected_tab == "Shelf View":
             self.controller.update_shelf_view()
+        elif selected_tab == "Overview":
+            self.overview_tab.refresh()
 
     def on_resize(self, event):
         """Handle window resize to adjust logo size."""
@@ -174,6 +162,15 @@ class ShelfView:
         except Exception as e:
             print(f"Failed to resize logo: {str(e)}")
 
+    def set_store_status(self, status):
+        """Show the current store (or a loading notice) in the window title."""
+        self.root.title(f"Shelf Assignment Editor - {status}" if status else "Shelf Assignment Editor")
+
+    def ask_yes_no(self, title, message):
+        """Ask the user a yes/no question and return the answer."""
+        print(f"Showing question box: Title='{title}', Message='{message}'")
+        return messagebox.askyesno(title, message)
+
     def show_message(self, title, message):
         """Display a message to the user."""
         print(f"Showing message box: Title='{title}', Message='{message}'")
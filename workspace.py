@@ -0,0 +1,126 @@
+import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from constants import FAMILY_FILE, SHELF_INFO_FILE, OUTPUT_FILE, WORKSPACE_MEMORY_BUDGET_MB
+from model import ShelfModel
+
+
+def model_memory(model):
+    """Estimate the memory held by a loaded ShelfModel in bytes."""
+    if model.df is None:
+        return 0
+    # The location index holds roughly one tuple and one set entry per assigned cell
+    return int(model.df.memory_usage(deep=True).sum()) + len(model.location_keys) * 200
+
+
+class StoreWorkspace:
+    """A directory of stores, each a subdirectory holding its own data files.
+
+    Loaded ShelfModel instances are kept in an LRU cache bounded by a memory
+    budget; stores outside the cache are loaded on a background thread.
+    """
+
+    def __init__(self, root_dir, memory_budget_mb=WORKSPACE_MEMORY_BUDGET_MB):
+        self.root_dir = root_dir
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.stores = {}  # Maps store name to its ShelfModel file paths
+        self.cache = OrderedDict()  # Maps store name to loaded ShelfModel, most recently used last
+        self.current = None  # Name of the store shown in the editor; never evicted
+        self.loading = set()  # Store names with a background load in flight
+        self.loaded = queue.Queue()  # (name, model, error) results from background loads
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="StoreLoader")
+        self.discover()
+
+    def discover(self):
+        """Find every subdirectory of the workspace that contains a shelf information file."""
+        self.stores = {}
+        for name in sorted(os.listdir(self.root_dir)):
+            directory = os.path.join(self.root_dir, name)
+            paths = {
+                "family_file": os.path.join(directory, os.path.basename(FAMILY_FILE)),
+                "shelf_info_file": os.path.join(directory, os.path.basename(SHELF_INFO_FILE)),
+                "output_file": os.path.join(directory, os.path.basename(OUTPUT_FILE)),
+            }
+            if os.path.isdir(directory) and os.path.exists(paths["shelf_info_file"]) and os.path.exists(paths["family_file"]):
+                self.stores[name] = paths
+        print(f"Workspace {self.root_dir} has {len(self.stores)} stores: {list(self.stores)}")
+        return list(self.stores)
+
+    def get_store_names(self):
+        return list(self.stores)
+
+    def read_store(self, name):
+        """Build a ShelfModel for a store, generating its output file if it is missing."""
+        model = ShelfModel(**self.stores[name])
+        if model.df is None:
+            success, message = model.generate_shelf_assignment()
+            if not success:
+                raise RuntimeError(message)
+        return model
+
+    def load_store(self, name):
+        """Load a store synchronously and cache it."""
+        model = self.read_store(name)
+        self.put(name, model)
+        return model
+
+    def get_cached(self, name):
+        """Return the cached model for a store and mark it most recently used, or None."""
+        model = self.cache.get(name)
+        if model is not None:
+            self.cache.move_to_end(name)
+        return model
+
+    def put(self, name, model):
+        """Add a loaded model to the cache and evict least recently used stores over budget."""
+        self.cache[name] = model
+        self.cache.move_to_end(name)
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used models until the cache fits the memory budget.
+
+        The current store and stores with unsaved edits are never evicted.
+        """
+        total = sum(model_memory(model) for model in self.cache.values())
+        for name in list(self.cache):
+            if total <= self.memory_budget:
+                break
+            model = self.cache[name]
+            if name == self.current or model.dirty_locations:
+                continue
+            total -= model_memory(model)
+            del self.cache[name]
+            print(f"Evicted store '{name}' from the workspace cache")
+
+    def load_async(self, name):
+        """Start loading a store on the background thread; results arrive on `loaded`."""
+        if name in self.cache or name in self.loading:
+            return
+        self.loading.add(name)
+
+        def load():
+            try:
+                self.loaded.put((name, self.read_store(name), None))
+            except Exception as e:
+                self.loaded.put((name, None, e))
+
+        self.executor.submit(load)
+        print(f"Loading store '{name}' in the background")
+
+    def take_loaded(self):
+        """Return the finished background loads, caching the successful ones (call on the UI thread)."""
+        finished = []
+        while True:
+            try:
+                name, model, error = self.loaded.get_nowait()
+            except queue.Empty:
+                return finished
+            self.loading.discard(name)
+            if model is not None:
+                self.put(name, model)
+            finished.append((name, model, error))
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)